@@ -0,0 +1,47 @@
+"""
+Бенчмарк пакетных операций: поштучные update_grades/remove_student против пакетных
+
+Запуск из каталога Lab_2:
+    python -m benchmarks.bench_batch
+"""
+
+import random
+import time
+from lab import processing
+from lab.models import Student
+
+STUDENT_COUNT = 20_000
+BATCH_SIZE = 5_000
+
+def make_students():
+    
+    """Список студентов с тремя оценками у каждого"""
+    
+    return [Student(id=i, name=f"Студент {i}", grades=[50, 60, 70]) for i in range(STUDENT_COUNT)]
+
+def timed(title: str, func):
+    
+    """Выполняет func и печатает время выполнения"""
+    
+    start = time.perf_counter()
+    func()
+    print(f"{title:>28}: {time.perf_counter() - start:.3f} с")
+
+def main():
+    rng = random.Random(0)
+    ids = rng.sample(range(STUDENT_COUNT), BATCH_SIZE)
+    updates = [(student_id, [rng.randint(0, 100) for _ in range(3)]) for student_id in ids]
+    print(f"студентов: {STUDENT_COUNT}, размер пакета: {BATCH_SIZE}")
+
+    students = make_students()
+    timed("update_grades по одному", lambda: [processing.update_grades(i, g, students) for i, g in updates])
+    students = make_students()
+    timed("update_grades_bulk", lambda: processing.update_grades_bulk(students, updates))
+
+    students = make_students()
+    timed("remove_student по одному", lambda: [processing.remove_student(students, i) for i in ids])
+    students = make_students()
+    timed("remove_students", lambda: processing.remove_students(students, ids))
+
+if __name__ == "__main__":
+    main()
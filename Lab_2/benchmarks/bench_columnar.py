@@ -0,0 +1,45 @@
+"""
+Бенчмарк колоночного представления: агрегаты по 10 млн оценок
+
+Запуск из каталога Lab_2 (нужен numpy):
+    python -m benchmarks.bench_columnar
+"""
+
+import time
+import numpy as np
+from lab.columnar import ColumnarRoster
+
+STUDENT_COUNT = 1_000_000
+GRADES_PER_STUDENT = 10
+
+def timed(title: str, func, make_roster):
+    
+    """
+    Выполняет func над новым представлением и печатает время выполнения
+    Представление создается до замера и для каждой операции заново, чтобы кэш
+    средних баллов от предыдущей операции не занижал время следующей
+    """
+    
+    columnar = make_roster()
+    start = time.perf_counter()
+    func(columnar)
+    print(f"{title:>20}: {time.perf_counter() - start:.3f} с")
+
+def main():
+    rng = np.random.default_rng(0)
+    ids = np.arange(STUDENT_COUNT, dtype=np.int64)
+    names = np.array([f"Студент {i}" for i in range(STUDENT_COUNT)], dtype=object)
+    offsets = np.arange(0, (STUDENT_COUNT + 1) * GRADES_PER_STUDENT, GRADES_PER_STUDENT, dtype=np.int64)
+    grades = rng.integers(0, 101, size=STUDENT_COUNT * GRADES_PER_STUDENT, dtype=np.uint8)
+
+    def make_roster():
+        return ColumnarRoster(ids, names, offsets, grades)
+
+    print(f"студентов: {STUDENT_COUNT}, оценок: {len(grades)}")
+    timed("средние баллы", lambda columnar: columnar.averages(), make_roster)
+    timed("полная статистика", lambda columnar: columnar.get_full_statistics(), make_roster)
+    timed("топ-100", lambda columnar: columnar.top_order(100), make_roster)
+    timed("сортировка по id", lambda columnar: columnar.sort_order('id'), make_roster)
+
+if __name__ == "__main__":
+    main()
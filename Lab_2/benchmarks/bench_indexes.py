@@ -0,0 +1,45 @@
+"""
+Бенчмарк постоянных индексов: чередование обновлений оценок и чтения страницы по avg
+
+Запуск из каталога Lab_2:
+    python -m benchmarks.bench_indexes
+"""
+
+import random
+import time
+from lab import processing
+from lab.models import Student
+from lab.roster import StudentRoster
+
+STUDENT_COUNT = 100_000
+OPERATIONS = 200
+
+def run(students: StudentRoster, updates) -> float:
+    
+    """Обновление оценок + чтение первой страницы и места студента, возвращает время"""
+    
+    start = time.perf_counter()
+    for student_id, grades in updates:
+        processing.update_grades(student_id, grades, students)
+        list(processing.get_page(students, 1, 20, sort_by='avg'))
+        processing.get_student_rank(students, student_id)
+    return time.perf_counter() - start
+
+def main():
+    rng = random.Random(0)
+    population = [
+        Student(id=i, name=f"Студент {i}", grades=[rng.randint(0, 100) for _ in range(5)])
+        for i in range(STUDENT_COUNT)
+    ]
+    updates = [(rng.randrange(STUDENT_COUNT), [rng.randint(0, 100)]) for _ in range(OPERATIONS)]
+    print(f"студентов: {STUDENT_COUNT}, операций: {OPERATIONS}")
+    for title, indexed_keys in (("кэш представления", ()), ("индекс по avg", ('avg',))):
+        students = StudentRoster(
+            (Student(id=s.student_id, name=s.name, grades=list(s.grades)) for s in population),
+            indexed_keys=indexed_keys
+        )
+        elapsed = run(students, updates)
+        print(f"{title:>18}: {elapsed:.3f} с, {elapsed / OPERATIONS * 1e3:.2f} мс/операция")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Бенчмарк загрузки csv: время загрузки должно расти линейно от числа строк
+
+Запуск из каталога Lab_2:
+    python -m benchmarks.bench_load
+"""
+
+import csv
+import random
+import tempfile
+import time
+from pathlib import Path
+from lab import io_utils
+
+ROW_COUNTS = [2_000, 20_000, 200_000]
+
+def write_csv(filepath: Path, rows: int, seed: int = 0):
+    
+    """Генерирует csv файл с rows студентами и тремя оценками у каждого"""
+    
+    rng = random.Random(seed)
+    with open(filepath, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(['id', 'name', 'grade1', 'grade2', 'grade3'])
+        for i in range(rows):
+            writer.writerow([i, f"Студент {i}"] + [rng.randint(0, 100) for _ in range(3)])
+
+def measure(filepath: Path, repeat: int = 3) -> float:
+    
+    """Лучшее время загрузки файла из repeat попыток"""
+    
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        io_utils.load_students_from_csv(filepath)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'строк':>10} {'время, с':>10} {'мкс/строка':>12}")
+        for rows in ROW_COUNTS:
+            filepath = Path(tmp) / f"students_{rows}.csv"
+            write_csv(filepath, rows)
+            elapsed = measure(filepath)
+            print(f"{rows:>10} {elapsed:>10.3f} {elapsed / rows * 1e6:>12.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Бенчмарк памяти: Student против CompactStudent
+
+Запуск из каталога Lab_2:
+    python -m benchmarks.bench_memory
+"""
+
+import random
+import tracemalloc
+from lab.models import Student, CompactStudent
+
+STUDENT_COUNT = 200_000
+GRADES_PER_STUDENT = 10
+
+def measure(factory, rows) -> int:
+    
+    """Объем памяти (в байтах), который занимают созданные объекты"""
+    
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    students = [factory(id=i, name=name, grades=list(grades)) for i, name, grades in rows]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del students
+    return after - before
+
+def main():
+    rng = random.Random(0)
+    rows = [
+        (i, f"Студент {i}", tuple(rng.randint(0, 100) for _ in range(GRADES_PER_STUDENT)))
+        for i in range(STUDENT_COUNT)
+    ]
+    # имена и кортежи оценок созданы заранее и не попадают в замер
+    print(f"студентов: {STUDENT_COUNT}, оценок у каждого: {GRADES_PER_STUDENT}")
+    for factory in (Student, CompactStudent):
+        used = measure(factory, rows)
+        print(f"{factory.__name__:>15}: {used / 2**20:8.1f} МиБ, {used / STUDENT_COUNT:6.0f} байт/студент")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Бенчмарк параллельной загрузки csv: ускорение от числа процессов
+
+Запуск из каталога Lab_2:
+    python -m benchmarks.bench_parallel_load
+"""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+from lab import io_utils
+from benchmarks.bench_load import write_csv
+
+ROWS = 1_000_000
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        filepath = Path(tmp) / "students.csv"
+        write_csv(filepath, ROWS)
+
+        start = time.perf_counter()
+        io_utils.load_students_from_csv(filepath)
+        baseline = time.perf_counter() - start
+        print(f"строк: {ROWS}, ядер: {os.cpu_count()}")
+        print(f"{'последовательно':>16}: {baseline:.2f} с")
+
+        workers = 1
+        while workers <= (os.cpu_count() or 1):
+            start = time.perf_counter()
+            io_utils.load_students_from_csv_parallel(filepath, workers=workers, min_chunk_size=1)
+            elapsed = time.perf_counter() - start
+            print(f"{workers:>10} проц.: {elapsed:.2f} с (x{baseline / elapsed:.1f})")
+            workers *= 2
+
+if __name__ == "__main__":
+    main()
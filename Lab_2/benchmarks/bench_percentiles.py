@@ -0,0 +1,52 @@
+"""
+Бенчмарк распределения средних баллов: обновления оценок вперемешку с запросами
+места, процентиля и гистограммы
+
+Запуск из каталога Lab_2:
+    python -m benchmarks.bench_percentiles
+"""
+
+import random
+import time
+from lab import processing
+from lab.models import Student
+from lab.roster import StudentRoster
+
+STUDENT_COUNT = 100_000
+OPERATIONS = 200
+# пересчет без распределения строит его заново на каждый запрос, поэтому операций меньше
+RECOUNT_OPERATIONS = 10
+
+def run(students, updates) -> float:
+    
+    """Обновление оценок + место, процентиль и гистограмма, возвращает время"""
+    
+    start = time.perf_counter()
+    for student_id, grades in updates:
+        processing.update_grades(student_id, grades, students)
+        processing.get_average_rank(students, student_id)
+        processing.get_percentile(students, student_id)
+        processing.get_average_histogram(students)
+    return time.perf_counter() - start
+
+def main():
+    rng = random.Random(0)
+    population = [
+        Student(id=i, name=f"Студент {i}", grades=[rng.randint(0, 100) for _ in range(5)])
+        for i in range(STUDENT_COUNT)
+    ]
+    updates = [(rng.randrange(STUDENT_COUNT), [rng.randint(0, 100)]) for _ in range(OPERATIONS)]
+    print(f"студентов: {STUDENT_COUNT}, операций: {OPERATIONS}")
+    for title, track_distribution, count in (
+        ("пересчет", False, RECOUNT_OPERATIONS),
+        ("распределение", True, OPERATIONS)
+    ):
+        students = StudentRoster(
+            (Student(id=s.student_id, name=s.name, grades=list(s.grades)) for s in population),
+            track_distribution=track_distribution
+        )
+        elapsed = run(students, updates[:count])
+        print(f"{title:>14}: {elapsed:.3f} с, {elapsed / count * 1e3:.2f} мс/операция")
+
+if __name__ == "__main__":
+    main()
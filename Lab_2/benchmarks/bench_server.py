@@ -0,0 +1,58 @@
+"""
+Бенчмарк HTTP-сервера: пропускная способность при конкурентных клиентах
+
+Запуск из каталога Lab_2:
+    python -m benchmarks.bench_server
+"""
+
+import asyncio
+import random
+import time
+from lab.models import Student
+from lab.roster import StudentRoster
+from lab.server import RosterServer
+
+STUDENT_COUNT = 100_000
+CLIENTS = 50
+REQUESTS_PER_CLIENT = 20
+
+async def client(port: int, paths: list) -> int:
+    
+    """Клиент с keep-alive соединением, возвращает число успешных ответов"""
+    
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    ok = 0
+    for path in paths:
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: bench\r\n\r\n".encode('latin-1'))
+        await writer.drain()
+        head = await reader.readuntil(b'\r\n\r\n')
+        length = int(head.split(b'Content-Length: ')[1].split(b'\r\n')[0])
+        await reader.readexactly(length)
+        ok += head.startswith(b'HTTP/1.1 200')
+    writer.close()
+    return ok
+
+async def main():
+    rng = random.Random(0)
+    students = StudentRoster(
+        Student(id=i, name=f"Студент {i}", grades=[rng.randint(0, 100) for _ in range(5)])
+        for i in range(STUDENT_COUNT)
+    )
+    server = await RosterServer(students).start(port=0)
+    port = server.sockets[0].getsockname()[1]
+
+    workloads = {
+        "поиск по id": lambda: f"/students/{rng.randrange(STUDENT_COUNT)}",
+        "ТОП-10": lambda: "/top?n=10",
+        "страница по avg": lambda: f"/students?sort=avg&page={rng.randint(1, 100)}",
+    }
+    async with server:
+        for title, make_path in workloads.items():
+            paths = [[make_path() for _ in range(REQUESTS_PER_CLIENT)] for _ in range(CLIENTS)]
+            start = time.perf_counter()
+            ok = sum(await asyncio.gather(*(client(port, p) for p in paths)))
+            elapsed = time.perf_counter() - start
+            print(f"{title:>16}: {ok} запросов за {elapsed:.2f} с, {ok / elapsed:.0f} запр/с")
+
+if __name__ == "__main__":
+    asyncio.run(main())
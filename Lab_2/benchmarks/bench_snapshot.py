@@ -0,0 +1,41 @@
+"""
+Бенчмарк бинарного снимка: загрузка снимка против загрузки csv
+Объекты Student снимка создаются лениво, их создание для всех студентов измеряется отдельно
+
+Запуск из каталога Lab_2:
+    python -m benchmarks.bench_snapshot
+"""
+
+import tempfile
+import time
+from pathlib import Path
+from lab import io_utils
+from benchmarks.bench_load import write_csv
+
+ROWS = 500_000
+
+def timed(title: str, func):
+    
+    """Выполняет func и печатает время выполнения"""
+    
+    start = time.perf_counter()
+    result = func()
+    print(f"{title:>20}: {time.perf_counter() - start:.3f} с")
+    return result
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "students.csv"
+        snapshot_path = Path(tmp) / "students.snap"
+        write_csv(csv_path, ROWS)
+
+        print(f"строк: {ROWS}")
+        students = timed("загрузка csv", lambda: io_utils.load_students_from_csv(csv_path))
+        timed("сохранение снимка", lambda: io_utils.save_snapshot(snapshot_path, students))
+        snapshot = timed("загрузка снимка", lambda: io_utils.load_snapshot(snapshot_path))
+        timed("создание Student", lambda: list(snapshot))
+        print(f"размер csv: {csv_path.stat().st_size / 2**20:.1f} МиБ, "
+              f"снимка: {snapshot_path.stat().st_size / 2**20:.1f} МиБ")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Микробенчмарк валидации строк csv: прежняя реализация разбора оценок через int()
+и исключения против быстрого пути io_utils._parse_and_validate_row, на чистых строках,
+строках с пробелами и строках с ошибками, плюс загрузка чистого и грязного файла целиком
+
+Запуск из каталога Lab_2:
+    python -m benchmarks.bench_validation
+"""
+
+import contextlib
+import csv
+import io
+import random
+import tempfile
+import time
+from pathlib import Path
+from lab import io_utils
+from lab.models import Student
+from lab.errors import DataValidationError
+
+ROWS = 100_000
+GRADES_PER_ROW = 5
+
+def reference_parse_row(row, line_num):
+    
+    """Прежняя реализация _parse_and_validate_row (ValueError на каждую плохую оценку)"""
+    
+    if len(row) < 2:
+        raise DataValidationError(f"Строка {line_num}: Недостаточно данных нужен id и имя")
+    try:
+        student_id = int(row[0])
+    except ValueError:
+        raise DataValidationError(f"Строка {line_num}: id должен быть целым числом")
+    name = row[1].strip()
+    if not name:
+        raise DataValidationError(f"Строка {line_num}: имя не может быть пустым")
+    grades = []
+    for grade_str in row[2:]:
+        grade_str = grade_str.strip()
+        if not grade_str:
+            continue
+        try:
+            grade = int(grade_str)
+            if not (0 <= grade <= 100):
+                raise ValueError()
+            grades.append(grade)
+        except ValueError:
+            raise DataValidationError(
+                f"Строка {line_num}: оценка должна быть целым числом от 0 до 100"
+            )
+    return Student(id=student_id, name=name, grades=grades)
+
+def make_rows(kind: str, seed: int = 0) -> list:
+    
+    """
+    Строки csv одного вида: clean - только "0".."100", padded - оценки с пробелами,
+    dirty - каждая десятая строка с некорректной оценкой
+    """
+    
+    rng = random.Random(seed)
+    rows = []
+    for i in range(ROWS):
+        grades = [str(rng.randint(0, 100)) for _ in range(GRADES_PER_ROW)]
+        if kind == 'padded':
+            grades = [f" {grade} " for grade in grades]
+        elif kind == 'dirty' and i % 10 == 0:
+            grades[rng.randrange(GRADES_PER_ROW)] = rng.choice(["101", "abc", "-5", "7.5"])
+        rows.append([str(i), f"Студент {i}"] + grades)
+    return rows
+
+def time_parser(parse, rows, repeat: int = 5) -> float:
+    
+    """Лучшее время разбора всех строк из repeat попыток"""
+    
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line_num, row in enumerate(rows, start=2):
+            try:
+                parse(row, line_num)
+            except DataValidationError:
+                pass
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def time_load(filepath: Path, repeat: int = 3) -> float:
+    
+    """Лучшее время загрузки файла (предупреждения о плохих строках подавляются)"""
+    
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            io_utils.load_students_from_csv(filepath)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    print(f"строк: {ROWS}, оценок в строке: {GRADES_PER_ROW}")
+    print(f"{'строки':>8} {'прежний, с':>11} {'быстрый, с':>11} {'ускорение':>10}")
+    for kind in ('clean', 'padded', 'dirty'):
+        rows = make_rows(kind)
+        reference = time_parser(reference_parse_row, rows)
+        fast = time_parser(io_utils._parse_and_validate_row, rows)
+        print(f"{kind:>8} {reference:>11.3f} {fast:>11.3f} {reference / fast:>9.2f}x")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'файл':>8} {'загрузка, с':>11}")
+        for kind in ('clean', 'dirty'):
+            filepath = Path(tmp) / f"{kind}.csv"
+            with open(filepath, 'w', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                writer.writerow(['id', 'name'] + [f"grade{i}" for i in range(1, GRADES_PER_ROW + 1)])
+                writer.writerows(make_rows(kind))
+            print(f"{kind:>8} {time_load(filepath):>11.3f}")
+
+if __name__ == "__main__":
+    main()
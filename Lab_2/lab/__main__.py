@@ -0,0 +1,8 @@
+import sys
+from . import cli
+from .main import main
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(cli.main())
+    main()
@@ -0,0 +1,229 @@
+import argparse
+import asyncio
+import csv
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from typing import (
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple
+)
+from . import io_utils
+from . import processing
+from . import server
+from .roster import StudentRoster
+from .errors import (
+    StudentAppError,
+    BatchOperationError
+)
+
+
+def _iter_updates(filepath: str, has_header: bool) -> Iterator[Tuple[int, List[int]]]:
+
+    """
+    Чтение файла обновлений оценок: строки вида id,оценка1,оценка2,...
+    :raises StudentAppError: если id или оценка не целое число
+    """
+
+    with open(filepath, 'r', newline='', encoding='utf-8') as file:
+        reader = csv.reader(file)
+        if has_header:
+            next(reader, None)
+        for line_num, row in enumerate(reader, start=2 if has_header else 1):
+            if not row:
+                continue
+            try:
+                yield int(row[0]), [int(g) for g in row[1:] if g.strip()]
+            except ValueError:
+                raise StudentAppError(
+                    f"Строка {line_num} файла обновлений: id и оценки должны быть целыми числами"
+                )
+
+
+def _print_statistics(stats: dict, out: TextIO):
+
+    """Вывод статистики по группе в формате интерактивного меню"""
+
+    print(f"Всего студентов: {stats['count']}", file=out)
+    print(f"Общий средний балл: {stats['overall_average']:.2f}", file=out)
+    for title, key in (("Лучший студент", "best_student"), ("Худший студент", "worst_student")):
+        student = stats[key]
+        if student:
+            print(f"{title}: {student.name} (средний балл: {student.average:.2f})", file=out)
+        else:
+            print(f"{title}: невозможно определить", file=out)
+    for key in ("min_grade", "max_grade", "median", "stddev"):
+        if key in stats and stats[key] is not None:
+            print(f"{key}: {stats[key]:g}", file=out)
+
+
+def _open_output(filepath: str) -> Tuple[TextIO, str]:
+
+    """
+    Открытие временного файла для вывода рядом с filepath
+    Итоговый файл заменяется через os.replace только после успешной команды, поэтому
+    -o может указывать и на входной файл: он не обрезается до того, как будет прочитан
+    :return: (открытый файл, путь к временному файлу)
+    :raises OSError: если в каталоге нельзя создать файл
+    """
+
+    directory, name = os.path.split(os.path.abspath(filepath))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+    # mkstemp создает файл с правами 0600, итоговый файл получает обычные права по umask
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(tmp_path, 0o666 & ~umask)
+    return os.fdopen(fd, 'w', newline='', encoding='utf-8'), tmp_path
+
+
+def _write_top(students, out: TextIO):
+
+    """Запись лучших студентов в формате export_top_students_to_csv"""
+
+    writer = csv.writer(out)
+    writer.writerow(['id', 'name', 'average', 'grades'])
+    for student in students:
+        writer.writerow([
+            student.student_id,
+            student.name,
+            f"{student.average:.2f}",
+            ' '.join(map(str, student.grades))
+        ])
+
+
+def run_command(args: argparse.Namespace, out: TextIO):
+
+    """
+    Выполнение одной команды над загруженным файлом
+    Команды stats, show и export-top читают файл потоково и не держат весь список в памяти,
+    sort, apply-updates и serve загружают его один раз
+    """
+
+    has_header = not args.no_header
+    stream = io_utils.iter_students_from_csv(args.file, has_header=has_header)
+
+    if args.action == 'stats':
+        _print_statistics(processing.get_full_statistics(stream, extended=args.extended), out)
+    elif args.action == 'show':
+        if args.page is not None:
+            stream = processing.get_page(stream, args.page, args.page_size)
+        for student in stream:
+            print(student, file=out)
+    elif args.action == 'export-top':
+        _write_top(processing.get_top_students(stream, args.n), out)
+    elif args.action == 'sort':
+        students = StudentRoster(stream)
+        if args.page is not None:
+            ordered = processing.get_page(students, args.page, args.page_size, sort_by=args.by)
+        else:
+            ordered = processing.iter_sorted(students, args.by)
+        for student in ordered:
+            print(student, file=out)
+    elif args.action == 'serve':
+        try:
+            asyncio.run(server.serve(StudentRoster(stream, indexed_keys=['avg']), args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+    elif args.action == 'apply-updates':
+        students = StudentRoster(stream)
+        processing.update_grades_bulk(students, _iter_updates(args.updates, args.updates_header))
+        io_utils.write_students_csv(out, students, has_header=has_header)
+
+
+def build_parser() -> argparse.ArgumentParser:
+
+    """Парсер аргументов командной строки"""
+
+    parser = argparse.ArgumentParser(
+        prog="python -m lab",
+        description="Пакетная обработка списка студентов без интерактивного меню"
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    load = commands.add_parser('load', help="загрузить csv файл и выполнить над ним команду")
+    load.add_argument('file', help="путь к csv файлу со студентами")
+    load.add_argument('--no-header', action='store_true', help="в файле нет строки заголовка")
+    load.add_argument('-o', '--output', help="файл для вывода (default: stdout)")
+
+    actions = load.add_subparsers(dest='action', required=True)
+
+    stats = actions.add_parser('stats', help="статистика по группе")
+    stats.add_argument('--extended', action='store_true', help="добавить min/max, медиану и отклонение")
+
+    show = actions.add_parser('show', help="показать всех студентов")
+
+    sort = actions.add_parser('sort', help="показать студентов в порядке сортировки")
+    sort.add_argument('--by', default='id', choices=['id', 'name', 'avg'], help="ключ сортировки")
+
+    for paged in (show, sort):
+        paged.add_argument('--page', type=int, help="вывести только страницу с этим номером (с 1)")
+        paged.add_argument('--page-size', type=int, default=20, help="размер страницы (default: 20)")
+
+    export_top = actions.add_parser('export-top', help="ТОП-N студентов в формате csv")
+    export_top.add_argument('-n', type=int, required=True, help="количество студентов")
+
+    updates = actions.add_parser('apply-updates', help="применить обновления оценок и вывести csv")
+    updates.add_argument('updates', help="csv файл со строками id,оценка1,оценка2,...")
+    updates.add_argument('--updates-header', action='store_true', help="в файле обновлений есть заголовок")
+
+    serve = actions.add_parser('serve', help="HTTP/JSON сервер над загруженным списком")
+    serve.add_argument('--host', default="127.0.0.1", help="адрес (default: 127.0.0.1)")
+    serve.add_argument('--port', type=int, default=8080, help="порт (default: 8080)")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+
+    """
+    Точка входа пакетного режима
+    Результат пишется в stdout (или в --output), предупреждения и ошибки - в stderr
+    :return: код возврата процесса
+    """
+
+    args = build_parser().parse_args(argv)
+    if args.action == 'export-top' and args.n <= 0:
+        print("Ошибка: N должно быть положительным числом", file=sys.stderr)
+        return 2
+
+    out, tmp_path = sys.stdout, None
+    if args.output:
+        try:
+            out, tmp_path = _open_output(args.output)
+        except OSError as e:
+            print(f"Ошибка: не удалось открыть файл вывода {args.output}: {e.strerror}", file=sys.stderr)
+            return 1
+    try:
+        with redirect_stdout(sys.stderr):
+            run_command(args, out)
+        if tmp_path:
+            out.close()
+            os.replace(tmp_path, args.output)
+            tmp_path = None
+    except BrokenPipeError:
+        # получатель вывода закрыл канал (например, `| head`), остаток вывода не нужен
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 0
+    except BatchOperationError as e:
+        print(f"Ошибка: {e}", file=sys.stderr)
+        for result in e.results:
+            if not result["ok"]:
+                print(f"  id {result['student_id']}: {result['error']}", file=sys.stderr)
+        return 1
+    except FileNotFoundError as e:
+        print(e, file=sys.stderr)
+        return 1
+    except (StudentAppError, OSError) as e:
+        print(f"Ошибка: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        if tmp_path:
+            os.remove(tmp_path)
+    return 0
@@ -0,0 +1,205 @@
+from itertools import chain
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional
+)
+from .models import Student
+from .errors import (
+    StudentAppError,
+    InvalidSortKeyError
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _require_numpy():
+
+    """Проверка наличия необязательной зависимости numpy"""
+
+    if np is None:
+        raise StudentAppError("Для колоночного представления требуется пакет numpy")
+
+
+class ColumnarRoster:
+
+    """
+    Колоночное представление студентов для векторной аналитики на numpy
+    Хранит массив id, массив имен и оценки в формате CSR:
+    оценки студента i - это grades[offsets[i]:offsets[i + 1]] (uint8)
+    Порядок студентов совпадает с порядком исходного списка
+    """
+
+    def __init__(self, ids, names, offsets, grades):
+
+        """
+        Конструктор из готовых массивов
+        :param ids: id студентов (int64)
+        :param names: имена студентов (массив object)
+        :param offsets: границы оценок студентов, длина на 1 больше числа студентов (int64)
+        :param grades: все оценки подряд (uint8)
+        """
+
+        _require_numpy()
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.names = np.asarray(names, dtype=object)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.grades = np.asarray(grades, dtype=np.uint8)
+        self._averages = None
+
+    @classmethod
+    def from_students(cls, students: Iterable[Student]) -> "ColumnarRoster":
+
+        """Построение колоночного представления из списка студентов"""
+
+        _require_numpy()
+        students = list(students)
+        counts = np.fromiter((len(s.grades) for s in students), dtype=np.int64, count=len(students))
+        offsets = np.zeros(len(students) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        grades = np.fromiter(
+            chain.from_iterable(s.grades for s in students),
+            dtype=np.uint8,
+            count=int(offsets[-1])
+        )
+        ids = np.fromiter((s.student_id for s in students), dtype=np.int64, count=len(students))
+        names = np.empty(len(students), dtype=object)
+        names[:] = [s.name for s in students]
+        return cls(ids, names, offsets, grades)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def student_at(self, index: int) -> Student:
+
+        """Создание объекта Student для студента с позицией index"""
+
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return Student(
+            id=int(self.ids[index]),
+            name=self.names[index],
+            grades=self.grades[start:end].tolist()
+        )
+
+    def to_students(self, order: Optional[Iterable[int]] = None) -> List[Student]:
+
+        """
+        Преобразование обратно в список Student
+        :param order: позиции студентов в нужном порядке (default: исходный порядок)
+        """
+
+        if order is None:
+            order = range(len(self))
+        return [self.student_at(int(i)) for i in order]
+
+    def grade_counts(self):
+
+        """Количество оценок у каждого студента"""
+
+        return np.diff(self.offsets)
+
+    def grade_sums(self):
+
+        """Сумма оценок каждого студента (через накопленные суммы, без цикла)"""
+
+        cumulative = np.zeros(len(self.grades) + 1, dtype=np.int64)
+        np.cumsum(self.grades, dtype=np.int64, out=cumulative[1:])
+        return cumulative[self.offsets[1:]] - cumulative[self.offsets[:-1]]
+
+    def averages(self):
+
+        """Средние баллы всех студентов (0.0 у студентов без оценок)"""
+
+        if self._averages is None:
+            counts = self.grade_counts()
+            self._averages = np.divide(
+                self.grade_sums(),
+                counts,
+                out=np.zeros(len(self), dtype=np.float64),
+                where=counts > 0
+            )
+        return self._averages
+
+    def overall_average(self) -> float:
+
+        """Средний балл по всем оценкам всех студентов"""
+
+        if not len(self.grades):
+            return 0.0
+        return int(self.grades.sum(dtype=np.int64)) / len(self.grades)
+
+    def get_full_statistics(self) -> Dict[str, Any]:
+
+        """Статистика по группе в формате processing.get_full_statistics"""
+
+        if not len(self):
+            return {
+                "count": 0,
+                "overall_average": 0.0,
+                "best_student": None,
+                "worst_student": None
+            }
+        averages = self.averages()
+        return {
+            "count": len(self),
+            "overall_average": self.overall_average(),
+            "best_student": self.student_at(int(np.argmax(averages))),
+            "worst_student": self.student_at(int(np.argmin(averages)))
+        }
+
+    def _avg_order(self, positions):
+
+        """Упорядочивание позиций по (-средний балл, имя) с сохранением исходного порядка при равенстве"""
+
+        by_name = positions[np.argsort(self.names[positions], kind='stable')]
+        return by_name[np.argsort(-self.averages()[by_name], kind='stable')]
+
+    def sort_order(self, sort_by: str):
+
+        """
+        Позиции студентов в порядке сортировки, как у processing.sort_students
+        :param sort_by: ключ для сортировки ['id', 'name' или 'avg']
+        :raises InvalidSortKeyError: если передан неверный ключ сортировки
+        """
+
+        if sort_by == 'id':
+            return np.argsort(self.ids, kind='stable')
+        elif sort_by == 'name':
+            return np.argsort(self.names, kind='stable')
+        elif sort_by == 'avg':
+            return self._avg_order(np.arange(len(self)))
+        else:
+            raise InvalidSortKeyError("Неверный ключ сортировки")
+
+    def sort_students(self, sort_by: str) -> List[Student]:
+
+        """Сортировка студентов по ключу, возвращает список Student"""
+
+        return self.to_students(self.sort_order(sort_by))
+
+    def top_order(self, n: int):
+
+        """
+        Позиции N лучших студентов по среднему баллу
+        Сначала отбираются кандидаты через np.partition за O(n), сортируются только они
+        """
+
+        if n <= 0:
+            return np.empty(0, dtype=np.int64)
+        if n >= len(self):
+            return self._avg_order(np.arange(len(self)))
+        negated = -self.averages()
+        threshold = np.partition(negated, n - 1)[n - 1]
+        candidates = np.nonzero(negated <= threshold)[0]
+        return self._avg_order(candidates)[:n]
+
+    def get_top_students(self, n: int) -> List[Student]:
+
+        """N лучших студентов, как у processing.get_top_students"""
+
+        return self.to_students(self.top_order(n))
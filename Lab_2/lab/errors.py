@@ -22,6 +22,12 @@ class InvalidSortKeyError(StudentAppError):
 
     pass
 
+class InvalidPageError(StudentAppError):
+
+    """Исключение при неверном номере или размере страницы"""
+
+    pass
+
 class DataValidationError(StudentAppError):
 
     """Исключение при ошибках валидации данных в csv файле"""
@@ -33,3 +39,14 @@ class DuplicateStudentIdInFileError(DataValidationError):
     """Исключение при обнаружении дубликата id в csv файле"""
     
     pass
+
+class BatchOperationError(StudentAppError):
+    
+    """
+    Исключение при ошибке в пакетной операции
+    Пакет не применяется, в results - отчет по каждому элементу пакета
+    """
+    
+    def __init__(self, message: str, results: list):
+        super().__init__(message)
+        self.results = results
@@ -0,0 +1,329 @@
+import math
+from bisect import bisect_left, insort
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple
+)
+from .models import Student
+from .errors import InvalidSortKeyError
+
+# ключи сортировки для processing.sort_students и сортированных представлений реестра
+SORT_KEYS: Dict[str, Callable[[Student], Any]] = {
+    'id': lambda student: student.student_id,
+    'name': lambda student: student.name,
+    'avg': lambda student: (-student.average, student.name),
+}
+
+
+class SortedIndex:
+
+    """
+    Отсортированный индекс студентов по одному из ключей SORT_KEYS
+    Хранит упорядоченный список записей (ключ, порядковый номер, студент), который
+    поддерживается через bisect при каждом изменении. Порядковый номер добавления
+    делает порядок при равных ключах таким же, как у устойчивой сортировки списка.
+    Поиск позиции - O(log n), чтение страницы - O(k), вставка и удаление - O(log n)
+    сравнений плюс сдвиг списка (memmove)
+    """
+
+    def __init__(self, sort_by: str, students: Iterable[Student] = ()):
+
+        """
+        Построение индекса
+        :param sort_by: ключ сортировки ['id', 'name' или 'avg']
+        :param students: студенты в порядке добавления
+        :raises InvalidSortKeyError: если передан неверный ключ сортировки
+        """
+
+        if sort_by not in SORT_KEYS:
+            raise InvalidSortKeyError("Неверный ключ сортировки")
+        self.sort_by = sort_by
+        self._key = SORT_KEYS[sort_by]
+        self._next_seq = 0
+        self._by_id: Dict[int, Tuple[Any, int, Student]] = {}
+        self._entries: List[Tuple[Any, int, Student]] = []
+        for student in students:
+            self._by_id[student.student_id] = self._entry(student)
+        self._entries = sorted(self._by_id.values(), key=lambda entry: entry[:2])
+
+    def _entry(self, student: Student, seq: int = None) -> Tuple[Any, int, Student]:
+
+        """Запись индекса; студент в сравнении не участвует, так как номер уникален"""
+
+        if seq is None:
+            seq = self._next_seq
+            self._next_seq += 1
+        return (self._key(student), seq, student)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Student]:
+
+        """Обход студентов в порядке индекса"""
+
+        return (entry[2] for entry in self._entries)
+
+    def add(self, student: Student):
+
+        """Добавление нового студента"""
+
+        entry = self._entry(student)
+        self._by_id[student.student_id] = entry
+        insort(self._entries, entry)
+
+    def remove(self, student: Student):
+
+        """Удаление студента"""
+
+        entry = self._by_id.pop(student.student_id)
+        del self._entries[bisect_left(self._entries, entry)]
+
+    def update(self, student: Student):
+
+        """Перемещение студента после изменения ключа (порядок добавления сохраняется)"""
+
+        old = self._by_id[student.student_id]
+        del self._entries[bisect_left(self._entries, old)]
+        entry = self._entry(student, seq=old[1])
+        self._by_id[student.student_id] = entry
+        insort(self._entries, entry)
+
+    def position(self, student_id: int) -> int:
+
+        """
+        Позиция студента в индексе (с 0) за O(log n)
+        :raises KeyError: если студента нет в индексе
+        """
+
+        return bisect_left(self._entries, self._by_id[student_id])
+
+    def slice(self, start: int, stop: int) -> List[Student]:
+
+        """Студенты с позициями [start, stop) за O(stop - start)"""
+
+        return [entry[2] for entry in self._entries[start:stop]]
+
+
+class FenwickTree:
+
+    """
+    Дерево Фенвика (двоичное индексированное дерево) над счетчиками 0..size-1
+    Изменение счетчика и префиксная сумма - O(log size)
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.total = 0
+        self._tree = [0] * (size + 1)
+
+    @classmethod
+    def from_counts(cls, counts: List[int]) -> "FenwickTree":
+
+        """Построение дерева по готовым счетчикам за O(size)"""
+
+        tree = cls(len(counts))
+        data = tree._tree
+        data[1:] = counts
+        for index in range(1, tree.size + 1):
+            parent = index + (index & -index)
+            if parent <= tree.size:
+                data[parent] += data[index]
+        tree.total = sum(counts)
+        return tree
+
+    def add(self, index: int, delta: int):
+
+        """Изменение счетчика index на delta"""
+
+        self.total += delta
+        index += 1
+        tree = self._tree
+        while index <= self.size:
+            tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, index: int) -> int:
+
+        """Сумма счетчиков 0..index включительно (0 при index < 0)"""
+
+        result = 0
+        index = min(index, self.size - 1) + 1
+        tree = self._tree
+        while index > 0:
+            result += tree[index]
+            index -= index & -index
+        return result
+
+    def range_sum(self, low: int, high: int) -> int:
+
+        """Сумма счетчиков low..high включительно"""
+
+        return self.prefix_sum(high) - self.prefix_sum(low - 1)
+
+    def find_kth(self, k: int) -> int:
+
+        """
+        Наименьший index, у которого prefix_sum(index) >= k (k от 1 до total)
+        Спуск по дереву за O(log size)
+        """
+
+        position = 0
+        step = 1 << self.size.bit_length()
+        tree = self._tree
+        while step:
+            following = position + step
+            if following <= self.size and tree[following] < k:
+                position = following
+                k -= tree[following]
+            step >>= 1
+        return position
+
+
+class AverageDistribution:
+
+    """
+    Порядковая статистика по средним баллам и оценкам на деревьях Фенвика
+    Средние баллы 0..100 квантуются с шагом 1 / RESOLUTION (0.01 балла), оценки 0..100 - точно.
+    Место, процентиль и гистограммы - O(log), выборка по процентилям - O(корзин + k).
+    Средние, отличающиеся меньше чем на шаг, считаются равными.
+    Как и в SortedIndex, порядковый номер добавления (сохраняется при update) упорядочивает
+    студентов с равными ключами так же, как устойчивая сортировка списка
+    """
+
+    RESOLUTION = 100
+    MAX_VALUE = 100
+
+    def __init__(self, students: Iterable[Student] = ()):
+        average_counts = [0] * (self.MAX_VALUE * self.RESOLUTION + 1)
+        grade_counts = [0] * (self.MAX_VALUE + 1)
+        self._next_seq = 0
+        self._members: Dict[int, Dict[int, Tuple[int, Student]]] = {}
+        # корзина, копия оценок студента на момент учета (чтобы снять их при изменении,
+        # даже если список оценок изменят на месте) и порядковый номер добавления
+        self._state: Dict[int, Tuple[int, Tuple[int, ...], int]] = {}
+        for seq, student in enumerate(students):
+            bucket = self.bucket(student.average)
+            grades = tuple(student.grades)
+            average_counts[bucket] += 1
+            for grade in grades:
+                grade_counts[grade] += 1
+            self._members.setdefault(bucket, {})[student.student_id] = (seq, student)
+            self._state[student.student_id] = (bucket, grades, seq)
+            self._next_seq = seq + 1
+        # начальное построение по счетчикам за один проход, без log на каждого студента
+        self._averages = FenwickTree.from_counts(average_counts)
+        self._grades = FenwickTree.from_counts(grade_counts)
+
+    def __len__(self) -> int:
+        return self._averages.total
+
+    def bucket(self, average: float) -> int:
+
+        """Корзина квантованного среднего балла"""
+
+        return round(average * self.RESOLUTION)
+
+    def add(self, student: Student, seq: int = None):
+
+        """Учет нового студента"""
+
+        if seq is None:
+            seq = self._next_seq
+            self._next_seq += 1
+        bucket = self.bucket(student.average)
+        grades = tuple(student.grades)
+        self._averages.add(bucket, 1)
+        for grade in grades:
+            self._grades.add(grade, 1)
+        self._members.setdefault(bucket, {})[student.student_id] = (seq, student)
+        self._state[student.student_id] = (bucket, grades, seq)
+
+    def remove(self, student: Student) -> int:
+
+        """Снятие студента с учета, возвращает его порядковый номер добавления"""
+
+        bucket, grades, seq = self._state.pop(student.student_id)
+        self._averages.add(bucket, -1)
+        for grade in grades:
+            self._grades.add(grade, -1)
+        members = self._members[bucket]
+        del members[student.student_id]
+        if not members:
+            del self._members[bucket]
+        return seq
+
+    def update(self, student: Student):
+
+        """Учет изменения оценок студента (порядок добавления сохраняется)"""
+
+        self.add(student, seq=self.remove(student))
+
+    def rank(self, student_id: int) -> int:
+
+        """Место по среднему баллу: 1 + число студентов с большим средним"""
+
+        bucket = self._state[student_id][0]
+        return len(self) - self._averages.prefix_sum(bucket) + 1
+
+    def percentile(self, student_id: int) -> float:
+
+        """Процент студентов со средним баллом не выше, чем у студента"""
+
+        bucket = self._state[student_id][0]
+        return self._averages.prefix_sum(bucket) * 100 / len(self)
+
+    def between_percentiles(self, low: float, high: float) -> List[Student]:
+
+        """
+        Студенты, чей процентиль (см. percentile) лежит в [low, high],
+        в порядке убывания среднего балла (как sort_students(..., 'avg'))
+        """
+
+        count = len(self)
+        k_low = max(1, math.ceil(low * count / 100))
+        k_high = math.floor(high * count / 100)
+        if count == 0 or k_high < k_low:
+            return []
+        first = self._averages.find_kth(k_low)
+        if k_high >= count:
+            last = self._averages.size - 1
+        else:
+            last = self._averages.find_kth(k_high + 1) - 1
+
+        selected = []
+        for bucket in range(first, last + 1):
+            members = self._members.get(bucket)
+            if members:
+                selected.extend(members.values())
+        avg_key = SORT_KEYS['avg']
+        selected.sort(key=lambda member: (avg_key(member[1]), member[0]))
+        return [student for _, student in selected]
+
+    def _histogram(self, tree: FenwickTree, scale: int, bucket_width: int) -> List[Tuple[int, int, int]]:
+
+        """Гистограмма по корзинам шириной bucket_width (последняя включает 100)"""
+
+        histogram = []
+        for low in range(0, self.MAX_VALUE, bucket_width):
+            high = min(low + bucket_width, self.MAX_VALUE)
+            last = high * scale if high == self.MAX_VALUE else high * scale - 1
+            histogram.append((low, high, tree.range_sum(low * scale, last)))
+        return histogram
+
+    def average_histogram(self, bucket_width: int = 10) -> List[Tuple[int, int, int]]:
+
+        """Число студентов по корзинам среднего балла: [(от, до, количество)]"""
+
+        return self._histogram(self._averages, self.RESOLUTION, bucket_width)
+
+    def grade_histogram(self, bucket_width: int = 10) -> List[Tuple[int, int, int]]:
+
+        """Число оценок по корзинам: [(от, до, количество)]"""
+
+        return self._histogram(self._grades, 1, bucket_width)
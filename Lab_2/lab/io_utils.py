@@ -1,11 +1,76 @@
+import codecs
 import csv
-from typing import List, Tuple
+import io
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, chain, repeat
+from typing import (
+    Collection,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple
+)
 from .models import Student
+from .processing import get_top_students
 from .errors import (
     DataValidationError,
     DuplicateStudentIdInFileError
 )
 
+# быстрый путь разбора оценок: готовые значения для "0".."100" без int() и исключений
+_GRADE_VALUES = {str(grade): grade for grade in range(101)}
+
+def _grade_error(line_num: int) -> DataValidationError:
+    
+    """Ошибка некорректной оценки (сообщение строится только при ошибке)"""
+    
+    return DataValidationError(f"Строка {line_num}: оценка должна быть целым числом от 0 до 100")
+
+def _int_or_none(cell: str) -> Optional[int]:
+    
+    """
+    int(cell) или None, если cell не целое число
+    Явно нечисловые значения отсекаются проверкой символов, без исключения ValueError
+    """
+    
+    if not cell.lstrip('+-').replace('_', '').isdecimal():
+        return None
+    try:
+        # редкие формы вроде "+-5" или "1__0" проверку проходят, но int() их не принимает
+        return int(cell)
+    except ValueError:
+        return None
+
+def _parse_grades_slow(cells: List[str], line_num: int) -> List[int]:
+    
+    """
+    Разбор оценок, не прошедших быстрый путь по таблице (пробелы, ведущие нули, ошибки),
+    по правилам int() и прежней реализации
+    :raises DataValidationError: на первой некорректной оценке
+    """
+    
+    grades = []
+    for cell in cells:
+        cell = cell.strip()
+        if not cell:
+            continue
+        grade = _GRADE_VALUES.get(cell)
+        if grade is None:
+            grade = _int_or_none(cell)
+            if grade is None or not (0 <= grade <= 100):
+                raise _grade_error(line_num)
+        grades.append(grade)
+    return grades
+
 def _parse_and_validate_row(row: List[str], line_num: int) -> Student:
     
     """Парсит и валидирует строку из csv, возвращает Student"""
@@ -22,23 +87,57 @@ def _parse_and_validate_row(row: List[str], line_num: int) -> Student:
     if not name:
         raise DataValidationError(f"Строка {line_num}: имя не может быть пустым")
 
-    grades = []
-    for grade_str in row[2:]:
-        grade_str = grade_str.strip()
-        if not grade_str:
-            continue
-        try:
-            grade = int(grade_str)
-            if not (0 <= grade <= 100):
-                raise ValueError()
-            grades.append(grade)
-        except ValueError:
-            raise DataValidationError(
-                f"Строка {line_num}: оценка должна быть целым числом от 0 до 100"
-            )
-            
+    # чистые ячейки ("0".."100" или пустые) разбираются одним проходом по таблице без int()
+    try:
+        grades = [_GRADE_VALUES[cell] for cell in row[2:] if cell]
+    except KeyError:
+        grades = _parse_grades_slow(row[2:], line_num)
+
     return Student(id=student_id, name=name, grades=grades)
 
+def iter_students_from_csv(filepath: str, has_header: bool = True) -> Iterator[Student]:
+    
+    """
+    Потоковая загрузка студентов из csv файла
+    Генератор читает файл построчно и отдает провалидированные объекты Student по одному,
+    поэтому память не зависит от размера файла (кроме множества уже встреченных id)
+    Пропускает строки с ошибками валидации выводя сообщение в консоль
+    :param filepath: путь к файлу для загрузки
+    :param has_header: есть ли в файле строка с заголовком (default=True)
+    :raises FileNotFoundError: если файл не найден (при первом обращении к генератору)
+    """
+    
+    seen_ids = set()
+    try:
+        file = open(filepath, 'r', newline='', encoding='utf-8')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Ошибка: файл '{filepath}' не найден")
+
+    with file:
+        reader = csv.reader(file)
+
+        if has_header:
+            try:
+                next(reader)
+            except StopIteration:
+                return
+
+        start_line = 2 if has_header else 1
+
+        for i, row in enumerate(reader, start=start_line):
+            try:
+                student = _parse_and_validate_row(row, i)
+                if student.student_id in seen_ids:
+                    raise DuplicateStudentIdInFileError(
+                        f"дубликат id {student.student_id}"
+                    )
+            except DataValidationError as e:
+                print(f"Предупреждение: строка {i} пропущена. Ошибка: {e}")
+                continue
+
+            seen_ids.add(student.student_id)
+            yield student
+
 def load_students_from_csv(filepath: str, has_header: bool = True) -> List[Student]:
     
     """
@@ -50,75 +149,406 @@ def load_students_from_csv(filepath: str, has_header: bool = True) -> List[Stude
     :raises FileNotFoundError: если файл не найден
     """
     
-    students = []
-    try:
-        with open(filepath, 'r', newline='', encoding='utf-8') as file:
-            reader = csv.reader(file)
-
-            if has_header:
-                try:
-                    next(reader)
-                except StopIteration:
-                    return []
-
-            start_line = 2 if has_header else 1
-
-            for i, row in enumerate(reader, start=start_line):
-                try:
-                    student = _parse_and_validate_row(row, i)
-                    if any(s.student_id == student.student_id for s in students):
-                        raise DuplicateStudentIdInFileError(
-                            f"дубликат id {student.student_id}"
-                        )
-                    
-                    students.append(student)
-                except DataValidationError as e:
-                    print(f"Предупреждение: строка {i} пропущена. Ошибка: {e}")
+    return list(iter_students_from_csv(filepath, has_header=has_header))
+
+
+def _chunk_boundaries(filepath: str, has_header: bool, chunks: int) -> List[Tuple[int, int]]:
+    
+    """
+    Делит файл на байтовые диапазоны [start, end), выровненные по границам строк
+    Строка заголовка в диапазоны не попадает
+    """
+    
+    with open(filepath, 'rb') as file:
+        if has_header:
+            file.readline()
+        data_start = file.tell()
+        size = file.seek(0, os.SEEK_END)
 
+        step = (size - data_start) / chunks
+        offsets = [data_start]
+        for k in range(1, chunks):
+            # чтение с предыдущего байта переносит позицию на начало следующей строки
+            file.seek(max(int(data_start + k * step) - 1, data_start))
+            file.readline()
+            position = file.tell()
+            if offsets[-1] < position < size:
+                offsets.append(position)
+        offsets.append(size)
+
+    return list(zip(offsets, offsets[1:]))
+
+def _parse_chunk(filepath: str, start: int, end: int) -> Optional[Tuple[int, List[Tuple[int, object]]]]:
+    
+    """
+    Разбор байтового диапазона файла в отдельном процессе
+    Номера строк внутри диапазона локальные (с 0), поэтому для строк с ошибкой
+    возвращается сама строка csv, а сообщение строится при слиянии с глобальным номером
+    :return: (число строк в диапазоне, [(локальный номер, Student или список ячеек)])
+             или None, если в диапазоне есть кавычки (границы диапазонов могут быть неверны)
+    """
+    
+    with open(filepath, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    if b'"' in data:
+        return None
+    text = data.decode('utf-8')
+
+    results = []
+    row_count = 0
+    for index, row in enumerate(csv.reader(io.StringIO(text, newline=''))):
+        row_count += 1
+        try:
+            results.append((index, _parse_and_validate_row(row, index)))
+        except DataValidationError:
+            results.append((index, row))
+    return row_count, results
+
+def load_students_from_csv_parallel(
+    filepath: str,
+    has_header: bool = True,
+    workers: Optional[int] = None,
+    min_chunk_size: int = 1 << 20
+) -> List[Student]:
+    
+    """
+    Параллельная загрузка списка студентов из csv файла пулом процессов
+    Файл делится на диапазоны по границам строк, каждый диапазон разбирается
+    через _parse_and_validate_row в своем процессе, затем результаты сливаются по порядку:
+    дубликаты id между диапазонами и предупреждения выводятся с глобальными номерами строк,
+    результат совпадает с load_students_from_csv
+    Поле в кавычках может содержать перевод строки, и тогда граница диапазона попадет
+    внутрь записи, поэтому файл с кавычками в данных читается последовательно
+    :param filepath: путь к файлу для загрузки
+    :param has_header: есть ли в файле строка с заголовком (default=True)
+    :param workers: число процессов (default: число ядер)
+    :param min_chunk_size: минимальный размер диапазона в байтах, маленькие файлы читаются в одном процессе
+    :return: список загруженных объектов Student
+    :raises FileNotFoundError: если файл не найден
+    """
+    
+    try:
+        size = os.path.getsize(filepath)
     except FileNotFoundError:
         raise FileNotFoundError(f"Ошибка: файл '{filepath}' не найден")
+
+    workers = workers or os.cpu_count() or 1
+    chunks = max(1, min(workers, size // max(min_chunk_size, 1)))
+    if chunks == 1:
+        return load_students_from_csv(filepath, has_header=has_header)
+
+    boundaries = _chunk_boundaries(filepath, has_header, chunks)
+    with ProcessPoolExecutor(max_workers=min(workers, len(boundaries))) as executor:
+        parts = list(executor.map(_parse_chunk, repeat(filepath), *zip(*boundaries)))
+    if None in parts:
+        return load_students_from_csv(filepath, has_header=has_header)
+
+    students = []
+    seen_ids = set()
+    first_line = 2 if has_header else 1
+    for row_count, results in parts:
+        for index, item in results:
+            line = first_line + index
+            try:
+                if not isinstance(item, Student):
+                    _parse_and_validate_row(item, line)
+                if item.student_id in seen_ids:
+                    raise DuplicateStudentIdInFileError(
+                        f"дубликат id {item.student_id}"
+                    )
+            except DataValidationError as e:
+                print(f"Предупреждение: строка {line} пропущена. Ошибка: {e}")
+                continue
+
+            seen_ids.add(item.student_id)
+            students.append(item)
+        first_line += row_count
     return students
 
 
-def save_students_to_csv(filepath: str, students: List[Student], has_header: bool = True):
+def write_students_csv(
+    file: TextIO,
+    students: Iterable[Student],
+    has_header: bool = True,
+    grade_columns: Optional[int] = None
+):
+    
+    """
+    Записывает студентов в открытый текстовый поток в формате csv
+    Если grade_columns не задано, число колонок оценок равно максимальному числу оценок.
+    Коллекция (список, StudentRoster) просматривается для этого заранее; поток студентов
+    с заголовком сначала записывается во временный файл (в памяти до 1 МБ, дальше на диске),
+    поэтому результат совпадает с записью списка. Поток без заголовка пишется за один проход
+    без выравнивания строк
+    :param file: поток для записи (открытый с newline='')
+    :param students: любой итерируемый объект со студентами
+    :param has_header: Записывать ли строку с заголовком (default=True)
+    :param grade_columns: число колонок оценок в заголовке и для выравнивания строк
+    """
+    
+    if grade_columns is None and isinstance(students, Collection):
+        if not students:
+            grade_columns = 0
+        else:
+            grade_columns = max(len(s.grades) for s in students)
+    elif grade_columns is None and has_header:
+        _write_streamed_csv_with_header(file, students)
+        return
+
+    writer = csv.writer(file)
+
+    if has_header:
+        header = ['id', 'name'] + [f'grade{i+1}' for i in range(grade_columns or 0)]
+        writer.writerow(header)
+
+    for student in students:
+        grades_str = [str(g) for g in student.grades]
+        if grade_columns is not None:
+            grades_str += [''] * (grade_columns - len(grades_str))
+        row = [str(student.student_id), student.name] + grades_str
+        writer.writerow(row)
+
+def _write_streamed_csv_with_header(file: TextIO, students: Iterable[Student]):
+    
+    """
+    Запись потока студентов с заголовком как у коллекции: строки без выравнивания
+    копятся во временном файле, затем пишутся заголовок и выровненные строки
+    """
+    
+    grade_columns = 0
+    with tempfile.SpooledTemporaryFile(max_size=1 << 20, mode='w+', newline='', encoding='utf-8') as spool:
+        spool_writer = csv.writer(spool)
+        for student in students:
+            grade_columns = max(grade_columns, len(student.grades))
+            spool_writer.writerow([str(student.student_id), student.name] + [str(g) for g in student.grades])
+        
+        spool.seek(0)
+        writer = csv.writer(file)
+        writer.writerow(['id', 'name'] + [f'grade{i+1}' for i in range(grade_columns)])
+        for row in csv.reader(spool):
+            writer.writerow(row + [''] * (grade_columns + 2 - len(row)))
+
+def save_students_to_csv(
+    filepath: str,
+    students: Iterable[Student],
+    has_header: bool = True,
+    grade_columns: Optional[int] = None
+):
     
     """
-    Сохраняет список студентов в CSV-файл
+    Сохраняет студентов в CSV-файл
+    Принимает любой итерируемый объект, в том числе генератор из iter_students_from_csv
     :param filepath: путь к файлу для сохранения
-    :param students: список объектов Student для сохранения
+    :param students: итерируемый объект со студентами для сохранения
     :param has_header: Записывать ли строку с заголовком (default=True)
+    :param grade_columns: число колонок оценок (см. write_students_csv)
     """
-    if not students:
-        max_grades = 0
-    else:
-        max_grades = max(len(s.grades) for s in students)
 
     with open(filepath, 'w', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
+        write_students_csv(file, students, has_header=has_header, grade_columns=grade_columns)
 
-        if has_header:
-            header = ['id', 'name'] + [f'grade{i+1}' for i in range(max_grades)]
-            writer.writerow(header)
+SNAPSHOT_MAGIC = b'STUDSNAP'
+SNAPSHOT_VERSION = 2
+# magic, версия, число студентов, размер блока имен, размер блока оценок,
+# ширина в байтах таблиц id, длин имен и числа оценок
+_SNAPSHOT_HEADER = struct.Struct('<8sIIQQBBB')
+# коды array по ширине элемента: размер 'i'/'l' и 'I'/'L' зависит от платформы,
+# поэтому для 4 байт выбирается код с нужным размером ('q'/'Q' всегда 8 байт)
+_INT32 = 'i' if array('i').itemsize == 4 else 'l'
+_UINT32 = 'I' if array('I').itemsize == 4 else 'L'
+_SIGNED_CODES = {1: 'b', 2: 'h', 4: _INT32, 8: 'q'}
+_UNSIGNED_CODES = {1: 'B', 2: 'H', 4: _UINT32, 8: 'Q'}
+assert all(array(code).itemsize == width for codes in (_SIGNED_CODES, _UNSIGNED_CODES)
+           for width, code in codes.items())
 
-        for student in students:
-            grades_str = [str(g) for g in student.grades]
-            padded_grades = grades_str + [''] * (max_grades - len(grades_str))
-            row = [str(student.student_id), student.name] + padded_grades
-            writer.writerow(row)
+def _to_little_endian(values: array) -> array:
+    
+    """Приведение массива к порядку байт little-endian формата снимка"""
+    
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+def _narrow_table(values: List[int], signed: bool) -> array:
+    
+    """Таблица целых в самом узком типе (1, 2, 4 или 8 байт), в который помещаются все значения"""
+    
+    low, high = (min(values), max(values)) if values else (0, 0)
+    codes = _SIGNED_CODES if signed else _UNSIGNED_CODES
+    for width in (1, 2, 4):
+        bound = 1 << (width * 8 - 1 if signed else width * 8)
+        if high < bound and low >= (-bound if signed else 0):
+            return array(codes[width], values)
+    return array(codes[8], values)
+
+def save_snapshot(filepath: str, students: Iterable[Student]):
+    
+    """
+    Сохраняет студентов в компактный бинарный снимок
+    Формат (little-endian): заголовок, таблица id, таблица длин имен, таблица числа оценок,
+    имена в UTF-8 подряд, оценки по байту подряд. Каждая таблица хранится в самом узком
+    целом типе, который вмещает ее значения (ширина записана в заголовке)
+    Снимок пишется во временный файл и атомарно заменяет прежний, поэтому сбой
+    при записи не портит существующий снимок
+    :param filepath: путь к файлу для сохранения
+    :param students: студенты для сохранения
+    """
+    
+    if not isinstance(students, Collection):
+        students = list(students)
+
+    encoded_names = [s.name.encode('utf-8') for s in students]
+    tables = (
+        _narrow_table([s.student_id for s in students], signed=True),
+        _narrow_table(list(map(len, encoded_names)), signed=False),
+        _narrow_table([len(s.grades) for s in students], signed=False),
+    )
+    grades = array('B', chain.from_iterable(s.grades for s in students))
+    names = b''.join(encoded_names)
+
+    directory, name = os.path.split(os.path.abspath(filepath))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+    try:
+        with open(fd, 'wb') as file:
+            file.write(_SNAPSHOT_HEADER.pack(
+                SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(students), len(names), len(grades),
+                *(table.itemsize for table in tables)
+            ))
+            for table in tables:
+                file.write(_to_little_endian(table).tobytes())
+            file.write(names)
+            file.write(grades.tobytes())
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class SnapshotStudents(Sequence):
+    
+    """
+    Студенты бинарного снимка (см. load_snapshot) в виде последовательности только для чтения
+    Таблицы снимка хранятся в array, объект Student создается только при обращении
+    к элементу, поэтому загрузка не зависит от стоимости создания объектов
+    """
+    
+    def __init__(self, filepath: str, ids: array, name_offsets: array, names: bytes,
+                 grade_offsets: array, grades: array):
+        self._filepath = filepath
+        self._ids = ids
+        self._name_offsets = name_offsets
+        self._names = names
+        self._grade_offsets = grade_offsets
+        self._grades = grades
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _student(self, index: int) -> Student:
+        
+        """
+        Создание студента с позицией index
+        :raises DataValidationError: если имя не в кодировке UTF-8
+        """
+        
+        try:
+            name = self._names[self._name_offsets[index]:self._name_offsets[index + 1]].decode('utf-8')
+        except UnicodeDecodeError:
+            raise DataValidationError(f"Снимок '{self._filepath}' поврежден: имя не в кодировке UTF-8")
+        grades = self._grades[self._grade_offsets[index]:self._grade_offsets[index + 1]].tolist()
+        return Student(id=self._ids[index], name=name, grades=grades)
+
+    def __getitem__(self, index):
+        
+        """Студент по позиции (срез - список студентов)"""
+        
+        if isinstance(index, slice):
+            return [self._student(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("snapshot index out of range")
+        return self._student(index)
 
-def export_top_students_to_csv(filepath: str, students: List[Student], n: int):
+    def __iter__(self) -> Iterator[Student]:
+        return map(self._student, range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"SnapshotStudents('{self._filepath}', {len(self)} студентов)"
+
+
+def load_snapshot(filepath: str) -> SnapshotStudents:
     
     """
-    Сортирует студентов по убыванию среднего балла и экспортирует N лучших в csv файл
+    Загрузка студентов из бинарного снимка (см. save_snapshot)
+    Файл отображается в память через mmap, таблицы копируются целиком без разбора строк
+    и без повторной валидации значений. Объекты Student создаются лениво при обращении
+    :param filepath: путь к файлу снимка
+    :return: последовательность студентов снимка
+    :raises FileNotFoundError: если файл не найден
+    :raises DataValidationError: если файл не является снимком или поврежден
+    """
+    
+    try:
+        file = open(filepath, 'rb')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Ошибка: файл '{filepath}' не найден")
+
+    with file:
+        size = os.fstat(file.fileno()).st_size
+        if size < _SNAPSHOT_HEADER.size:
+            raise DataValidationError(f"Файл '{filepath}' не является снимком студентов")
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            magic, version, count, names_size, grades_size, *widths = _SNAPSHOT_HEADER.unpack_from(buffer)
+            if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                raise DataValidationError(f"Файл '{filepath}' не является снимком студентов")
+            if any(width not in _SIGNED_CODES for width in widths):
+                raise DataValidationError(f"Снимок '{filepath}' поврежден")
+            expected_size = _SNAPSHOT_HEADER.size + count * sum(widths) + names_size + grades_size
+            if size != expected_size:
+                raise DataValidationError(f"Снимок '{filepath}' поврежден")
+
+            with memoryview(buffer) as view:
+                position = _SNAPSHOT_HEADER.size
+                tables = []
+                for codes, width in zip((_SIGNED_CODES, _UNSIGNED_CODES, _UNSIGNED_CODES), widths):
+                    table = array(codes[width])
+                    table.frombytes(view[position:position + count * width])
+                    tables.append(_to_little_endian(table))
+                    position += count * width
+                names = bytes(view[position:position + names_size])
+                position += names_size
+                grades = array('B')
+                grades.frombytes(view[position:position + grades_size])
+
+    ids, name_lengths, grade_counts = tables
+    name_offsets = array('Q', accumulate(name_lengths, initial=0))
+    grade_offsets = array('Q', accumulate(grade_counts, initial=0))
+    if name_offsets[-1] != names_size or grade_offsets[-1] != grades_size:
+        raise DataValidationError(f"Снимок '{filepath}' поврежден")
+    try:
+        # проверка кодировки всех имен сразу, без создания строк по одной
+        codecs.utf_8_decode(names, 'strict', True)
+    except UnicodeDecodeError:
+        raise DataValidationError(f"Снимок '{filepath}' поврежден: имя не в кодировке UTF-8")
+    return SnapshotStudents(filepath, ids, name_offsets, names, grade_offsets, grades)
+
+def export_top_students_to_csv(filepath: str, students: Iterable[Student], n: int):
+    
+    """
+    Отбирает N лучших студентов по убыванию среднего балла и экспортирует их в csv файл
+    Принимает и поток студентов (например, iter_students_from_csv), не загружая весь список
 
     :param filepath: путь к файлу для сохранения
-    :param students: список всех студентов
+    :param students: все студенты (список или любой итерируемый объект)
     :param n: количество лучших студентов для экспорта
     """
     
-    sorted_students = sorted(students, key=lambda s: (-s.average, s.name))
-    
-    top_n_students = sorted_students[:n]
+    top_n_students = get_top_students(students, n)
 
     with open(filepath, 'w', newline='', encoding='utf-8') as file:
         writer = csv.writer(file)
@@ -0,0 +1,228 @@
+import json
+import os
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional
+)
+from . import io_utils
+from . import processing
+from .roster import StudentRoster
+from .errors import (
+    StudentAppError,
+    StudentNotFoundError,
+    DuplicateStudentIdError,
+    DataValidationError
+)
+
+
+class StudentJournal:
+
+    """
+    Журналируемое хранение студентов: базовый файл (csv или снимок) плюс журнал изменений
+    Операции add_student/remove_student/update_grades проверяются, дописываются в конец журнала
+    и только затем применяются к реестру через lab.processing, поэтому сохранение занимает
+    O(изменений), а реестр в памяти не расходится с диском при ошибке записи.
+    Периодически журнал сжимается: база атомарно перезаписывается, журнал очищается,
+    так что сбой посреди сохранения не портит данные
+    """
+
+    def __init__(
+        self,
+        base_path: str,
+        journal_path: Optional[str] = None,
+        snapshot: bool = False,
+        compact_every: int = 1000,
+        has_header: bool = True
+    ):
+
+        """
+        Конструктор журнала
+        :param base_path: путь к базовому файлу
+        :param journal_path: путь к журналу (default: base_path + '.journal')
+        :param snapshot: хранить базу в бинарном снимке вместо csv
+        :param compact_every: после скольких записей журнал сжимается автоматически (0 - никогда)
+        :param has_header: есть ли строка заголовка в базовом csv файле (default=True)
+        """
+
+        self.base_path = str(base_path)
+        self.journal_path = journal_path or self.base_path + ".journal"
+        self.snapshot = snapshot
+        self.compact_every = compact_every
+        self.has_header = has_header
+        self.pending = 0
+
+    def load(self) -> StudentRoster:
+
+        """
+        Загрузка базы и применение журнала
+        Недописанная последняя запись журнала (сбой при записи) отрезается от файла,
+        поврежденная запись в середине журнала считается ошибкой, файл при этом не меняется
+        :return: реестр студентов в актуальном состоянии
+        :raises DataValidationError: если повреждена запись не в конце журнала
+        """
+
+        students = StudentRoster()
+        if os.path.exists(self.base_path):
+            if self.snapshot:
+                students.extend(io_utils.load_snapshot(self.base_path))
+            else:
+                students.extend(io_utils.iter_students_from_csv(self.base_path, has_header=self.has_header))
+
+        self.pending = 0
+        if not os.path.exists(self.journal_path):
+            return students
+
+        with open(self.journal_path, 'rb') as file:
+            lines = file.readlines()
+        records = []
+        valid_size = 0
+        for line_num, line in enumerate(lines, start=1):
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("недописанная запись")
+                records.append(json.loads(line))
+            except ValueError:
+                # сбой при записи может оборвать только последнюю запись
+                if line_num < len(lines):
+                    raise DataValidationError(
+                        f"Журнал '{self.journal_path}': запись {line_num} повреждена"
+                    )
+                print(f"Предупреждение: запись журнала {line_num} повреждена, журнал прочитан до нее")
+                with open(self.journal_path, 'r+b') as file:
+                    file.truncate(valid_size)
+                break
+            valid_size += len(line)
+
+        for record in records:
+            self._replay(students, record)
+            self.pending += 1
+        return students
+
+    @staticmethod
+    def _replay(students: StudentRoster, record: Dict[str, Any]):
+
+        """
+        Повторное применение записи журнала
+        Применение идемпотентно: если сбой случился после записи базы, но до очистки
+        журнала, повторное применение журнала к новой базе дает то же состояние
+        """
+
+        op = record["op"]
+        student_id = record["id"]
+        if op == "add":
+            student = students.get(student_id)
+            if student is None:
+                processing.add_student(students, record["name"], student_id)
+            else:
+                student.name = record["name"]
+                students.set_grades(student, [])
+        elif op == "remove":
+            if student_id in students:
+                processing.remove_student(students, student_id)
+        elif op == "update_grades":
+            if student_id in students:
+                processing.update_grades(student_id, record["grades"], students)
+        else:
+            raise StudentAppError(f"Неизвестная операция журнала '{op}'")
+
+    def _append(self, record: Dict[str, Any]):
+
+        """Дописывает запись в журнал на диск"""
+
+        with open(self.journal_path, 'a', encoding='utf-8') as file:
+            file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+        self.pending += 1
+
+    def _maybe_compact(self, students: StudentRoster):
+
+        """Сжатие журнала, если в нем накопилось compact_every записей"""
+
+        if self.compact_every and self.pending >= self.compact_every:
+            self.compact(students)
+
+    def add_student(self, students: StudentRoster, name: str, student_id: int):
+
+        """
+        Добавление студента (см. processing.add_student) с записью в журнал
+        :raises DuplicateStudentIdError: если студент с таким id уже существует
+        """
+
+        if student_id in students:
+            raise DuplicateStudentIdError(f"Студент с id {student_id} уже существует")
+        self._append({"op": "add", "id": student_id, "name": name})
+        processing.add_student(students, name, student_id)
+        self._maybe_compact(students)
+
+    def remove_student(self, students: StudentRoster, student_id: int):
+
+        """
+        Удаление студента (см. processing.remove_student) с записью в журнал
+        :raises StudentNotFoundError: если студент с таким id не найден
+        """
+
+        if student_id not in students:
+            raise StudentNotFoundError(f"Студент с ID {student_id} не найден")
+        self._append({"op": "remove", "id": student_id})
+        processing.remove_student(students, student_id)
+        self._maybe_compact(students)
+
+    def update_grades(self, student_id: int, new_grades: List[int], students: StudentRoster):
+
+        """
+        Обновление оценок (см. processing.update_grades) с записью в журнал
+        :raises StudentNotFoundError: если студент с таким id не найден
+        :raises DataValidationError: если оценки некорректны
+        """
+
+        if student_id not in students:
+            raise StudentNotFoundError(f"Студент с ID {student_id} не найден")
+        processing.validate_grades(new_grades)
+        self._append({"op": "update_grades", "id": student_id, "grades": list(new_grades)})
+        processing.update_grades(student_id, new_grades, students)
+        self._maybe_compact(students)
+
+    def compact(self, students: StudentRoster):
+
+        """
+        Сжатие журнала: база записывается во временный файл и атомарно заменяет старую,
+        после этого журнал очищается (если он есть)
+        """
+
+        tmp_path = self.base_path + ".tmp"
+        if self.snapshot:
+            io_utils.save_snapshot(tmp_path, students)
+        else:
+            io_utils.save_students_to_csv(tmp_path, students, has_header=self.has_header)
+        with open(tmp_path, 'rb') as file:
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.base_path)
+        _fsync_dir(os.path.dirname(os.path.abspath(self.base_path)))
+
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'w', encoding='utf-8') as file:
+                file.flush()
+                os.fsync(file.fileno())
+        self.pending = 0
+
+
+def _fsync_dir(path: str):
+
+    """
+    Сброс на диск записи каталога, чтобы переименование файла пережило сбой
+    На платформах, где каталог нельзя открыть (Windows), ничего не делает
+    """
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
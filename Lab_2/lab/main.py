@@ -1,5 +1,9 @@
-from typing import List, Optional
+import os
+from itertools import islice
+from typing import Iterator, List, Optional
 from .models import Student
+from .roster import StudentRoster
+from .journal import StudentJournal
 from . import io_utils
 from . import processing
 from .errors import (
@@ -10,41 +14,83 @@ from .errors import (
     DataValidationError
 )
 
+PAGE_SIZE = 20
+
 def handle_load_students(students: List[Student]) -> List[Student]:
     
-    """Загрузка студентов из файла"""
+    """
+    Загрузка студентов из файла
+    Если рядом с файлом есть журнал изменений (см. handle_save_students), он применяется к данным
+    """
     
     filepath = input("Введите путь к CSV файлу для загрузки: ").strip()
     header_choice = input("В файле есть заголовок (y/n): ").strip().lower()
     has_header = (header_choice == 'y')
     try:
-        loaded_students = io_utils.load_students_from_csv(filepath, has_header=has_header)
+        journal = StudentJournal(filepath, has_header=has_header)
+        if os.path.exists(journal.journal_path):
+            loaded_students = journal.load()
+        else:
+            loaded_students = io_utils.load_students_from_csv(filepath, has_header=has_header)
         print(f"Загружено {len(loaded_students)} студентов")
-        return loaded_students
+        return StudentRoster(loaded_students)
     except FileNotFoundError as e:
         print(f"Ошибка: не удалось загрузить файл: {e}")
     except Exception as e:
         print(f"Произошла непредвиденная ошибка: {e}")
     return students
 
-def handle_save_students(students: List[Student]):
+def handle_save_students(
+    students: List[Student],
+    journal: Optional[StudentJournal] = None
+) -> Optional[StudentJournal]:
     
-    """Сохранение студентов в файл"""
+    """
+    Сохранение студентов в файл
+    Файл записывается целиком атомарно (через StudentJournal.compact), после чего
+    для него ведется журнал: дальнейшие изменения дописываются в журнал по мере внесения,
+    и повторное сохранение в тот же файл не перезаписывает его
+    :param journal: журнал текущего файла сохранения или None
+    :return: журнал файла, в который сохранены данные (или прежний журнал при ошибке)
+    """
     
     if not students:
         print("Список студентов пуст")
-        return
+        return journal
 
     filepath = input("Введите путь к CSV файлу для сохранения: ").strip()
     header_choice = input("В файле есть заголовок (y/n): ").strip().lower()
     has_header = (header_choice == 'y')
+    if journal is not None and journal.base_path == filepath and journal.has_header == has_header:
+        print(f"Изменения уже записаны в журнал '{journal.journal_path}'")
+        return journal
     try:
-        io_utils.save_students_to_csv(filepath, students, has_header=has_header)
+        new_journal = StudentJournal(filepath, has_header=has_header)
+        new_journal.compact(students)
         print(f"Данные сохранены в файл '{filepath}'")
+        print(f"Дальнейшие изменения записываются в журнал '{new_journal.journal_path}'")
+        return new_journal
     except IOError as e:
         print(f"Ошибка: Не удалось сохранить файл: {e}")
     except Exception as e:
         print(f"Произошла непредвиденная ошибка: {e}")
+    return journal
+
+def print_paged(students: Iterator[Student], total: int, page_size: int = PAGE_SIZE):
+    
+    """
+    Постраничный вывод студентов из итератора
+    Студенты выводятся по мере обхода, после каждой страницы (кроме последней) - запрос продолжения
+    """
+    
+    pages = processing.get_page_count(total, page_size)
+    for page in range(1, pages + 1):
+        for s in islice(students, page_size):
+            print(s)
+        if page < pages:
+            choice = input(f"Страница {page} из {pages}. Enter - следующая, q - выход: ").strip().lower()
+            if choice == 'q':
+                break
 
 def handle_show_all(students: List[Student]):
     
@@ -54,19 +100,21 @@ def handle_show_all(students: List[Student]):
     if not students:
         print("Список студентов пуст")
     else:
-        for s in students:
-            print(s)
+        print_paged(iter(students), len(students))
     print("---------------------------")
 
-def handle_add_student(students: List[Student]):
+def handle_add_student(students: List[Student], journal: Optional[StudentJournal] = None):
     
-    """Добавление нового студента"""
+    """Добавление нового студента (при активном журнале - с записью в журнал)"""
     
     try:
         student_id_str = input("Введите id: ").strip()
         student_id = int(student_id_str)
         name = input("Введите ФИО: ").strip()
-        processing.add_student(students, name, student_id)
+        if journal is not None:
+            journal.add_student(students, name, student_id)
+        else:
+            processing.add_student(students, name, student_id)
         print(f"Студент '{name}' с id {student_id} добавлен")
 
     except ValueError:
@@ -76,14 +124,17 @@ def handle_add_student(students: List[Student]):
     except StudentAppError as e:
         print(f"Ошибка: {e}")
 
-def handle_remove_student(students: List[Student]):
+def handle_remove_student(students: List[Student], journal: Optional[StudentJournal] = None):
 
-    """Удаление студента по id"""
+    """Удаление студента по id (при активном журнале - с записью в журнал)"""
 
     try:
         student_id_str = input("Введите id студента для удаления: ").strip()
         student_id = int(student_id_str)
-        processing.remove_student(students, student_id)
+        if journal is not None:
+            journal.remove_student(students, student_id)
+        else:
+            processing.remove_student(students, student_id)
         print(f"Студент с id {student_id} удален")
 
     except ValueError:
@@ -93,9 +144,9 @@ def handle_remove_student(students: List[Student]):
     except StudentAppError as e:
         print(f"Ошибка: {e}")
 
-def handle_update_grades(students: List[Student]):
+def handle_update_grades(students: List[Student], journal: Optional[StudentJournal] = None):
     
-    """Обновление оценок студента"""
+    """Обновление оценок студента (при активном журнале - с записью в журнал)"""
     
     try:
         student_id_str = input("Введите id студента: ").strip()
@@ -113,7 +164,10 @@ def handle_update_grades(students: List[Student]):
         else:
             new_grades = [int(g) for g in grades_str.split()]
 
-        processing.update_grades(student_id, new_grades, students)
+        if journal is not None:
+            journal.update_grades(student_id, new_grades, students)
+        else:
+            processing.update_grades(student_id, new_grades, students)
         print(f"Оценки для студента с id {student_id} обновлены")
 
     except ValueError:
@@ -163,11 +217,10 @@ def handle_sort_students(students: List[Student]):
     sort_key = input("Введите ключ для сортировки [id, name, avg]: ").strip().lower()
 
     try:
-        sorted_list = processing.sort_students(students, sort_key)
+        sorted_students = processing.iter_sorted(students, sort_key)
         
         print(f"Студенты, отсортированные по '{sort_key}'")
-        for s in sorted_list:
-            print(s)
+        print_paged(sorted_students, len(students))
         print("---------------------------")
 
     except InvalidSortKeyError as e:
@@ -220,7 +273,8 @@ def print_menu():
     print("---------------------------")
 
 def main():    
-    students: List[Student] = []
+    students: StudentRoster = StudentRoster()
+    journal: Optional[StudentJournal] = None
     
     while True:
         print_menu()
@@ -230,17 +284,20 @@ def main():
             print("Завершение работы программы...")
             break
         elif choice == '1':
-            students = handle_load_students(students)
+            loaded_students = handle_load_students(students)
+            if loaded_students is not students:
+                # журнал относится к прежним данным
+                students, journal = loaded_students, None
         elif choice == '2':
-            handle_save_students(students)
+            journal = handle_save_students(students, journal)
         elif choice == '3':
             handle_show_all(students)
         elif choice == '4':
-            handle_add_student(students)
+            handle_add_student(students, journal)
         elif choice == '5':
-            handle_remove_student(students) 
+            handle_remove_student(students, journal) 
         elif choice == '6':
-            handle_update_grades(students)
+            handle_update_grades(students, journal)
         elif choice == '7':
             handle_show_statistics(students) 
         elif choice == '8':
@@ -1,4 +1,74 @@
-from typing import List
+from array import array
+from typing import Iterable, List
+
+class GradeList(list):
+    
+    """
+    Список оценок, который поддерживает сумму оценок при изменениях на месте
+    Нужен для average за O(1): append, extend, pop, присваивание по индексу и т.п.
+    сразу обновляют total
+    """
+
+    __slots__ = ('total',)
+
+    def __init__(self, grades: Iterable[int] = ()):
+        super().__init__(grades)
+        self.total = sum(self)
+
+    def __reduce__(self):
+        
+        """Сериализация (pickle, copy) как обычного списка с пересчетом суммы"""
+        
+        return (GradeList, (list(self),))
+
+    def append(self, grade: int):
+        super().append(grade)
+        self.total += grade
+
+    def extend(self, grades: Iterable[int]):
+        grades = list(grades)
+        super().extend(grades)
+        self.total += sum(grades)
+
+    def __iadd__(self, grades: Iterable[int]) -> "GradeList":
+        self.extend(grades)
+        return self
+
+    def __imul__(self, count: int) -> "GradeList":
+        super().__imul__(count)
+        self.total = sum(self)
+        return self
+
+    def insert(self, index: int, grade: int):
+        super().insert(index, grade)
+        self.total += grade
+
+    def pop(self, index: int = -1) -> int:
+        grade = super().pop(index)
+        self.total -= grade
+        return grade
+
+    def remove(self, grade: int):
+        super().remove(grade)
+        self.total -= grade
+
+    def clear(self):
+        super().clear()
+        self.total = 0
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            super().__setitem__(index, value)
+            self.total = sum(self)
+        else:
+            old = self[index]
+            super().__setitem__(index, value)
+            self.total += value - old
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self.total = sum(self)
+
 
 class Student:
     
@@ -16,6 +86,24 @@ class Student:
         else:
             self.grades = grades
 
+    @property
+    def grades(self) -> GradeList:
+        
+        """Список оценок студента"""
+        
+        return self._grades
+
+    @grades.setter
+    def grades(self, grades: Iterable[int]):
+        
+        """
+        Замена оценок студента с пересчетом суммы для average
+        Сохраняется копия (GradeList), поэтому изменения исходного списка на average не влияют,
+        а изменения на месте через student.grades (append и т.п.) сразу учитываются
+        """
+        
+        self._grades = GradeList(grades)
+
     def __repr__(self) -> str:
         
         """Строковое представление объекта"""
@@ -34,11 +122,87 @@ class Student:
     def average(self) -> float:
         
         """
-        Рассчитывает средний балл студента
+        Средний балл студента за O(1) по сохраненной сумме оценок
         Возвращает 0.0 если список оценок пуст
         """
 
         
-        if not self.grades:
+        if not self._grades:
+            return 0.0
+        return self._grades.total / len(self._grades)
+
+
+class CompactStudent:
+    
+    """
+    Компактная модель студента для больших объемов данных
+    Без __dict__ (__slots__), оценки хранятся в array('B') по байту на оценку
+    Поддерживает тот же интерфейс: student_id, name, grades, average
+    """
+
+    __slots__ = ('student_id', 'name', '_grades', '_grade_sum')
+
+    def __init__(self, id: int, name: str, grades: Iterable[int] = None):
+        
+        """Конструктор для создания объекта студента"""
+        
+        self.student_id = id
+        self.name = name
+        self.grades = grades if grades is not None else ()
+
+    @property
+    def grades(self) -> array:
+        
+        """Оценки студента (array('B'), сравнивать со списком через list(grades))"""
+        
+        return self._grades
+
+    @grades.setter
+    def grades(self, grades: Iterable[int]):
+        
+        """
+        Замена оценок студента с пересчетом суммы для average
+        :raises OverflowError: если оценка не помещается в байт
+        """
+        
+        self._grades = array('B', grades)
+        self._grade_sum = sum(self._grades)
+
+    @classmethod
+    def from_student(cls, student: Student) -> "CompactStudent":
+        
+        """Создание компактной копии обычного студента"""
+        
+        return cls(id=student.student_id, name=student.name, grades=student.grades)
+
+    def to_student(self) -> Student:
+        
+        """Преобразование в обычную модель Student"""
+        
+        return Student(id=self.student_id, name=self.name, grades=self._grades.tolist())
+
+    def __repr__(self) -> str:
+        
+        """Строковое представление объекта (как у Student)"""
+        
+        return f"Student(id={self.student_id}, name='{self.name}', grades={self._grades.tolist()})"
+
+    def __eq__(self, other) -> bool:
+        
+        """Сравнение студентов на равенство по id"""
+        
+        if not isinstance(other, (Student, CompactStudent)):
+            return NotImplemented
+        return self.student_id == other.student_id
+
+    @property
+    def average(self) -> float:
+        
+        """
+        Средний балл студента за O(1) по сохраненной сумме оценок
+        Возвращает 0.0 если список оценок пуст
+        """
+
+        if not self._grades:
             return 0.0
-        return sum(self.grades) / len(self.grades)
\ No newline at end of file
+        return self._grade_sum / len(self._grades)
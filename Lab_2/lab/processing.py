@@ -1,15 +1,27 @@
+import heapq
+from itertools import islice
 from typing import (
+    Iterable,
+    Iterator,
     List, 
     Optional, 
     Dict, 
-    Any
+    Any,
+    Mapping,
+    Tuple,
+    Union
 )
 from .models import Student
+from .indexes import SORT_KEYS, AverageDistribution
+from .roster import StudentRoster
+from .stats import StatisticsAccumulator
 from .errors import (
     StudentNotFoundError,
     DuplicateStudentIdError,
     InvalidSortKeyError,
-    DataValidationError
+    InvalidPageError,
+    DataValidationError,
+    BatchOperationError
 )
 
 
@@ -17,10 +29,13 @@ def find_student_by_id(students: List[Student], student_id: int) -> Optional[Stu
     
     """
     Поиск студента в списке по его id
+    Для StudentRoster поиск выполняется по индексу за O(1)
     :param students: список студентов для поиска
     :param student_id: id искомого студента
     """
     
+    if isinstance(students, StudentRoster):
+        return students.get(student_id)
     for student in students:
         if student.student_id == student_id:
             return student
@@ -50,11 +65,37 @@ def remove_student(students: List[Student], student_id: int):
     :raises StudentNotFoundError: если студент с таким id не найден
     """
 
+    if isinstance(students, StudentRoster):
+        students.pop(student_id)
+        return
     student_to_remove = find_student_by_id(students, student_id)
     if student_to_remove is None:
         raise StudentNotFoundError(f"Студент с ID {student_id} не найден")
     students.remove(student_to_remove)
 
+def validate_grades(grades: Iterable[int]):
+    
+    """
+    Проверка, что все оценки - целые числа от 0 до 100
+    bool - подкласс int, но True/False (например, из JSON) оценками не считаются
+    :raises DataValidationError: при первой некорректной оценке
+    """
+    
+    for grade in grades:
+        if not isinstance(grade, int) or isinstance(grade, bool) or not (0 <= grade <= 100):
+            raise DataValidationError(
+                f"Ошибка: оценка '{grade}' не является целым числом от 0 до 100"
+            )
+
+def _set_grades(students: List[Student], student: Student, new_grades: List[int]):
+    
+    """Замена оценок студента (для StudentRoster - через реестр, чтобы сбросить кэш представлений)"""
+    
+    if isinstance(students, StudentRoster):
+        students.set_grades(student, new_grades)
+    else:
+        student.grades = new_grades
+
 def update_grades(student_id: int, new_grades: List[int], students: List[Student]):
     
     """
@@ -65,12 +106,141 @@ def update_grades(student_id: int, new_grades: List[int], students: List[Student
     student_to_update = find_student_by_id(students, student_id)
     if student_to_update is None:
         raise StudentNotFoundError(f"Студент с ID {student_id} не найден")
-    for grade in new_grades:
-        if not isinstance(grade, int) or not (0 <= grade <= 100):
-            raise DataValidationError(
-                f"Ошибка: оценка '{grade}' не является целым числом от 0 до 100"
-            )
-    student_to_update.grades = new_grades
+    validate_grades(new_grades)
+    _set_grades(students, student_to_update, new_grades)
+
+def _index_by_id(students: List[Student]) -> Mapping[int, Student]:
+    
+    """Индекс id -> Student (для StudentRoster используется его собственный индекс)"""
+    
+    if isinstance(students, StudentRoster):
+        return students
+    return {student.student_id: student for student in students}
+
+def _batch_result(student_id: int, error: Optional[Exception] = None) -> Dict[str, Any]:
+    
+    """Элемент отчета пакетной операции"""
+    
+    return {"student_id": student_id, "ok": error is None, "error": str(error) if error else None}
+
+def _check_batch(results: List[Dict[str, Any]]):
+    
+    """
+    Проверка отчета пакетной операции перед применением
+    :raises BatchOperationError: если хотя бы один элемент пакета некорректен
+    """
+    
+    failed = sum(1 for result in results if not result["ok"])
+    if failed:
+        raise BatchOperationError(
+            f"Пакет не применен: ошибок {failed} из {len(results)}", results
+        )
+
+def _claim_batch_id(student_id: int, batch_ids: set):
+    
+    """
+    Учет id элемента пакета (повтор проверяется раньше остальных ошибок элемента)
+    :raises DuplicateStudentIdError: если id уже встречался в этом пакете
+    """
+    
+    if student_id in batch_ids:
+        raise DuplicateStudentIdError(f"ID {student_id} повторяется в пакете")
+    batch_ids.add(student_id)
+
+def add_students(students: List[Student], new_students: Iterable[Student]) -> List[Dict[str, Any]]:
+    
+    """
+    Пакетное добавление студентов по принципу "все или ничего"
+    Весь пакет проверяется заранее (повторы id в пакете, дубликаты id в списке, оценки), затем добавляется за один проход
+    :param students: список студентов
+    :param new_students: добавляемые студенты
+    :return: отчет по каждому студенту [{student_id, ok, error}]
+    :raises BatchOperationError: если хотя бы один студент не может быть добавлен или id повторяется (в исключении - отчет)
+    """
+    
+    new_students = list(new_students)
+    index = _index_by_id(students)
+    batch_ids = set()
+    results = []
+    for student in new_students:
+        try:
+            _claim_batch_id(student.student_id, batch_ids)
+            if student.student_id in index:
+                raise DuplicateStudentIdError(f"Студент с id {student.student_id} уже существует")
+            validate_grades(student.grades)
+            results.append(_batch_result(student.student_id))
+        except (DuplicateStudentIdError, DataValidationError) as e:
+            results.append(_batch_result(student.student_id, e))
+    _check_batch(results)
+
+    students.extend(new_students)
+    return results
+
+def remove_students(students: List[Student], student_ids: Iterable[int]) -> List[Dict[str, Any]]:
+    
+    """
+    Пакетное удаление студентов по id по принципу "все или ничего"
+    Для списка удаление выполняется за один проход вместо поиска и list.remove для каждого id
+    :param students: список студентов
+    :param student_ids: id удаляемых студентов
+    :return: отчет по каждому id [{student_id, ok, error}]
+    :raises BatchOperationError: если хотя бы один id не найден или повторяется (в исключении - отчет)
+    """
+    
+    student_ids = list(student_ids)
+    index = _index_by_id(students)
+    batch_ids = set()
+    results = []
+    for student_id in student_ids:
+        try:
+            _claim_batch_id(student_id, batch_ids)
+            if student_id not in index:
+                raise StudentNotFoundError(f"Студент с ID {student_id} не найден")
+            results.append(_batch_result(student_id))
+        except (DuplicateStudentIdError, StudentNotFoundError) as e:
+            results.append(_batch_result(student_id, e))
+    _check_batch(results)
+
+    if isinstance(students, StudentRoster):
+        for student_id in student_ids:
+            students.pop(student_id)
+    else:
+        students[:] = [s for s in students if s.student_id not in batch_ids]
+    return results
+
+def update_grades_bulk(
+    students: List[Student],
+    updates: Union[Mapping[int, List[int]], Iterable[Tuple[int, List[int]]]]
+) -> List[Dict[str, Any]]:
+    
+    """
+    Пакетное обновление оценок по принципу "все или ничего"
+    :param students: список студентов
+    :param updates: словарь id -> оценки или пары (id, оценки)
+    :return: отчет по каждому обновлению [{student_id, ok, error}]
+    :raises BatchOperationError: если хотя бы одно обновление некорректно или id повторяется (в исключении - отчет)
+    """
+    
+    if isinstance(updates, Mapping):
+        updates = updates.items()
+    updates = list(updates)
+    index = _index_by_id(students)
+    batch_ids = set()
+    results = []
+    for student_id, new_grades in updates:
+        try:
+            _claim_batch_id(student_id, batch_ids)
+            if student_id not in index:
+                raise StudentNotFoundError(f"Студент с ID {student_id} не найден")
+            validate_grades(new_grades)
+            results.append(_batch_result(student_id))
+        except (DuplicateStudentIdError, StudentNotFoundError, DataValidationError) as e:
+            results.append(_batch_result(student_id, e))
+    _check_batch(results)
+
+    for student_id, new_grades in updates:
+        _set_grades(students, index.get(student_id), new_grades)
+    return results
 
 def get_student_count(students: List[Student]) -> int:
     
@@ -83,10 +253,14 @@ def get_overall_average(students: List[Student]) -> float:
     
     """Cредний балл по всем оценкам всех студентов"""
     
-    all_grades = [grade for student in students for grade in student.grades]
-    if not all_grades:
+    grade_sum = 0
+    grade_count = 0
+    for student in students:
+        grade_sum += sum(student.grades)
+        grade_count += len(student.grades)
+    if not grade_count:
         return 0.0
-    return sum(all_grades) / len(all_grades)
+    return grade_sum / grade_count
 
 
 def get_best_student(students: List[Student]) -> Optional[Student]:
@@ -112,39 +286,187 @@ def get_worst_student(students: List[Student]) -> Optional[Student]:
         return None
     return min(students, key=lambda student: student.average)
 
-def get_full_statistics(students: List[Student]) -> Dict[str, Any]:
+def get_full_statistics(students: Iterable[Student], extended: bool = False) -> Dict[str, Any]:
     
     """
-    Сбор полной статистики по группе
-    :param students: список студентов для анализа
+    Сбор полной статистики по группе за один проход
+    :param students: студенты для анализа (список или любой итерируемый объект)
+    :param extended: добавить min_grade, max_grade, stddev и median по всем оценкам
     """
     
-    count = get_student_count(students)
-    overall_avg = get_overall_average(students)
-    best_student = get_best_student(students)
-    worst_student = get_worst_student(students)
-    
-    return {
-        "count": count,
-        "overall_average": overall_avg,
-        "best_student": best_student,
-        "worst_student": worst_student
-    }
+    return StatisticsAccumulator(extended=extended).update(students).result()
 
 def sort_students(students: List[Student], sort_by: str) -> List[Student]:
     
     """
     Сортировка список студентов по указанному ключу
+    Для StudentRoster используется закэшированное отсортированное представление
     :param students: список студентов для сортировки
     :param sort_by: ключ для сортировки ['id', 'name' или 'avg']
     :raises InvalidSortKeyError: если передан неверный ключ сортировки
     """
     
-    if sort_by == 'id':
-        return sorted(students, key=lambda student: student.student_id)
-    elif sort_by == 'name':
-        return sorted(students, key=lambda student: student.name)
-    elif sort_by == 'avg':
-        return sorted(students, key=lambda student: (-student.average, student.name))
-    else:
+    if isinstance(students, StudentRoster):
+        return list(students.iter_sorted(sort_by))
+    if sort_by not in SORT_KEYS:
         raise InvalidSortKeyError("Неверный ключ сортировки")
+    return sorted(students, key=SORT_KEYS[sort_by])
+
+def get_top_students(students: Iterable[Student], n: int) -> List[Student]:
+    
+    """
+    Выбор N лучших студентов по убыванию среднего балла (при равенстве - по имени)
+    Частичный отбор через кучу за O(n log N) вместо полной сортировки,
+    работает с любым итерируемым объектом, в том числе с потоком из csv
+    Результат совпадает с sort_students(students, 'avg')[:n]
+    :param students: студенты для отбора
+    :param n: количество лучших студентов
+    """
+    
+    return heapq.nsmallest(n, students, key=lambda student: (-student.average, student.name))
+
+def iter_sorted(students: List[Student], sort_by: str) -> Iterator[Student]:
+    
+    """
+    Итератор по студентам в порядке сортировки (как у sort_students)
+    Для StudentRoster обходится постоянный индекс или закэшированное отсортированное
+    представление без копирования, для списка - отсортированная копия
+    :raises InvalidSortKeyError: если передан неверный ключ сортировки
+    """
+    
+    if isinstance(students, StudentRoster):
+        return students.iter_sorted(sort_by)
+    return iter(sort_students(students, sort_by))
+
+def get_page(
+    students: List[Student],
+    page: int,
+    page_size: int,
+    sort_by: Optional[str] = None
+) -> Iterator[Student]:
+    
+    """
+    Ленивый обход одной страницы студентов
+    Без sort_by страница берется в исходном порядке, с sort_by - из отсортированного
+    представления (для StudentRoster - из индекса или кэша, страница читается за O(page_size))
+    :param students: список студентов
+    :param page: номер страницы (с 1)
+    :param page_size: количество студентов на странице
+    :param sort_by: ключ для сортировки ['id', 'name' или 'avg'] или None
+    :raises InvalidPageError: если номер или размер страницы меньше 1
+    :raises InvalidSortKeyError: если передан неверный ключ сортировки
+    """
+    
+    if page < 1 or page_size < 1:
+        raise InvalidPageError("Номер и размер страницы должны быть положительными")
+    start = (page - 1) * page_size
+    if sort_by is not None:
+        if isinstance(students, StudentRoster):
+            return iter(students.sorted_slice(sort_by, start, start + page_size))
+        return iter(sort_students(students, sort_by)[start:start + page_size])
+    if isinstance(students, list):
+        return iter(students[start:start + page_size])
+    return islice(students, start, start + page_size)
+
+def get_page_count(total: int, page_size: int) -> int:
+    
+    """
+    Количество страниц заданного размера для total студентов (не меньше одной)
+    :raises InvalidPageError: если размер страницы меньше 1
+    """
+    
+    if page_size < 1:
+        raise InvalidPageError("Номер и размер страницы должны быть положительными")
+    return max(1, -(-total // page_size))
+
+def get_student_rank(students: List[Student], student_id: int, sort_by: str = 'avg') -> int:
+    
+    """
+    Место студента (с 1) в порядке сортировки, как в sort_students
+    Для StudentRoster с индексом по ключу - за O(log n)
+    :raises StudentNotFoundError: если студент с таким id не найден
+    :raises InvalidSortKeyError: если передан неверный ключ сортировки
+    """
+    
+    if isinstance(students, StudentRoster):
+        return students.rank(student_id, sort_by)
+    for rank, student in enumerate(sort_students(students, sort_by), start=1):
+        if student.student_id == student_id:
+            return rank
+    raise StudentNotFoundError(f"Студент с ID {student_id} не найден")
+
+def _distribution(students: Iterable[Student]) -> AverageDistribution:
+    
+    """Распределение средних баллов: из реестра, если оно включено, иначе строится за один проход"""
+    
+    if isinstance(students, StudentRoster) and students.distribution is not None:
+        return students.distribution
+    return AverageDistribution(students)
+
+def get_average_rank(students: List[Student], student_id: int) -> int:
+    
+    """
+    Место студента по среднему баллу: 1 + число студентов с большим средним
+    (равные средние делят место, средние сравниваются с точностью до 0.01)
+    Для StudentRoster с track_distribution - за O(log), иначе за один проход без сортировки
+    :raises StudentNotFoundError: если студент с таким id не найден
+    """
+    
+    distribution = _distribution(students)
+    try:
+        return distribution.rank(student_id)
+    except KeyError:
+        raise StudentNotFoundError(f"Студент с ID {student_id} не найден")
+
+def get_percentile(students: List[Student], student_id: int) -> float:
+    
+    """
+    Процентиль студента: процент студентов со средним баллом не выше, чем у него
+    :raises StudentNotFoundError: если студент с таким id не найден
+    """
+    
+    distribution = _distribution(students)
+    try:
+        return distribution.percentile(student_id)
+    except KeyError:
+        raise StudentNotFoundError(f"Студент с ID {student_id} не найден")
+
+def get_students_between_percentiles(students: List[Student], low: float, high: float) -> List[Student]:
+    
+    """
+    Студенты с процентилем (см. get_percentile) от low до high включительно,
+    по убыванию среднего балла
+    :raises DataValidationError: если границы не удовлетворяют 0 <= low <= high <= 100
+    """
+    
+    if not 0 <= low <= high <= 100:
+        raise DataValidationError("Границы процентилей должны удовлетворять 0 <= low <= high <= 100")
+    return _distribution(students).between_percentiles(low, high)
+
+def _check_bucket_width(bucket_width: int):
+    
+    """Проверка ширины корзины гистограммы"""
+    
+    if not 1 <= bucket_width <= 100:
+        raise DataValidationError("Ширина корзины должна быть от 1 до 100")
+
+def get_average_histogram(students: List[Student], bucket_width: int = 10) -> List[Tuple[int, int, int]]:
+    
+    """
+    Гистограмма средних баллов: [(от, до, число студентов)], корзины [от, до),
+    последняя корзина включает 100
+    :raises DataValidationError: если ширина корзины не от 1 до 100
+    """
+    
+    _check_bucket_width(bucket_width)
+    return _distribution(students).average_histogram(bucket_width)
+
+def get_grade_histogram(students: List[Student], bucket_width: int = 10) -> List[Tuple[int, int, int]]:
+    
+    """
+    Гистограмма всех оценок: [(от, до, число оценок)], корзины как у get_average_histogram
+    :raises DataValidationError: если ширина корзины не от 1 до 100
+    """
+    
+    _check_bucket_width(bucket_width)
+    return _distribution(students).grade_histogram(bucket_width)
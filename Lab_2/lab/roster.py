@@ -0,0 +1,299 @@
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple
+)
+from .models import Student
+from .indexes import SORT_KEYS, AverageDistribution, SortedIndex
+from .errors import (
+    DuplicateStudentIdError,
+    StudentNotFoundError,
+    InvalidSortKeyError
+)
+
+
+class StudentRoster:
+
+    """
+    Контейнер студентов с хеш-индексом id -> Student
+    Сохраняет порядок добавления, поиск, вставка и удаление по id за O(1)
+    Поддерживает интерфейс списка, который используют функции lab.processing
+    Любое изменение через методы реестра увеличивает version и сбрасывает кэш
+    отсортированных представлений, поэтому оценки студентов реестра нужно менять
+    через set_grades (так делает processing.update_grades), а не присваиванием
+    Для часто используемых ключей сортировки можно включить постоянные индексы
+    (indexed_keys), которые обновляются при каждом изменении за O(log n)
+    Распределение средних баллов (track_distribution) отвечает на вопросы о месте,
+    процентиле и гистограмме без сортировки
+    """
+
+    def __init__(
+        self,
+        students: Optional[Iterable[Student]] = None,
+        indexed_keys: Iterable[str] = (),
+        track_distribution: bool = False
+    ):
+
+        """
+        Конструктор для создания реестра
+        :param students: начальные студенты (в порядке добавления)
+        :param indexed_keys: ключи сортировки с постоянными индексами ('id', 'name', 'avg')
+        :param track_distribution: поддерживать распределение средних баллов (см. distribution)
+        :raises DuplicateStudentIdError: если среди студентов есть дубликаты id
+        :raises InvalidSortKeyError: если передан неверный ключ сортировки
+        """
+
+        self._by_id: Dict[int, Student] = {}
+        # кэш представлений: ключ сортировки -> студенты в этом порядке, None - порядок добавления
+        self._views: Dict[Optional[str], Tuple[Student, ...]] = {}
+        self._indexes: Dict[str, SortedIndex] = {}
+        self.distribution: Optional[AverageDistribution] = None
+        self.version = 0
+        if students is not None:
+            for student in students:
+                self.append(student)
+        for sort_by in indexed_keys:
+            self.add_index(sort_by)
+        if track_distribution:
+            self.enable_distribution()
+
+    def __len__(self) -> int:
+
+        """Количество студентов в реестре"""
+
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[Student]:
+
+        """Обход студентов в порядке добавления"""
+
+        return iter(self._by_id.values())
+
+    def __contains__(self, item) -> bool:
+
+        """Проверка наличия студента (объекта Student или id)"""
+
+        return getattr(item, 'student_id', item) in self._by_id
+
+    def __getitem__(self, index):
+
+        """
+        Доступ по позиции как у списка
+        Позиции берутся из закэшированного кортежа в порядке добавления: первое обращение
+        после изменения реестра строит его за O(n), следующие работают за O(1)
+        Для поиска по id используйте get
+        """
+
+        view = self._views.get(None)
+        if view is None:
+            view = self._views[None] = tuple(self._by_id.values())
+        if isinstance(index, slice):
+            return list(view[index])
+        return view[index]
+
+    def __bool__(self) -> bool:
+
+        """Реестр истинен, если в нем есть хотя бы один студент"""
+
+        return bool(self._by_id)
+
+    def __eq__(self, other) -> bool:
+
+        """Сравнение с другим реестром или списком студентов"""
+
+        if isinstance(other, StudentRoster):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+
+        """Строковое представление реестра (как у списка студентов)"""
+
+        return f"StudentRoster({list(self._by_id.values())})"
+
+    def get(self, student_id: int) -> Optional[Student]:
+
+        """Поиск студента по id, возвращает None если студент не найден"""
+
+        return self._by_id.get(student_id)
+
+    def append(self, student: Student):
+
+        """
+        Добавление студента в конец реестра
+        :raises DuplicateStudentIdError: если студент с таким id уже существует
+        """
+
+        if student.student_id in self._by_id:
+            raise DuplicateStudentIdError(
+                f"Студент с id {student.student_id} уже существует"
+            )
+        self._by_id[student.student_id] = student
+        for index in self._maintained():
+            index.add(student)
+        self._changed()
+
+    def extend(self, students: Iterable[Student]):
+
+        """Добавление нескольких студентов"""
+
+        for student in students:
+            self.append(student)
+
+    def pop(self, student_id: int) -> Student:
+
+        """
+        Удаление студента по id
+        :return: удаленный объект Student
+        :raises StudentNotFoundError: если студент с таким id не найден
+        """
+
+        try:
+            student = self._by_id.pop(student_id)
+        except KeyError:
+            raise StudentNotFoundError(f"Студент с ID {student_id} не найден")
+        for index in self._maintained():
+            index.remove(student)
+        self._changed()
+        return student
+
+    def remove(self, student: Student):
+
+        """
+        Удаление студента как у списка (студенты равны при равных id)
+        :raises ValueError: если студента нет в реестре
+        """
+
+        if student.student_id not in self._by_id:
+            raise ValueError("StudentRoster.remove(x): x not in roster")
+        self.pop(student.student_id)
+
+    def clear(self):
+
+        """Удаление всех студентов"""
+
+        self._by_id.clear()
+        for sort_by in self._indexes:
+            self._indexes[sort_by] = SortedIndex(sort_by)
+        if self.distribution is not None:
+            self.distribution = AverageDistribution()
+        self._changed()
+
+    def ids(self) -> List[int]:
+
+        """Список id студентов в порядке добавления"""
+
+        return list(self._by_id)
+
+    def _maintained(self) -> list:
+
+        """Индексы, которые обновляются при каждом изменении реестра"""
+
+        if self.distribution is None:
+            return list(self._indexes.values())
+        return [*self._indexes.values(), self.distribution]
+
+    def _changed(self):
+
+        """Отметка об изменении реестра: новая версия, кэш представлений сбрасывается"""
+
+        self.version += 1
+        self._views.clear()
+
+    def set_grades(self, student: Student, grades: List[int]):
+
+        """
+        Замена оценок студента реестра (без валидации, см. processing.update_grades)
+        :raises StudentNotFoundError: если студента нет в реестре
+        """
+
+        if self._by_id.get(student.student_id) is not student:
+            raise StudentNotFoundError(f"Студент с ID {student.student_id} не найден")
+        student.grades = grades
+        for index in self._maintained():
+            index.update(student)
+        self._changed()
+
+    def add_index(self, sort_by: str):
+
+        """
+        Включение постоянного отсортированного индекса по ключу
+        :raises InvalidSortKeyError: если передан неверный ключ сортировки
+        """
+
+        if sort_by not in self._indexes:
+            self._indexes[sort_by] = SortedIndex(sort_by, self._by_id.values())
+
+    def enable_distribution(self) -> AverageDistribution:
+
+        """
+        Включение распределения средних баллов (деревья Фенвика, см. AverageDistribution),
+        которое обновляется при каждом изменении реестра за O(log)
+        """
+
+        if self.distribution is None:
+            self.distribution = AverageDistribution(self._by_id.values())
+        return self.distribution
+
+    def sorted_view(self, sort_by: str) -> Sequence[Student]:
+
+        """
+        Студенты в порядке сортировки (как у processing.sort_students)
+        Результат кэшируется по ключу до следующего изменения реестра,
+        поэтому постраничный просмотр не сортирует список заново
+        :param sort_by: ключ для сортировки ['id', 'name' или 'avg']
+        :raises InvalidSortKeyError: если передан неверный ключ сортировки
+        """
+
+        if sort_by not in SORT_KEYS:
+            raise InvalidSortKeyError("Неверный ключ сортировки")
+        view = self._views.get(sort_by)
+        if view is None:
+            if sort_by in self._indexes:
+                view = tuple(self._indexes[sort_by])
+            else:
+                view = tuple(sorted(self._by_id.values(), key=SORT_KEYS[sort_by]))
+            self._views[sort_by] = view
+        return view
+
+    def iter_sorted(self, sort_by: str) -> Iterator[Student]:
+
+        """Обход студентов в порядке сортировки (по индексу, если он включен)"""
+
+        if sort_by in self._indexes:
+            return iter(self._indexes[sort_by])
+        return iter(self.sorted_view(sort_by))
+
+    def sorted_slice(self, sort_by: str, start: int, stop: int) -> List[Student]:
+
+        """
+        Студенты с позициями [start, stop) в порядке сортировки
+        С индексом - за O(stop - start) без построения представления
+        """
+
+        if sort_by in self._indexes:
+            return self._indexes[sort_by].slice(start, stop)
+        return list(self.sorted_view(sort_by)[start:stop])
+
+    def rank(self, student_id: int, sort_by: str = 'avg') -> int:
+
+        """
+        Место студента (с 1) в порядке сортировки
+        С индексом - за O(log n), без него - по кэшированному представлению
+        :raises StudentNotFoundError: если студент с таким id не найден
+        :raises InvalidSortKeyError: если передан неверный ключ сортировки
+        """
+
+        student = self._by_id.get(student_id)
+        if student is None:
+            raise StudentNotFoundError(f"Студент с ID {student_id} не найден")
+        if sort_by in self._indexes:
+            return self._indexes[sort_by].position(student_id) + 1
+        view = self.sorted_view(sort_by)
+        return next(i for i, s in enumerate(view, start=1) if s is student)
@@ -0,0 +1,304 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Tuple
+)
+from urllib.parse import parse_qs, urlsplit
+from . import processing
+from .models import Student
+from .roster import StudentRoster
+from .errors import (
+    StudentAppError,
+    StudentNotFoundError,
+    DuplicateStudentIdError
+)
+
+MAX_PAGE_SIZE = 1000
+
+
+class HttpError(Exception):
+
+    """Ошибка запроса с HTTP-статусом ответа"""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def student_to_json(student: Student) -> Dict[str, Any]:
+
+    """Представление студента в ответе"""
+
+    return {
+        "id": student.student_id,
+        "name": student.name,
+        "grades": list(student.grades),
+        "average": student.average
+    }
+
+
+def _int_param(query: Dict[str, list], name: str, default: int) -> int:
+
+    """Целочисленный параметр строки запроса"""
+
+    try:
+        return int(query.get(name, [default])[0])
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, f"Параметр '{name}' должен быть целым числом")
+
+
+class RosterServer:
+
+    """
+    Асинхронный HTTP/JSON сервер над реестром студентов
+    Данные загружаются один раз, соединения обслуживаются конкурентно в цикле событий.
+    Поиск по id выполняется прямо в цикле событий, тяжелые чтения (сортировка, ТОП-N,
+    статистика) - по очереди в отдельном потоке, чтобы не задерживать остальные запросы
+    (под GIL больше потоков не ускоряет вычисления, а одновременные промахи кэша
+    отсортированных представлений сортировали бы реестр несколько раз).
+    Изменения выполняются по одному в цикле событий и ждут завершения чтений в потоке,
+    новые чтения ждут ожидающих изменений, поэтому чтение не видит реестр в процессе изменения
+
+    GET    /students/{id}              - студент по id
+    GET    /students?sort=avg&page=1&page_size=20 - страница отсортированного списка
+    GET    /top?n=10                   - ТОП-N по среднему баллу
+    Отсортированные страницы и ТОП-N читаются из кэшированного представления реестра
+    GET    /stats                      - статистика по группе
+    POST   /students                   - добавить студента {"id": 1, "name": "..."}
+    PUT    /students/{id}/grades       - заменить оценки {"grades": [..]}
+    DELETE /students/{id}              - удалить студента
+    """
+
+    def __init__(self, students: StudentRoster):
+        self.students = students
+        self._state = asyncio.Condition()
+        self._readers = 0
+        self._writers_waiting = 0
+        self._reader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="roster-read")
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+
+        """Чтение одного запроса, None если клиент закрыл соединение"""
+
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        try:
+            method, target, version = request_line.decode('latin-1').split()
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Некорректная строка запроса")
+
+        headers = {"__version__": version}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get('content-length', 0) or 0)
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Некорректный Content-Length")
+        body = await reader.readexactly(length) if length else b''
+        return method.upper(), target, headers, body
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+
+        """Обслуживание соединения (поддерживается keep-alive)"""
+
+        try:
+            while True:
+                keep_alive = False
+                try:
+                    request = await self._read_request(reader)
+                    if request is None:
+                        break
+                    method, target, headers, body = request
+                    keep_alive = (
+                        headers["__version__"] == "HTTP/1.1"
+                        and headers.get('connection', '').lower() != 'close'
+                    )
+                    status, payload = await self.dispatch(method, target, body)
+                except HttpError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except Exception:
+                    # непредвиденная ошибка: клиент получает ответ, соединение закрывается
+                    keep_alive = False
+                    status = HTTPStatus.INTERNAL_SERVER_ERROR
+                    payload = {"error": "Внутренняя ошибка сервера"}
+
+                data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                writer.write(
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1')
+                    + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, method: str, target: str, body: bytes) -> Tuple[HTTPStatus, Any]:
+
+        """
+        Выполнение запроса
+        Ошибки приложения переводятся в HTTP-статусы (404, 409, 400)
+        """
+
+        url = urlsplit(target)
+        parts = [part for part in url.path.split('/') if part]
+        query = parse_qs(url.query)
+
+        try:
+            if method == 'GET':
+                if len(parts) == 2 and parts[0] == 'students':
+                    return HTTPStatus.OK, self._get(parts, query)
+                return HTTPStatus.OK, await self._run_read(self._get, parts, query)
+            if method in ('POST', 'PUT', 'DELETE'):
+                return await self._run_write(method, parts, body)
+        except StudentNotFoundError as e:
+            raise HttpError(HTTPStatus.NOT_FOUND, str(e))
+        except DuplicateStudentIdError as e:
+            raise HttpError(HTTPStatus.CONFLICT, str(e))
+        except StudentAppError as e:
+            raise HttpError(HTTPStatus.BAD_REQUEST, str(e))
+        raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, f"Метод {method} не поддерживается")
+
+    async def _run_read(self, func, *args) -> Any:
+
+        """Выполнение чтения в потоке чтений (после ожидающих изменений)"""
+
+        async with self._state:
+            await self._state.wait_for(lambda: not self._writers_waiting)
+            self._readers += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._reader, func, *args)
+        finally:
+            async with self._state:
+                self._readers -= 1
+                self._state.notify_all()
+
+    async def _run_write(self, method: str, parts: list, body: bytes) -> Tuple[HTTPStatus, Any]:
+
+        """Выполнение изменения в цикле событий, когда нет незавершенных чтений"""
+
+        async with self._state:
+            self._writers_waiting += 1
+            try:
+                await self._state.wait_for(lambda: not self._readers)
+                return self._write(method, parts, body)
+            finally:
+                self._writers_waiting -= 1
+                self._state.notify_all()
+
+    def _student_id(self, value: str) -> int:
+
+        """id студента из пути запроса"""
+
+        try:
+            return int(value)
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "id должен быть целым числом")
+
+    def _get(self, parts: list, query: Dict[str, list]) -> Any:
+
+        """Обработка запросов на чтение"""
+
+        if parts == ['stats']:
+            stats = processing.get_full_statistics(self.students)
+            for key in ('best_student', 'worst_student'):
+                if stats[key] is not None:
+                    stats[key] = student_to_json(stats[key])
+            return stats
+        if parts == ['top']:
+            n = _int_param(query, 'n', 10)
+            if n <= 0:
+                # как get_top_students: пустой ТОП, а не ошибка страницы
+                return []
+            return [student_to_json(s) for s in processing.get_page(self.students, 1, n, sort_by='avg')]
+        if parts == ['students']:
+            page = _int_param(query, 'page', 1)
+            page_size = min(_int_param(query, 'page_size', 20), MAX_PAGE_SIZE)
+            sort_by = query.get('sort', ['id'])[0]
+            students = processing.get_page(self.students, page, page_size, sort_by=sort_by)
+            return {
+                "total": len(self.students),
+                "page": page,
+                "page_size": page_size,
+                "students": [student_to_json(s) for s in students]
+            }
+        if len(parts) == 2 and parts[0] == 'students':
+            student = processing.find_student_by_id(self.students, self._student_id(parts[1]))
+            if student is None:
+                raise StudentNotFoundError(f"Студент с ID {parts[1]} не найден")
+            return student_to_json(student)
+        raise HttpError(HTTPStatus.NOT_FOUND, "Неизвестный адрес")
+
+    def _json_body(self, body: bytes) -> Dict[str, Any]:
+
+        """Разбор тела запроса"""
+
+        try:
+            payload = json.loads(body or b'{}')
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Тело запроса должно быть JSON")
+        if not isinstance(payload, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Тело запроса должно быть JSON-объектом")
+        return payload
+
+    def _write(self, method: str, parts: list, body: bytes) -> Tuple[HTTPStatus, Any]:
+
+        """Обработка запросов на изменение (вызывается без незавершенных чтений)"""
+
+        if method == 'POST' and parts == ['students']:
+            payload = self._json_body(body)
+            student_id, name = payload.get('id'), payload.get('name')
+            # bool - подкласс int, но true/false не принимаются как id
+            if (
+                not isinstance(student_id, int) or isinstance(student_id, bool)
+                or not isinstance(name, str) or not name.strip()
+            ):
+                raise HttpError(HTTPStatus.BAD_REQUEST, "Нужны целый id и непустое имя")
+            processing.add_student(self.students, name.strip(), student_id)
+            return HTTPStatus.CREATED, student_to_json(self.students.get(student_id))
+        if method == 'PUT' and len(parts) == 3 and parts[0] == 'students' and parts[2] == 'grades':
+            student_id = self._student_id(parts[1])
+            grades = self._json_body(body).get('grades')
+            if not isinstance(grades, list):
+                raise HttpError(HTTPStatus.BAD_REQUEST, "Нужен список оценок 'grades'")
+            processing.update_grades(student_id, grades, self.students)
+            return HTTPStatus.OK, student_to_json(self.students.get(student_id))
+        if method == 'DELETE' and len(parts) == 2 and parts[0] == 'students':
+            processing.remove_student(self.students, self._student_id(parts[1]))
+            return HTTPStatus.OK, {"deleted": int(parts[1])}
+        raise HttpError(HTTPStatus.NOT_FOUND, "Неизвестный адрес")
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.AbstractServer:
+
+        """Запуск сервера (порт 0 - выбрать свободный)"""
+
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+
+async def serve(students: StudentRoster, host: str = "127.0.0.1", port: int = 8080):
+
+    """Запуск сервера и обслуживание запросов до остановки процесса"""
+
+    server = await RosterServer(students).start(host, port)
+    address = server.sockets[0].getsockname()
+    print(f"Сервер запущен на http://{address[0]}:{address[1]}")
+    async with server:
+        await server.serve_forever()
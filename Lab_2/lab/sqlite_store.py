@@ -0,0 +1,286 @@
+import sqlite3
+from array import array
+from itertools import islice
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional
+)
+from .models import Student
+from .processing import validate_grades
+from .errors import (
+    StudentNotFoundError,
+    DuplicateStudentIdError,
+    InvalidSortKeyError,
+    DataValidationError
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    grades BLOB NOT NULL,
+    grade_sum INTEGER NOT NULL,
+    grade_count INTEGER NOT NULL,
+    average REAL NOT NULL,
+    seq INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS students_by_avg ON students (average DESC, name, seq);
+CREATE INDEX IF NOT EXISTS students_by_name ON students (name, seq);
+CREATE INDEX IF NOT EXISTS students_by_seq ON students (seq);
+"""
+
+_COLUMNS = "id, name, grades"
+
+# порядок сортировки как у processing.sort_students, seq сохраняет порядок добавления при равенстве
+_ORDER_BY = {
+    'id': "id",
+    'name': "name, seq",
+    'avg': "average DESC, name, seq",
+}
+
+
+def _average(grade_sum: int, grade_count: int) -> float:
+
+    """Средний балл как у Student.average"""
+
+    return grade_sum / grade_count if grade_count else 0.0
+
+
+class SqliteStudentStore:
+
+    """
+    Хранилище студентов в файле SQLite с операциями lab.processing
+    id - первичный ключ, средний балл хранится в отдельной индексированной колонке,
+    поэтому поиск, сортировка, отбор лучших и статистика выполняются запросами к индексам
+    без загрузки всего списка в память. Оценки хранятся как байты (по байту на оценку)
+    """
+
+    def __init__(self, path: str = ":memory:", batch_size: int = 10_000):
+
+        """
+        Открывает (или создает) базу данных
+        :param path: путь к файлу базы данных (default: база в памяти)
+        :param batch_size: размер пачки строк при массовой вставке
+        """
+
+        self.batch_size = batch_size
+        self._conn = sqlite3.connect(path)
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+        self._next_seq = self._conn.execute(
+            "SELECT COALESCE(MAX(seq), 0) + 1 FROM students"
+        ).fetchone()[0]
+
+    def close(self):
+
+        """Закрытие соединения с базой данных"""
+
+        self._conn.close()
+
+    def __enter__(self) -> "SqliteStudentStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+
+        """Количество студентов в хранилище"""
+
+        return self._conn.execute("SELECT COUNT(*) FROM students").fetchone()[0]
+
+    def __iter__(self) -> Iterator[Student]:
+
+        """Потоковый обход студентов в порядке добавления"""
+
+        return self._iter_query(f"SELECT {_COLUMNS} FROM students ORDER BY seq")
+
+    def _iter_query(self, query: str, params: tuple = ()) -> Iterator[Student]:
+
+        """Потоковое чтение студентов из результата запроса"""
+
+        for student_id, name, grades in self._conn.execute(query, params):
+            yield Student(id=student_id, name=name, grades=list(grades))
+
+    def _row(self, student: Student) -> tuple:
+
+        """Строка таблицы для студента"""
+
+        grades = array('B', student.grades).tobytes()
+        grade_sum = sum(student.grades)
+        row = (
+            student.student_id,
+            student.name,
+            grades,
+            grade_sum,
+            len(grades),
+            _average(grade_sum, len(grades)),
+            self._next_seq
+        )
+        self._next_seq += 1
+        return row
+
+    def find_student_by_id(self, student_id: int) -> Optional[Student]:
+
+        """Поиск студента по id через первичный ключ"""
+
+        return next(self._iter_query(
+            f"SELECT {_COLUMNS} FROM students WHERE id = ?", (student_id,)
+        ), None)
+
+    def add_student(self, name: str, student_id: int):
+
+        """
+        Добавление нового студента без оценок
+        :raises DuplicateStudentIdError: если студент с таким id уже существует
+        """
+
+        self.add_students([Student(id=student_id, name=name)])
+
+    def add_students(self, students: Iterable[Student]):
+
+        """
+        Массовое добавление студентов пачками в одной транзакции
+        Если среди студентов есть дубликат id, не добавляется никто
+        :raises DuplicateStudentIdError: если студент с таким id уже существует
+        :raises DataValidationError: если у студента некорректные оценки или
+            строка нарушает другое ограничение таблицы
+        """
+
+        students = iter(students)
+        next_seq = self._next_seq
+        added_ids = []
+        try:
+            with self._conn:
+                while True:
+                    batch = list(islice(students, self.batch_size))
+                    if not batch:
+                        break
+                    for student in batch:
+                        validate_grades(student.grades)
+                    added_ids.extend(student.student_id for student in batch)
+                    self._conn.executemany(
+                        "INSERT INTO students VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        [self._row(student) for student in batch]
+                    )
+        except sqlite3.IntegrityError as e:
+            self._next_seq = next_seq
+            if "UNIQUE constraint failed: students.id" not in str(e):
+                raise DataValidationError(f"Студент не добавлен: нарушено ограничение таблицы ({e})")
+            raise DuplicateStudentIdError(
+                f"Студент с id {self._duplicate_id(added_ids)} уже существует"
+            )
+        except Exception:
+            self._next_seq = next_seq
+            raise
+
+    def _duplicate_id(self, student_ids: List[int]) -> Optional[int]:
+
+        """
+        Первый id из неудавшейся вставки, который повторяется в ней или уже есть в таблице
+        (вызывается после отката транзакции, поэтому таблица содержит только прежние строки)
+        """
+
+        seen = set()
+        for student_id in student_ids:
+            if student_id in seen or self.find_student_by_id(student_id) is not None:
+                return student_id
+            seen.add(student_id)
+        return None
+
+    def remove_student(self, student_id: int):
+
+        """
+        Удаление студента по id
+        :raises StudentNotFoundError: если студент с таким id не найден
+        """
+
+        with self._conn:
+            cursor = self._conn.execute("DELETE FROM students WHERE id = ?", (student_id,))
+        if cursor.rowcount == 0:
+            raise StudentNotFoundError(f"Студент с ID {student_id} не найден")
+
+    def update_grades(self, student_id: int, new_grades: List[int]):
+
+        """
+        Обновление оценок одного студента с пересчетом среднего балла
+        :raises DataValidationError: если оценки некорректны
+        :raises StudentNotFoundError: если студент с таким id не найден
+        """
+
+        validate_grades(new_grades)
+        grade_sum = sum(new_grades)
+        with self._conn:
+            cursor = self._conn.execute(
+                "UPDATE students SET grades = ?, grade_sum = ?, grade_count = ?, average = ? "
+                "WHERE id = ?",
+                (
+                    array('B', new_grades).tobytes(),
+                    grade_sum,
+                    len(new_grades),
+                    _average(grade_sum, len(new_grades)),
+                    student_id
+                )
+            )
+        if cursor.rowcount == 0:
+            raise StudentNotFoundError(f"Студент с ID {student_id} не найден")
+
+    def iter_sorted(self, sort_by: str) -> Iterator[Student]:
+
+        """
+        Потоковый обход студентов в порядке сортировки по индексу
+        :param sort_by: ключ для сортировки ['id', 'name' или 'avg']
+        :raises InvalidSortKeyError: если передан неверный ключ сортировки
+        """
+
+        if sort_by not in _ORDER_BY:
+            raise InvalidSortKeyError("Неверный ключ сортировки")
+        return self._iter_query(
+            f"SELECT {_COLUMNS} FROM students ORDER BY {_ORDER_BY[sort_by]}"
+        )
+
+    def sort_students(self, sort_by: str) -> List[Student]:
+
+        """Список студентов, отсортированный как у processing.sort_students"""
+
+        return list(self.iter_sorted(sort_by))
+
+    def get_top_students(self, n: int) -> List[Student]:
+
+        """N лучших студентов по среднему баллу, как у processing.get_top_students"""
+
+        return list(self._iter_query(
+            f"SELECT {_COLUMNS} FROM students ORDER BY {_ORDER_BY['avg']} LIMIT ?",
+            (max(n, 0),)
+        ))
+
+    def get_full_statistics(self) -> Dict[str, Any]:
+
+        """
+        Статистика по группе в формате processing.get_full_statistics
+        Наибольший и наименьший средний балл берутся из индекса students_by_avg,
+        среди студентов с этим баллом выбирается добавленный раньше, как у max/min по списку
+        (по seq сортируются только студенты с равным крайним баллом)
+        """
+
+        count, grade_sum, grade_count = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(grade_sum), 0), COALESCE(SUM(grade_count), 0) FROM students"
+        ).fetchone()
+        best = next(self._iter_query(
+            f"SELECT {_COLUMNS} FROM students WHERE average = (SELECT MAX(average) FROM students) "
+            "ORDER BY seq LIMIT 1"
+        ), None)
+        worst = next(self._iter_query(
+            f"SELECT {_COLUMNS} FROM students WHERE average = (SELECT MIN(average) FROM students) "
+            "ORDER BY seq LIMIT 1"
+        ), None)
+        return {
+            "count": count,
+            "overall_average": _average(grade_sum, grade_count),
+            "best_student": best,
+            "worst_student": worst
+        }
@@ -0,0 +1,132 @@
+import math
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional
+)
+from .models import Student
+from .errors import DataValidationError
+
+MAX_GRADE = 100
+
+
+class StatisticsAccumulator:
+
+    """
+    Однопроходный сбор статистики по студентам
+    Можно передать весь список через update или добавлять студентов по одному
+    через add (например, при потоковой загрузке из csv), промежуточные списки не создаются
+    """
+
+    def __init__(self, extended: bool = False):
+
+        """
+        Конструктор аккумулятора
+        :param extended: считать ли дополнительно min/max, стандартное отклонение
+        и медиану всех оценок (по гистограмме оценок 0..100)
+        """
+
+        self.extended = extended
+        self.count = 0
+        self.grade_count = 0
+        self.grade_sum = 0  # в расширенном режиме сумма считается по гистограмме
+        self.best_student: Optional[Student] = None
+        self.worst_student: Optional[Student] = None
+        self._best_average = 0.0
+        self._worst_average = 0.0
+        self._histogram: List[int] = [0] * (MAX_GRADE + 1) if extended else []
+
+    def add(self, student: Student):
+
+        """
+        Учет одного студента
+        :raises DataValidationError: в расширенном режиме, если оценка вне диапазона 0..100
+        """
+
+        grades = student.grades
+        average = student.average
+
+        if self.count == 0:
+            self.best_student = self.worst_student = student
+            self._best_average = self._worst_average = average
+        elif average > self._best_average:
+            self.best_student = student
+            self._best_average = average
+        elif average < self._worst_average:
+            self.worst_student = student
+            self._worst_average = average
+        self.count += 1
+
+        if self.extended:
+            histogram = self._histogram
+            for grade in grades:
+                if not (0 <= grade <= MAX_GRADE):
+                    raise DataValidationError(
+                        f"Ошибка: оценка '{grade}' не является целым числом от 0 до 100"
+                    )
+                histogram[grade] += 1
+        else:
+            self.grade_sum += sum(grades)
+        self.grade_count += len(grades)
+
+    def update(self, students: Iterable[Student]) -> "StatisticsAccumulator":
+
+        """Учет всех студентов из итерируемого объекта, возвращает сам аккумулятор"""
+
+        for student in students:
+            self.add(student)
+        return self
+
+    def _median(self) -> float:
+
+        """Медиана оценок по гистограмме"""
+
+        lower_pos = (self.grade_count - 1) // 2
+        upper_pos = self.grade_count // 2
+        lower = upper = None
+        seen = 0
+        for grade, amount in enumerate(self._histogram):
+            seen += amount
+            if lower is None and seen > lower_pos:
+                lower = grade
+            if seen > upper_pos:
+                upper = grade
+                break
+        return (lower + upper) / 2
+
+    def result(self) -> Dict[str, Any]:
+
+        """
+        Итоговая статистика в формате processing.get_full_statistics
+        В расширенном режиме добавляются ключи min_grade, max_grade, stddev, median
+        (None если оценок нет)
+        """
+
+        grade_sum = self.grade_sum
+        if self.extended:
+            grade_sum = sum(g * n for g, n in enumerate(self._histogram))
+
+        stats: Dict[str, Any] = {
+            "count": self.count,
+            "overall_average": grade_sum / self.grade_count if self.grade_count else 0.0,
+            "best_student": self.best_student,
+            "worst_student": self.worst_student
+        }
+
+        if self.extended:
+            if self.grade_count:
+                present = [g for g, n in enumerate(self._histogram) if n]
+                n = self.grade_count
+                square_sum = sum(g * g * amount for g, amount in enumerate(self._histogram))
+                variance = (n * square_sum - grade_sum * grade_sum) / (n * n)
+                stats.update({
+                    "min_grade": present[0],
+                    "max_grade": present[-1],
+                    "stddev": math.sqrt(variance),
+                    "median": self._median()
+                })
+            else:
+                stats.update({"min_grade": None, "max_grade": None, "stddev": None, "median": None})
+        return stats
@@ -0,0 +1,97 @@
+import csv
+from lab import cli
+from lab import io_utils
+
+def write_sample(sample_students, tmp_path):
+    
+    """Сохраняет тестовых студентов в csv и возвращает путь к файлу"""
+    
+    filepath = tmp_path / "students.csv"
+    io_utils.save_students_to_csv(filepath, sample_students)
+    return str(filepath)
+
+def test_cli_stats(sample_students, tmp_path, capsys):
+    
+    """Тест команды stats"""
+    
+    assert cli.main(["load", write_sample(sample_students, tmp_path), "stats"]) == 0
+    out = capsys.readouterr().out
+    assert "Всего студентов: 3" in out
+    assert "Общий средний балл: 73.67" in out
+    assert "Лучший студент: Иванова Анна" in out
+
+def test_cli_sort_and_export_top(sample_students, tmp_path, capsys):
+    
+    """Тест команд sort и export-top"""
+    
+    filepath = write_sample(sample_students, tmp_path)
+    assert cli.main(["load", filepath, "sort", "--by", "avg"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split(",")[0] for line in lines] == ["Student(id=3", "Student(id=1", "Student(id=2"]
+    
+    assert cli.main(["load", filepath, "export-top", "-n", "1"]) == 0
+    rows = list(csv.reader(capsys.readouterr().out.splitlines()))
+    assert rows == [['id', 'name', 'average', 'grades'], ['3', 'Иванова Анна', '91.67', '92 88 95']]
+
+def test_cli_apply_updates(sample_students, tmp_path, capsys):
+    
+    """Тест команды apply-updates с выводом в файл"""
+    
+    filepath = write_sample(sample_students, tmp_path)
+    updates = tmp_path / "updates.csv"
+    updates.write_text("id,grades\n1,100,100\n", encoding='utf-8')
+    output = tmp_path / "out.csv"
+    
+    assert cli.main(["load", filepath, "-o", str(output), "apply-updates", str(updates), "--updates-header"]) == 0
+    loaded = io_utils.load_students_from_csv(output)
+    assert [s.grades for s in loaded if s.student_id == 1] == [[100, 100]]
+
+def test_cli_reports_errors_to_stderr(sample_students, tmp_path, capsys):
+    
+    """Тест, что ошибки и предупреждения пишутся в stderr, а код возврата ненулевой"""
+    
+    bad = tmp_path / "bad.csv"
+    bad.write_text("id,name,grade1\n1,Иванов,80\nx,Петров,90\n", encoding='utf-8')
+    assert cli.main(["load", str(bad), "show"]) == 0
+    captured = capsys.readouterr()
+    assert captured.out == "Student(id=1, name='Иванов', grades=[80])\n"
+    assert "строка 3 пропущена" in captured.err
+    
+    updates = tmp_path / "updates.csv"
+    updates.write_text("99,50\n", encoding='utf-8')
+    assert cli.main(["load", str(bad), "apply-updates", str(updates)]) == 1
+    assert "id 99" in capsys.readouterr().err
+    
+    assert cli.main(["load", str(tmp_path / "missing.csv"), "stats"]) == 1
+    assert "не найден" in capsys.readouterr().err
+
+def test_cli_paging(sample_students, tmp_path, capsys):
+    
+    """Тест опций --page и --page-size"""
+    
+    filepath = write_sample(sample_students, tmp_path)
+    assert cli.main(["load", filepath, "sort", "--by", "id", "--page", "2", "--page-size", "2"]) == 0
+    assert capsys.readouterr().out.startswith("Student(id=3,")
+    assert cli.main(["load", filepath, "show", "--page", "1", "--page-size", "1"]) == 0
+    assert capsys.readouterr().out.splitlines() == ["Student(id=3, name='Иванова Анна', grades=[92, 88, 95])"]
+
+def test_cli_output_replaced_only_on_success(sample_students, tmp_path, capsys):
+    
+    """Тест: -o на входной файл не теряет данные при ошибке, недоступный -o - ошибка без трассировки"""
+    
+    filepath = write_sample(sample_students, tmp_path)
+    before = open(filepath, 'rb').read()
+    updates = tmp_path / "updates.csv"
+    updates.write_text("99,50\n", encoding='utf-8')
+    
+    assert cli.main(["load", filepath, "-o", filepath, "apply-updates", str(updates)]) == 1
+    assert open(filepath, 'rb').read() == before
+    
+    updates.write_text("1,100\n", encoding='utf-8')
+    assert cli.main(["load", filepath, "-o", filepath, "apply-updates", str(updates)]) == 0
+    assert [s.grades for s in io_utils.load_students_from_csv(filepath) if s.student_id == 1] == [[100]]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["students.csv", "updates.csv"]
+    capsys.readouterr()
+    
+    assert cli.main(["load", filepath, "-o", str(tmp_path / "missing" / "out.csv"), "stats"]) == 1
+    assert "не удалось открыть файл вывода" in capsys.readouterr().err
@@ -0,0 +1,69 @@
+import pytest
+from lab import processing
+from lab.models import Student
+from lab.errors import InvalidSortKeyError
+
+np = pytest.importorskip("numpy")
+from lab.columnar import ColumnarRoster
+
+@pytest.fixture
+def students_with_ties(sample_students):
+    
+    """Фикстура со студентами с равными средними баллами и без оценок"""
+    
+    return sample_students + [
+        Student(id=4, name="Абрамов", grades=[92, 88, 95]),
+        Student(id=5, name="Яковлев", grades=[92, 88, 95]),
+        Student(id=6, name="Без оценок"),
+    ]
+
+def test_columnar_roundtrip(students_with_ties):
+    
+    """Тест преобразования в колоночный вид и обратно"""
+    
+    columnar = ColumnarRoster.from_students(students_with_ties)
+    restored = columnar.to_students()
+    assert [s.student_id for s in restored] == [s.student_id for s in students_with_ties]
+    assert [s.grades for s in restored] == [s.grades for s in students_with_ties]
+    assert columnar.grades.dtype == np.uint8
+
+def test_columnar_statistics_match_processing(students_with_ties):
+    
+    """Тест совпадения статистики с lab.processing"""
+    
+    columnar = ColumnarRoster.from_students(students_with_ties)
+    expected = processing.get_full_statistics(students_with_ties)
+    stats = columnar.get_full_statistics()
+    assert stats["count"] == expected["count"]
+    assert stats["overall_average"] == pytest.approx(expected["overall_average"])
+    assert stats["best_student"] == expected["best_student"]
+    assert stats["worst_student"] == expected["worst_student"]
+    assert columnar.averages().tolist() == [s.average for s in students_with_ties]
+
+@pytest.mark.parametrize("sort_by", ['id', 'name', 'avg'])
+def test_columnar_sort_matches_processing(students_with_ties, sort_by):
+    
+    """Тест совпадения сортировки с lab.processing"""
+    
+    columnar = ColumnarRoster.from_students(students_with_ties)
+    expected = [s.student_id for s in processing.sort_students(students_with_ties, sort_by)]
+    assert [s.student_id for s in columnar.sort_students(sort_by)] == expected
+
+def test_columnar_top_students(students_with_ties):
+    
+    """Тест отбора N лучших студентов"""
+    
+    columnar = ColumnarRoster.from_students(students_with_ties)
+    for n in range(len(students_with_ties) + 1):
+        expected = processing.get_top_students(students_with_ties, n)
+        assert [s.student_id for s in columnar.get_top_students(n)] == [s.student_id for s in expected]
+
+def test_columnar_empty_and_invalid_key():
+    
+    """Тест пустого представления и неверного ключа сортировки"""
+    
+    columnar = ColumnarRoster.from_students([])
+    assert columnar.get_full_statistics()["best_student"] is None
+    assert columnar.overall_average() == 0.0
+    with pytest.raises(InvalidSortKeyError):
+        columnar.sort_order('lastname')
@@ -70,4 +70,233 @@ def test_export_top_students(sample_students, tmp_path):
         
         rows = list(reader)
         assert len(rows) == N
-        assert rows[1][0] == '1'
\ No newline at end of file
+        assert rows[1][0] == '1'
+
+def test_iter_students_is_lazy_generator(sample_students, tmp_path):
+    
+    """Тест потоковой загрузки: студенты отдаются по одному"""
+    
+    filepath = tmp_path / "students.csv"
+    io_utils.save_students_to_csv(filepath, sample_students)
+    
+    stream = io_utils.iter_students_from_csv(filepath)
+    first = next(stream)
+    assert first.student_id == 3
+    assert [s.student_id for s in stream] == [1, 2]
+
+def test_iter_students_missing_file_raises_error(tmp_path):
+    
+    """Тест загрузки несуществующего файла через генератор"""
+    
+    with pytest.raises(FileNotFoundError):
+        next(io_utils.iter_students_from_csv(tmp_path / "missing.csv"))
+
+def test_streaming_filter_and_save(sample_students, tmp_path):
+    
+    """Тест конвейера: потоковое чтение, фильтрация и запись генератора"""
+    
+    source = tmp_path / "students.csv"
+    target = tmp_path / "filtered.csv"
+    io_utils.save_students_to_csv(source, sample_students)
+    
+    good = (s for s in io_utils.iter_students_from_csv(source) if s.average >= 80)
+    io_utils.save_students_to_csv(target, good)
+    
+    with open(target, 'r', encoding='utf-8') as f:
+        assert next(csv.reader(f)) == ['id', 'name', 'grade1', 'grade2', 'grade3']
+    loaded = io_utils.load_students_from_csv(target)
+    assert [s.student_id for s in loaded] == [3, 1]
+    assert loaded[0].grades == [92, 88, 95]
+
+def test_streaming_save_matches_collection_save(tmp_path):
+    
+    """Тест: запись потока и списка дает одинаковый файл (заголовок и выравнивание строк)"""
+    
+    students = [
+        Student(id=1, name="Иванов, Иван", grades=[90]),
+        Student(id=2, name="Петров", grades=[70, 80, 100]),
+        Student(id=3, name="Сидоров", grades=[]),
+    ]
+    from_list = tmp_path / "list.csv"
+    from_stream = tmp_path / "stream.csv"
+    io_utils.save_students_to_csv(from_list, students)
+    io_utils.save_students_to_csv(from_stream, iter(students))
+    
+    assert from_stream.read_bytes() == from_list.read_bytes()
+    assert [s.grades for s in io_utils.load_students_from_csv(from_stream)] == [[90], [70, 80, 100], []]
+
+def test_export_top_students_from_stream(sample_students, tmp_path):
+    
+    """Тест экспорта N лучших из потока студентов"""
+    
+    source = tmp_path / "students.csv"
+    target = tmp_path / "top.csv"
+    io_utils.save_students_to_csv(source, sample_students)
+    
+    io_utils.export_top_students_to_csv(target, io_utils.iter_students_from_csv(source), 2)
+    
+    with open(target, 'r', encoding='utf-8') as f:
+        rows = list(csv.reader(f))[1:]
+    assert [row[0] for row in rows] == ['3', '1']
+    assert rows[0][2] == "91.67"
+
+def test_parallel_load_matches_sequential(tmp_path, capsys):
+    
+    """Тест параллельной загрузки: те же студенты и предупреждения с глобальными номерами строк"""
+    
+    lines = ["id,name,grade1,grade2"]
+    for i in range(1, 41):
+        lines.append(f"{i},Студент {i},{i},{100 - i}")
+    lines[10] = "10,Студент 10,101,5"
+    lines[25] = "bad,Студент,1,2"
+    lines.append("5,Дубликат,50,50")
+    lines.append("41,Фамилия Имя,70,")
+    filepath = tmp_path / "students.csv"
+    filepath.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    
+    expected = io_utils.load_students_from_csv(filepath)
+    expected_out = capsys.readouterr().out
+    
+    loaded = io_utils.load_students_from_csv_parallel(filepath, workers=4, min_chunk_size=64)
+    out = capsys.readouterr().out
+    
+    assert [s.student_id for s in loaded] == [s.student_id for s in expected]
+    assert [s.grades for s in loaded] == [s.grades for s in expected]
+    assert loaded[-1].name == "Фамилия Имя"
+    assert out == expected_out
+    assert "строка 11" in out and "строка 26" in out and "строка 42" in out
+
+def test_parallel_load_quoted_newline_across_chunks(tmp_path, capsys):
+    
+    """Тест: поле в кавычках с переводом строки на границе диапазонов - тот же результат, что последовательно"""
+    
+    lines = ["id,name,grade1"]
+    for i in range(1, 41):
+        lines.append(f"{i},Студент {i},{i}")
+    lines[20] = '20,"Имя\n' + "\n".join(["21,Не студент,50"] * 10) + '",70'
+    filepath = tmp_path / "students.csv"
+    filepath.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    
+    expected = io_utils.load_students_from_csv(filepath)
+    expected_out = capsys.readouterr().out
+    loaded = io_utils.load_students_from_csv_parallel(filepath, workers=4, min_chunk_size=64)
+    
+    assert [(s.student_id, s.name, s.grades) for s in loaded] == \
+        [(s.student_id, s.name, s.grades) for s in expected]
+    assert capsys.readouterr().out == expected_out
+    assert expected[19].name.startswith("Имя\n21,Не студент")
+
+def test_parallel_load_missing_file_raises_error(tmp_path):
+    
+    """Тест параллельной загрузки несуществующего файла"""
+    
+    with pytest.raises(FileNotFoundError):
+        io_utils.load_students_from_csv_parallel(tmp_path / "missing.csv")
+
+@pytest.mark.parametrize("cells, expected", [
+    (["80", "", "100", "0"], [80, 100, 0]),
+    ([" 80 ", "007", "+5", " ", "1_0"], [80, 7, 5, 10]),
+    (["80", "101"], None),
+    (["80", "-1"], None),
+    (["x", "50"], None),
+    (["5.0"], None),
+    (["٣", "５"], [3, 5]),
+])
+def test_fast_grade_parsing_matches_int_rules(cells, expected):
+    
+    """Тест, что быстрый разбор оценок следует правилам int() и 0..100"""
+    
+    row = ["1", "Иванов"] + cells
+    if expected is None:
+        with pytest.raises(io_utils.DataValidationError, match="Строка 7: оценка должна быть целым числом от 0 до 100"):
+            io_utils._parse_and_validate_row(row, 7)
+    else:
+        assert io_utils._parse_and_validate_row(row, 7).grades == expected
+
+def test_snapshot_roundtrip_matches_csv(sample_students, tmp_path):
+    
+    """Тест: снимок и csv дают одинаковый результат после сохранения и загрузки"""
+    
+    from lab.models import Student
+    sample_students.append(Student(id=-7, name="Без оценок"))
+    sample_students.append(Student(id=2**40, name="Фамилия, Имя", grades=[100] * 300))
+    csv_path = tmp_path / "students.csv"
+    snapshot_path = tmp_path / "students.snap"
+    
+    io_utils.save_students_to_csv(csv_path, sample_students)
+    io_utils.save_snapshot(snapshot_path, iter(sample_students))
+    
+    from_csv = io_utils.load_students_from_csv(csv_path)
+    from_snapshot = io_utils.load_snapshot(snapshot_path)
+    
+    assert [(s.student_id, s.name, s.grades) for s in from_snapshot] == \
+        [(s.student_id, s.name, s.grades) for s in from_csv]
+    assert [s.average for s in from_snapshot] == [s.average for s in from_csv]
+
+def test_snapshot_is_compact_and_indexable(tmp_path):
+    
+    """Тест: снимок меньше csv, студенты доступны по позиции и срезу"""
+    
+    students = [Student(id=i, name=f"Студент {i}", grades=[i % 101, 50, 100]) for i in range(1000)]
+    csv_path = tmp_path / "students.csv"
+    snapshot_path = tmp_path / "students.snap"
+    io_utils.save_students_to_csv(csv_path, students)
+    io_utils.save_snapshot(snapshot_path, students)
+    assert snapshot_path.stat().st_size < csv_path.stat().st_size
+    
+    loaded = io_utils.load_snapshot(snapshot_path)
+    assert len(loaded) == 1000
+    assert loaded[-1].student_id == 999 and loaded[-1].grades == [90, 50, 100]
+    assert [s.name for s in loaded[10:12]] == ["Студент 10", "Студент 11"]
+    with pytest.raises(IndexError):
+        loaded[1000]
+
+def test_snapshot_empty_and_corrupted(tmp_path):
+    
+    """Тест пустого снимка и поврежденных файлов"""
+    
+    from lab.errors import DataValidationError
+    filepath = tmp_path / "empty.snap"
+    io_utils.save_snapshot(filepath, [])
+    assert list(io_utils.load_snapshot(filepath)) == []
+    
+    truncated = tmp_path / "truncated.snap"
+    truncated.write_bytes(filepath.read_bytes() + b'x')
+    with pytest.raises(DataValidationError):
+        io_utils.load_snapshot(truncated)
+    
+    not_snapshot = tmp_path / "students.csv"
+    not_snapshot.write_text("id,name\n1,Иванов\n" * 3, encoding='utf-8')
+    with pytest.raises(DataValidationError):
+        io_utils.load_snapshot(not_snapshot)
+    with pytest.raises(FileNotFoundError):
+        io_utils.load_snapshot(tmp_path / "missing.snap")
+
+def test_snapshot_invalid_utf8_name(sample_students, tmp_path):
+    
+    """Тест: имя не в UTF-8 в снимке - ошибка формата, а не UnicodeDecodeError"""
+    
+    filepath = tmp_path / "students.snap"
+    io_utils.save_snapshot(filepath, sample_students)
+    data = filepath.read_bytes()
+    name = "Иванова Анна".encode('utf-8')
+    filepath.write_bytes(data.replace(name, b'\xff' * len(name), 1))
+    with pytest.raises(io_utils.DataValidationError, match="UTF-8"):
+        io_utils.load_snapshot(filepath)
+
+def test_snapshot_failed_write_keeps_previous_file(sample_students, tmp_path, monkeypatch):
+    
+    """Тест: сбой посреди записи снимка не портит прежний снимок и не оставляет временный файл"""
+    
+    filepath = tmp_path / "students.snap"
+    io_utils.save_snapshot(filepath, sample_students)
+    before = filepath.read_bytes()
+    
+    def failing_table(values):
+        raise OSError("диск заполнен")
+    monkeypatch.setattr(io_utils, "_to_little_endian", failing_table)
+    
+    with pytest.raises(OSError):
+        io_utils.save_snapshot(filepath, sample_students[:1])
+    assert filepath.read_bytes() == before
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["students.snap"]
@@ -0,0 +1,102 @@
+import pytest
+from lab import io_utils
+from lab.journal import StudentJournal
+from lab.errors import DataValidationError, StudentNotFoundError
+
+def test_journal_records_changes_and_replays(sample_students, tmp_path):
+    
+    """Тест: изменения дописываются в журнал и восстанавливаются при загрузке"""
+    
+    base = tmp_path / "students.csv"
+    io_utils.save_students_to_csv(base, sample_students)
+    journal = StudentJournal(base)
+    
+    students = journal.load()
+    journal.add_student(students, "Новый", 4)
+    journal.update_grades(4, [90, 95], students)
+    journal.remove_student(students, 2)
+    
+    assert len(io_utils.load_students_from_csv(base)) == 3
+    
+    restored = StudentJournal(base).load()
+    assert [(s.student_id, s.grades) for s in restored] == [(s.student_id, s.grades) for s in students]
+
+def test_journal_compaction(sample_students, tmp_path):
+    
+    """Тест автоматического сжатия журнала в базу"""
+    
+    base = tmp_path / "students.snap"
+    io_utils.save_snapshot(base, sample_students)
+    journal = StudentJournal(base, snapshot=True, compact_every=2)
+    
+    students = journal.load()
+    journal.update_grades(1, [100], students)
+    journal.update_grades(2, [100], students)
+    
+    assert journal.pending == 0
+    assert tmp_path.joinpath("students.snap.journal").read_text(encoding='utf-8') == ""
+    assert [s.grades for s in io_utils.load_snapshot(base)] == [[92, 88, 95], [100], [100]]
+
+def test_journal_ignores_torn_tail_and_replay_is_idempotent(sample_students, tmp_path, capsys):
+    
+    """Тест восстановления после сбоя: недописанная запись и сбой между сжатием и очисткой журнала"""
+    
+    base = tmp_path / "students.csv"
+    io_utils.save_students_to_csv(base, sample_students)
+    journal = StudentJournal(base)
+    students = journal.load()
+    journal.add_student(students, "Новый", 4)
+    journal.update_grades(4, [70], students)
+    journal.remove_student(students, 1)
+    journal_path = tmp_path / "students.csv.journal"
+    with open(journal_path, 'a', encoding='utf-8') as f:
+        f.write('{"op": "remove", "id": 3')
+    
+    restored = StudentJournal(base).load()
+    assert "повреждена" in capsys.readouterr().out
+    assert [(s.student_id, s.grades) for s in restored] == [(3, [92, 88, 95]), (2, [65, 70, 0]), (4, [70])]
+    
+    io_utils.save_students_to_csv(base, restored)
+    again = StudentJournal(base)
+    replayed = again.load()
+    assert [(s.student_id, s.grades) for s in replayed] == [(3, [92, 88, 95]), (2, [65, 70, 0]), (4, [70])]
+    
+    again.update_grades(2, [50], replayed)
+    assert StudentJournal(base).load().get(2).grades == [50]
+
+def test_journal_corrupt_middle_record_raises(sample_students, tmp_path):
+    
+    """Тест: поврежденная запись в середине журнала - ошибка, журнал не обрезается"""
+    
+    base = tmp_path / "students.csv"
+    io_utils.save_students_to_csv(base, sample_students)
+    journal_path = tmp_path / "students.csv.journal"
+    content = '{"op": "remove", "id": 1}\n{"op": \n{"op": "remove", "id": 2}\n'
+    journal_path.write_text(content, encoding='utf-8')
+    
+    with pytest.raises(DataValidationError, match="запись 2"):
+        StudentJournal(base).load()
+    assert journal_path.read_text(encoding='utf-8') == content
+
+def test_journal_failed_append_keeps_roster_unchanged(sample_students, tmp_path, monkeypatch):
+    
+    """Тест: при ошибке записи в журнал изменение не применяется к реестру"""
+    
+    base = tmp_path / "students.csv"
+    io_utils.save_students_to_csv(base, sample_students)
+    journal = StudentJournal(base)
+    students = journal.load()
+    
+    def failing_append(record):
+        raise OSError("диск заполнен")
+    monkeypatch.setattr(journal, "_append", failing_append)
+    
+    with pytest.raises(OSError):
+        journal.update_grades(1, [10], students)
+    with pytest.raises(OSError):
+        journal.add_student(students, "Новый", 4)
+    assert students.get(1).grades == [78, 85, 90]
+    assert 4 not in students
+    
+    with pytest.raises(StudentNotFoundError):
+        journal.remove_student(students, 42)
@@ -34,4 +34,48 @@ def test_cli_add_and_show_scenario(monkeypatch, capsys):
     assert "Список студентов пуст" in output
     assert "Студент 'Тестовый' с id 101 добавлен" in output
     assert "Student(id=101, name='Тестовый', grades=[])" in output
-    assert "Завершение работы программы..." in output
\ No newline at end of file
+    assert "Завершение работы программы..." in output
+
+def test_cli_show_all_is_paged(monkeypatch, capsys):
+    
+    """Тест постраничного вывода: после первой страницы пользователь выходит"""
+    
+    from lab.models import Student
+    students = [Student(id=i, name=f"Студент {i}") for i in range(main.PAGE_SIZE + 5)]
+    prompts = []
+    monkeypatch.setattr('builtins.input', lambda prompt: prompts.append(prompt) or "q")
+    
+    main.handle_show_all(students)
+    
+    output = capsys.readouterr().out
+    assert f"Student(id={main.PAGE_SIZE - 1}," in output
+    assert f"Student(id={main.PAGE_SIZE}," not in output
+    assert prompts == ["Страница 1 из 2. Enter - следующая, q - выход: "]
+
+def test_cli_save_uses_journal(monkeypatch, capsys, tmp_path):
+    
+    """
+    Тест журналируемого сохранения: первое сохранение записывает файл целиком,
+    последующие изменения дописываются в журнал и восстанавливаются при загрузке
+    """
+    
+    path = str(tmp_path / "students.csv")
+    inputs = [
+        "4", "1", "Первый",
+        "2", path, "y",
+        "4", "2", "Второй",
+        "2", path, "y",
+        "1", path, "y",
+        "3",
+        "0"
+    ]
+    input_iterator = iter(inputs)
+    monkeypatch.setattr('builtins.input', lambda _: next(input_iterator))
+    
+    main.main()
+    
+    output = capsys.readouterr().out
+    assert "Изменения уже записаны в журнал" in output
+    assert [s.student_id for s in main.io_utils.load_students_from_csv(path)] == [1]
+    assert '"id": 2' in (tmp_path / "students.csv.journal").read_text(encoding='utf-8')
+    assert "Student(id=2, name='Второй', grades=[])" in output
@@ -29,4 +29,89 @@ def test_student_average_with_none_grades():
     
     s = Student(id=1, name="Тест") 
     assert s.grades == []
-    assert s.average == 0.0
\ No newline at end of file
+    assert s.average == 0.0
+
+def test_compact_student_surface():
+    
+    """Тест, что CompactStudent повторяет интерфейс Student"""
+    
+    from lab.models import CompactStudent
+    s = CompactStudent(id=1, name="Тест", grades=[80, 90, 100])
+    assert s.student_id == 1
+    assert s.name == "Тест"
+    assert list(s.grades) == [80, 90, 100]
+    assert s.average == 90.0
+    assert repr(s) == "Student(id=1, name='Тест', grades=[80, 90, 100])"
+    assert s == Student(id=1, name="Другой")
+    assert Student(id=1, name="Другой") == s
+    assert not hasattr(s, '__dict__')
+
+def test_compact_student_grades_assignment_and_conversion():
+    
+    """Тест замены оценок и преобразования между моделями"""
+    
+    from lab.models import CompactStudent
+    s = CompactStudent(id=1, name="Тест")
+    assert s.average == 0.0
+    s.grades = [50, 70]
+    assert s.average == 60.0
+    
+    regular = s.to_student()
+    assert isinstance(regular, Student)
+    assert regular.grades == [50, 70]
+    assert list(CompactStudent.from_student(regular).grades) == [50, 70]
+
+def test_student_average_follows_grades_assignment():
+    
+    """Тест, что средний балл пересчитывается при присваивании оценок"""
+    
+    s = Student(id=1, name="Тест", grades=[80, 90])
+    assert s.average == 85.0
+    s.grades = [100]
+    assert s.average == 100.0
+    s.grades = []
+    assert s.average == 0.0
+
+def test_student_average_ignores_changes_to_assigned_list():
+    
+    """Тест, что изменение списка, переданного в grades, не портит средний балл"""
+    
+    grades = [80, 90]
+    s = Student(id=1, name="Тест", grades=grades)
+    other = Student(id=2, name="Тест", grades=grades)
+    grades.append(0)
+    assert s.average == 85.0
+    assert other.grades == [80, 90]
+    assert other.average == 85.0
+
+def test_student_average_from_iterator():
+    
+    """Тест, что оценки из генератора дают правильный средний балл"""
+    
+    s = Student(id=1, name="Тест", grades=(g for g in [90, 80]))
+    assert s.grades == [90, 80]
+    assert s.average == 85.0
+
+def test_student_average_follows_in_place_changes():
+    
+    """Тест, что изменения списка оценок на месте сразу учитываются в среднем балле"""
+    
+    import copy
+    import pickle
+    s = Student(id=1, name="Тест", grades=[50, 0])
+    s.grades.append(100)
+    assert s.average == 50.0
+    s.grades[1] = 100
+    s.grades += [0]
+    assert s.average == 62.5
+    s.grades.pop()
+    del s.grades[:1]
+    s.grades.insert(0, 70)
+    assert s.average == 90.0
+    s.grades[::2] = [10, 30]
+    s.grades.remove(10)
+    assert s.average == 65.0
+    assert pickle.loads(pickle.dumps(s)).average == 65.0
+    assert copy.deepcopy(s).grades.total == 130
+    s.grades.clear()
+    assert s.average == 0.0
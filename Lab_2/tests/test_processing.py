@@ -58,6 +58,9 @@ def test_update_grades_invalid_grade_raises_error(sample_students):
     
     with pytest.raises(DataValidationError):
         processing.update_grades(1, [101], sample_students)
+    with pytest.raises(DataValidationError):
+        processing.update_grades(1, [True, False, True], sample_students)
+    assert processing.find_student_by_id(sample_students, 1).grades == [78, 85, 90]
 
 
 def test_statistics(sample_students):
@@ -113,4 +116,81 @@ def test_sort_with_invalid_key_raises_error(sample_students):
     """Тест сортировки по неверному ключу"""
     
     with pytest.raises(InvalidSortKeyError):
-        processing.sort_students(sample_students, 'lastname')
\ No newline at end of file
+        processing.sort_students(sample_students, 'lastname')
+
+
+def test_update_grades_refreshes_average(sample_students):
+    
+    """Тест, что после update_grades средний балл и сортировка актуальны"""
+    
+    processing.update_grades(2, [100, 100], sample_students)
+    assert processing.find_student_by_id(sample_students, 2).average == 100.0
+    assert processing.get_best_student(sample_students).student_id == 2
+
+def test_get_top_students_matches_full_sort(sample_students):
+    
+    """Тест, что отбор через кучу совпадает с полной сортировкой, включая равенства"""
+    
+    from lab.models import Student
+    sample_students.append(Student(id=4, name="Абрамов", grades=[92, 88, 95]))
+    sample_students.append(Student(id=5, name="Яковлев", grades=[92, 88, 95]))
+    for n in range(len(sample_students) + 2):
+        expected = processing.sort_students(sample_students, 'avg')[:n]
+        assert processing.get_top_students(iter(sample_students), n) == expected
+        assert [s.name for s in processing.get_top_students(sample_students, n)] == [s.name for s in expected]
+
+def test_add_students_batch(sample_students):
+    
+    """Тест пакетного добавления студентов"""
+    
+    from lab.models import Student
+    results = processing.add_students(sample_students, [Student(id=4, name="А"), Student(id=5, name="Б", grades=[90])])
+    assert [r["ok"] for r in results] == [True, True]
+    assert [s.student_id for s in sample_students] == [3, 1, 2, 4, 5]
+
+def test_add_students_batch_is_all_or_nothing(sample_students):
+    
+    """Тест, что пакет с ошибками не применяется, а отчет содержит ошибки по элементам"""
+    
+    from lab.models import Student
+    from lab.errors import BatchOperationError
+    batch = [Student(id=4, name="А"), Student(id=1, name="Б"), Student(id=4, name="В"), Student(id=6, name="Г", grades=[101])]
+    with pytest.raises(BatchOperationError) as exc_info:
+        processing.add_students(sample_students, batch)
+    assert [r["ok"] for r in exc_info.value.results] == [True, False, False, False]
+    assert "уже существует" in exc_info.value.results[1]["error"]
+    assert exc_info.value.results[2]["error"] == "ID 4 повторяется в пакете"
+    assert len(sample_students) == 3
+
+def test_remove_students_batch(sample_students):
+    
+    """Тест пакетного удаления студентов"""
+    
+    from lab.errors import BatchOperationError
+    with pytest.raises(BatchOperationError) as exc_info:
+        processing.remove_students(sample_students, [1, 99, 1])
+    assert [r["ok"] for r in exc_info.value.results] == [True, False, False]
+    assert "не найден" in exc_info.value.results[1]["error"]
+    assert exc_info.value.results[2]["error"] == "ID 1 повторяется в пакете"
+    assert len(sample_students) == 3
+    
+    processing.remove_students(sample_students, [1, 3])
+    assert [s.student_id for s in sample_students] == [2]
+
+def test_update_grades_bulk(sample_students):
+    
+    """Тест пакетного обновления оценок"""
+    
+    from lab.errors import BatchOperationError
+    with pytest.raises(BatchOperationError) as exc_info:
+        processing.update_grades_bulk(sample_students, [(1, [100]), (99, [50]), (2, [101])])
+    assert [r["ok"] for r in exc_info.value.results] == [True, False, False]
+    assert processing.find_student_by_id(sample_students, 1).grades == [78, 85, 90]
+    
+    with pytest.raises(BatchOperationError) as exc_info:
+        processing.update_grades_bulk(sample_students, [(1, [70]), (1, [80])])
+    assert [r["error"] for r in exc_info.value.results] == [None, "ID 1 повторяется в пакете"]
+    
+    results = processing.update_grades_bulk(sample_students, {1: [100], 2: [50, 60]})
+    assert all(r["ok"] for r in results)
+    assert processing.find_student_by_id(sample_students, 2).average == 55.0
@@ -0,0 +1,237 @@
+import pytest
+from lab import processing
+from lab.models import Student
+from lab.roster import StudentRoster
+from lab.errors import (
+    DuplicateStudentIdError,
+    StudentNotFoundError
+)
+
+@pytest.fixture
+def sample_roster(sample_students):
+    
+    """Фикстура, предоставляющая реестр из тестового списка студентов"""
+    
+    return StudentRoster(sample_students)
+
+def test_roster_keeps_insertion_order(sample_roster):
+    
+    """Тест сохранения порядка добавления"""
+    
+    assert [s.student_id for s in sample_roster] == [3, 1, 2]
+    assert sample_roster.ids() == [3, 1, 2]
+    assert sample_roster[0].student_id == 3
+    assert len(sample_roster) == 3
+
+def test_roster_positional_access_follows_changes(sample_roster):
+    
+    """Тест доступа по позиции: закэшированный порядок сбрасывается при изменении"""
+    
+    assert [s.student_id for s in sample_roster[1:]] == [1, 2]
+    assert sample_roster[-1].student_id == 2
+    sample_roster.pop(3)
+    sample_roster.append(Student(id=4, name="Новый"))
+    assert sample_roster[0].student_id == 1
+    assert sample_roster[-1].student_id == 4
+    with pytest.raises(IndexError):
+        sample_roster[3]
+
+def test_roster_lookup_and_contains(sample_roster):
+    
+    """Тест поиска по id и проверки наличия"""
+    
+    assert sample_roster.get(1).name == "Иванов Иван"
+    assert sample_roster.get(99) is None
+    assert 1 in sample_roster
+    assert Student(id=2, name="Другой") in sample_roster
+    assert 99 not in sample_roster
+
+def test_roster_duplicate_raises_error(sample_roster):
+    
+    """Тест добавления дубликата id в реестр"""
+    
+    with pytest.raises(DuplicateStudentIdError):
+        sample_roster.append(Student(id=1, name="Дубликат"))
+    with pytest.raises(DuplicateStudentIdError):
+        StudentRoster([Student(id=1, name="А"), Student(id=1, name="Б")])
+
+def test_roster_pop_and_remove(sample_roster):
+    
+    """Тест удаления по id и как у списка"""
+    
+    assert sample_roster.pop(1).student_id == 1
+    with pytest.raises(StudentNotFoundError):
+        sample_roster.pop(1)
+    sample_roster.remove(Student(id=3, name="Иванова Анна"))
+    with pytest.raises(ValueError):
+        sample_roster.remove(Student(id=3, name="Иванова Анна"))
+    assert sample_roster.ids() == [2]
+
+def test_processing_functions_on_roster(sample_roster):
+    
+    """Тест работы функций lab.processing с реестром"""
+    
+    processing.add_student(sample_roster, "Новый", 4)
+    with pytest.raises(DuplicateStudentIdError):
+        processing.add_student(sample_roster, "Дубликат", 4)
+    processing.update_grades(4, [90, 100], sample_roster)
+    assert processing.find_student_by_id(sample_roster, 4).grades == [90, 100]
+    
+    processing.remove_student(sample_roster, 1)
+    with pytest.raises(StudentNotFoundError):
+        processing.remove_student(sample_roster, 1)
+    
+    sorted_ids = [s.student_id for s in processing.sort_students(sample_roster, 'avg')]
+    assert sorted_ids == [4, 3, 2]
+    stats = processing.get_full_statistics(sample_roster)
+    assert stats["count"] == 3
+    assert stats["best_student"].student_id == 4
+
+def test_batch_operations_on_roster(sample_roster):
+    
+    """Тест пакетных операций lab.processing с реестром"""
+    
+    processing.add_students(sample_roster, [Student(id=4, name="Новый")])
+    processing.update_grades_bulk(sample_roster, [(4, [80]), (1, [70])])
+    assert sample_roster.get(4).grades == [80]
+    processing.remove_students(sample_roster, [1, 4])
+    assert sample_roster.ids() == [3, 2]
+
+def test_sorted_view_is_cached_until_change(sample_roster):
+    
+    """Тест кэширования отсортированного представления до изменения реестра"""
+    
+    view = sample_roster.sorted_view('avg')
+    assert [s.student_id for s in view] == [3, 1, 2]
+    assert sample_roster.sorted_view('avg') is view
+    
+    processing.update_grades(2, [100], sample_roster)
+    assert [s.student_id for s in sample_roster.sorted_view('avg')] == [2, 3, 1]
+    
+    version = sample_roster.version
+    processing.add_student(sample_roster, "Новый", 4)
+    assert sample_roster.version > version
+    assert [s.student_id for s in sample_roster.sorted_view('id')] == [1, 2, 3, 4]
+
+def test_get_page(sample_roster, sample_students):
+    
+    """Тест постраничного обхода в исходном и отсортированном порядке"""
+    
+    from lab.errors import InvalidPageError
+    assert [s.student_id for s in processing.get_page(sample_roster, 1, 2)] == [3, 1]
+    assert [s.student_id for s in processing.get_page(sample_roster, 2, 2, sort_by='id')] == [3]
+    assert [s.student_id for s in processing.get_page(sample_students, 2, 2, sort_by='avg')] == [2]
+    assert list(processing.get_page(iter(sample_students), 3, 2)) == []
+    assert processing.get_page_count(3, 2) == 2
+    assert processing.get_page_count(0, 2) == 1
+    with pytest.raises(InvalidPageError):
+        processing.get_page(sample_roster, 0, 2)
+
+@pytest.mark.parametrize("sort_by", ['id', 'name', 'avg'])
+def test_sorted_index_follows_mutations(sample_students, sort_by):
+    
+    """Тест, что постоянный индекс совпадает с полной сортировкой после изменений"""
+    
+    indexed = StudentRoster(sample_students, indexed_keys=[sort_by])
+    plain = list(sample_students)
+    
+    def check():
+        expected = [s.student_id for s in processing.sort_students(plain, sort_by)]
+        assert [s.student_id for s in processing.iter_sorted(indexed, sort_by)] == expected
+        assert [s.student_id for s in processing.get_page(indexed, 2, 2, sort_by=sort_by)] == expected[2:4]
+        for rank, student_id in enumerate(expected, start=1):
+            assert processing.get_student_rank(indexed, student_id, sort_by) == rank
+            assert processing.get_student_rank(plain, student_id, sort_by) == rank
+    
+    check()
+    for students in (indexed, plain):
+        processing.add_student(students, "Иванова Анна", 4)
+        processing.add_student(students, "Абрамов", 5)
+        processing.update_grades(4, [95, 92, 88], students)
+        processing.update_grades(5, [100], students)
+        processing.update_grades_bulk(students, [(1, [0]), (5, [84])])
+        processing.remove_student(students, 3)
+    check()
+    
+    with pytest.raises(StudentNotFoundError):
+        indexed.rank(3, sort_by)
+
+def test_add_index_and_clear(sample_roster):
+    
+    """Тест включения индекса на заполненном реестре и очистки"""
+    
+    from lab.errors import InvalidSortKeyError
+    sample_roster.add_index('avg')
+    assert sample_roster.rank(2) == 3
+    with pytest.raises(InvalidSortKeyError):
+        sample_roster.add_index('lastname')
+    sample_roster.clear()
+    sample_roster.append(Student(id=7, name="А", grades=[1]))
+    assert sample_roster.sorted_slice('avg', 0, 5)[0].student_id == 7
+
+def test_distribution_queries(sample_students):
+    
+    """Тест места, процентиля, выборки по процентилям и гистограмм"""
+    
+    # средние: Анна 91.67, Иван 84.33, Петр 45.0
+    roster = StudentRoster(sample_students, track_distribution=True)
+    for students in (roster, sample_students):
+        assert [processing.get_average_rank(students, i) for i in (3, 1, 2)] == [1, 2, 3]
+        assert processing.get_percentile(students, 3) == 100
+        assert processing.get_percentile(students, 2) == pytest.approx(100 / 3)
+        assert [s.student_id for s in processing.get_students_between_percentiles(students, 50, 100)] == [3, 1]
+        assert processing.get_students_between_percentiles(students, 0, 30) == []
+        assert processing.get_average_histogram(students, 50) == [(0, 50, 1), (50, 100, 2)]
+        assert processing.get_grade_histogram(students, 50) == [(0, 50, 1), (50, 100, 8)]
+    with pytest.raises(StudentNotFoundError):
+        processing.get_average_rank(roster, 99)
+
+def test_distribution_follows_mutations(sample_students):
+    
+    """Тест, что распределение в реестре совпадает с пересчетом после изменений"""
+    
+    roster = StudentRoster(sample_students, track_distribution=True)
+    plain = list(sample_students)
+    for students in (roster, plain):
+        processing.add_student(students, "Новиков", 4)
+        processing.update_grades(4, [100, 100], students)
+        processing.update_grades(3, [84, 85, 84], students)
+        processing.remove_student(students, 2)
+    assert roster.distribution.grade_histogram(100) == [(0, 100, 8)]
+    for student_id in (1, 3, 4):
+        assert processing.get_average_rank(roster, student_id) == processing.get_average_rank(plain, student_id)
+        assert processing.get_percentile(roster, student_id) == processing.get_percentile(plain, student_id)
+    # Иван 84.33 и Анна 84.33 делят второе место
+    assert processing.get_average_rank(roster, 3) == processing.get_average_rank(roster, 1) == 2
+    assert processing.get_average_histogram(roster) == processing.get_average_histogram(plain)
+    roster.clear()
+    assert processing.get_average_histogram(roster, 100) == [(0, 100, 0)]
+
+def test_distribution_survives_in_place_grade_changes(sample_students):
+    
+    """Тест, что изменение списка оценок на месте не портит счетчики распределения"""
+    
+    roster = StudentRoster(sample_students, track_distribution=True)
+    student = roster.get(2)
+    student.grades.append(100)
+    roster.set_grades(student, [50])
+    assert processing.get_grade_histogram(roster, 100) == [(0, 100, 7)]
+    assert processing.get_grade_histogram(roster, 50) == [(0, 50, 0), (50, 100, 7)]
+
+def test_between_percentiles_keeps_insertion_order_for_ties_after_updates():
+    
+    """Тест: после изменения оценок равные по среднему и имени студенты идут в порядке реестра"""
+    
+    students = [Student(id=i, name="Тезка", grades=[80]) for i in range(6)]
+    roster = StudentRoster(students, track_distribution=True)
+    processing.update_grades(2, [10], roster)
+    processing.update_grades(2, [80], roster)
+    processing.remove_student(roster, 4)
+    processing.add_student(roster, "Тезка", 4)
+    processing.update_grades(4, [80], roster)
+    processing.update_grades(0, [80], roster)
+    
+    expected = [s.student_id for s in processing.sort_students(roster, 'avg')]
+    assert expected == [0, 1, 2, 3, 5, 4]
+    assert [s.student_id for s in processing.get_students_between_percentiles(roster, 0, 100)] == expected
+    assert [s.student_id for s in processing.get_students_between_percentiles(list(roster), 0, 100)] == expected
@@ -0,0 +1,111 @@
+import asyncio
+import json
+import time
+import pytest
+from lab import processing
+from lab.roster import StudentRoster
+from lab.server import RosterServer
+
+async def request(port: int, method: str, path: str, body=None):
+    
+    """Один HTTP-запрос к серверу, возвращает (статус, JSON ответа)"""
+    
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    data = json.dumps(body).encode('utf-8') if body is not None else b''
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: test\r\nConnection: close\r\n"
+        f"Content-Length: {len(data)}\r\n\r\n".encode('latin-1') + data
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(payload)
+
+def run_scenario(students, scenario):
+    
+    """Запускает сервер на свободном порту и выполняет сценарий клиента"""
+    
+    async def main():
+        server = await RosterServer(StudentRoster(students)).start(port=0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await scenario(port)
+    return asyncio.run(main())
+
+def test_server_read_endpoints(sample_students):
+    
+    """Тест запросов на чтение"""
+    
+    async def scenario(port):
+        assert await request(port, "GET", "/students/1") == \
+            (200, {"id": 1, "name": "Иванов Иван", "grades": [78, 85, 90], "average": pytest.approx(84.33, abs=0.01)})
+        status, top = await request(port, "GET", "/top?n=2")
+        assert [s["id"] for s in top] == [3, 1]
+        assert await request(port, "GET", "/top?n=0") == (200, [])
+        assert await request(port, "GET", "/top?n=-1") == (200, [])
+        status, page = await request(port, "GET", "/students?sort=avg&page=2&page_size=2")
+        assert page["total"] == 3 and [s["id"] for s in page["students"]] == [2]
+        status, stats = await request(port, "GET", "/stats")
+        assert stats["count"] == 3 and stats["best_student"]["id"] == 3
+        assert (await request(port, "GET", "/students/99"))[0] == 404
+        assert (await request(port, "GET", "/students?sort=lastname"))[0] == 400
+    run_scenario(sample_students, scenario)
+
+def test_server_concurrent_writes_are_serialised(sample_students):
+    
+    """Тест конкурентных изменений"""
+    
+    async def scenario(port):
+        results = await asyncio.gather(*(
+            request(port, "POST", "/students", {"id": 100 + i, "name": f"Студент {i}"}) for i in range(20)
+        ))
+        assert all(status == 201 for status, _ in results)
+        assert (await request(port, "POST", "/students", {"id": 100, "name": "Дубликат"}))[0] == 409
+        status, student = await request(port, "PUT", "/students/100/grades", {"grades": [90, 100]})
+        assert status == 200 and student["average"] == 95.0
+        assert (await request(port, "PUT", "/students/100/grades", {"grades": [101]}))[0] == 400
+        assert (await request(port, "DELETE", "/students/100"))[0] == 200
+        status, stats = await request(port, "GET", "/stats")
+        assert stats["count"] == 22
+    run_scenario(sample_students, scenario)
+
+def test_server_rejects_bool_id_and_reports_internal_errors(sample_students, monkeypatch):
+    
+    """Тест: true/false не принимаются как id и оценки, непредвиденная ошибка - ответ 500"""
+    
+    def broken_statistics(students, extended=False):
+        raise RuntimeError("сбой")
+    monkeypatch.setattr(processing, "get_full_statistics", broken_statistics)
+    
+    async def scenario(port):
+        assert (await request(port, "POST", "/students", {"id": True, "name": "Булев"}))[0] == 400
+        assert (await request(port, "PUT", "/students/1/grades", {"grades": [True, False, True]}))[0] == 400
+        assert (await request(port, "GET", "/students/1"))[1]["grades"] == [78, 85, 90]
+        assert await request(port, "GET", "/stats") == (500, {"error": "Внутренняя ошибка сервера"})
+        assert (await request(port, "GET", "/students/1"))[0] == 200
+    run_scenario(sample_students, scenario)
+
+def test_server_slow_read_does_not_block_lookups(sample_students, monkeypatch):
+    
+    """Тест: долгое чтение выполняется в пуле и не задерживает поиск по id"""
+    
+    statistics = processing.get_full_statistics
+    def slow_statistics(students, extended=False):
+        time.sleep(0.3)
+        return statistics(students, extended)
+    monkeypatch.setattr(processing, "get_full_statistics", slow_statistics)
+    
+    async def scenario(port):
+        finished = []
+        async def timed(path):
+            status, _ = await request(port, "GET", path)
+            finished.append(path)
+            return status
+        slow = asyncio.ensure_future(timed("/stats"))
+        await asyncio.sleep(0.05)
+        assert await timed("/students/1") == 200
+        assert await slow == 200
+        assert finished == ["/students/1", "/stats"]
+        assert (await request(port, "DELETE", "/students/1"))[0] == 200
+    run_scenario(sample_students, scenario)
@@ -0,0 +1,112 @@
+import pytest
+from lab import processing
+from lab.models import Student
+from lab.sqlite_store import SqliteStudentStore
+from lab.errors import (
+    DuplicateStudentIdError,
+    StudentNotFoundError,
+    InvalidSortKeyError,
+    DataValidationError
+)
+
+@pytest.fixture
+def store(sample_students, tmp_path):
+    
+    """Фикстура, предоставляющая хранилище SQLite с тестовыми студентами"""
+    
+    with SqliteStudentStore(str(tmp_path / "students.db")) as store:
+        store.add_students(sample_students)
+        yield store
+
+def test_store_find_add_remove(store):
+    
+    """Тест поиска, добавления и удаления студентов"""
+    
+    assert store.find_student_by_id(1).grades == [78, 85, 90]
+    assert store.find_student_by_id(99) is None
+    
+    store.add_student("Новый", 4)
+    assert len(store) == 4
+    with pytest.raises(DuplicateStudentIdError):
+        store.add_student("Дубликат", 1)
+    
+    store.remove_student(4)
+    with pytest.raises(StudentNotFoundError):
+        store.remove_student(4)
+    assert [s.student_id for s in store] == [3, 1, 2]
+
+def test_store_batch_insert_is_all_or_nothing(store):
+    
+    """Тест, что пачка с дубликатом не добавляет никого"""
+    
+    with pytest.raises(DuplicateStudentIdError, match="id 3 "):
+        store.add_students([Student(id=10, name="А"), Student(id=3, name="Б")])
+    assert store.find_student_by_id(10) is None
+    with pytest.raises(DuplicateStudentIdError, match="id 11 "):
+        store.add_students([Student(id=11, name="А"), Student(id=11, name="Б")])
+    with pytest.raises(DataValidationError, match="ограничение"):
+        store.add_students([Student(id=12, name=None)])
+    assert len(store) == 3
+
+def test_store_update_grades(store):
+    
+    """Тест обновления оценок с пересчетом среднего балла"""
+    
+    store.update_grades(2, [100, 100])
+    assert store.find_student_by_id(2).average == 100.0
+    assert store.get_top_students(1)[0].student_id == 2
+    with pytest.raises(DataValidationError):
+        store.update_grades(2, [101])
+    with pytest.raises(StudentNotFoundError):
+        store.update_grades(99, [50])
+
+@pytest.mark.parametrize("sort_by", ['id', 'name', 'avg'])
+def test_store_sort_matches_processing(sample_students, store, sort_by):
+    
+    """Тест совпадения сортировки с lab.processing"""
+    
+    tied = [Student(id=4, name="Иванова Анна", grades=[95, 88, 92]), Student(id=5, name="Без оценок")]
+    store.add_students(tied)
+    sample_students.extend(tied)
+    expected = [s.student_id for s in processing.sort_students(sample_students, sort_by)]
+    assert [s.student_id for s in store.sort_students(sort_by)] == expected
+
+def test_store_top_students_matches_processing(sample_students, store):
+    
+    """Тест отбора N лучших студентов"""
+    
+    for n in range(5):
+        expected = processing.get_top_students(sample_students, n)
+        assert [s.student_id for s in store.get_top_students(n)] == [s.student_id for s in expected]
+
+def test_store_invalid_sort_key(store):
+    
+    """Тест сортировки по неверному ключу"""
+    
+    with pytest.raises(InvalidSortKeyError):
+        store.sort_students('lastname')
+
+def test_store_statistics_and_reopen(sample_students, store, tmp_path):
+    
+    """Тест статистики и сохранения данных между подключениями"""
+    
+    expected = processing.get_full_statistics(sample_students)
+    stats = store.get_full_statistics()
+    assert stats["count"] == expected["count"]
+    assert stats["overall_average"] == pytest.approx(expected["overall_average"])
+    assert stats["best_student"] == expected["best_student"]
+    assert stats["worst_student"] == expected["worst_student"]
+    
+    store.close()
+    with SqliteStudentStore(str(tmp_path / "students.db")) as reopened:
+        assert len(reopened) == 3
+        reopened.add_student("Новый", 4)
+        assert [s.student_id for s in reopened][-1] == 4
+
+def test_store_statistics_on_empty_store():
+    
+    """Тест статистики пустого хранилища"""
+    
+    with SqliteStudentStore() as store:
+        stats = store.get_full_statistics()
+    assert stats == {"count": 0, "overall_average": 0.0, "best_student": None, "worst_student": None}
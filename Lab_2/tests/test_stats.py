@@ -0,0 +1,50 @@
+import pytest
+from lab import processing
+from lab.models import Student
+from lab.stats import StatisticsAccumulator
+
+def test_extended_statistics(sample_students):
+    
+    """Тест расширенной статистики по всем оценкам"""
+    
+    stats = processing.get_full_statistics(sample_students, extended=True)
+    grades = sorted(g for s in sample_students for g in s.grades)
+    mean = sum(grades) / len(grades)
+    assert stats["count"] == 3
+    assert stats["overall_average"] == pytest.approx(mean)
+    assert stats["min_grade"] == 0
+    assert stats["max_grade"] == 95
+    assert stats["median"] == 85
+    assert stats["stddev"] == pytest.approx((sum((g - mean) ** 2 for g in grades) / len(grades)) ** 0.5)
+
+def test_extended_statistics_even_median_and_no_grades():
+    
+    """Тест медианы при четном числе оценок и статистики без оценок"""
+    
+    stats = processing.get_full_statistics([Student(id=1, name="А", grades=[10, 20, 30, 40])], extended=True)
+    assert stats["median"] == 25
+    
+    empty = processing.get_full_statistics([Student(id=1, name="А")], extended=True)
+    assert empty["overall_average"] == 0.0
+    assert empty["median"] is None and empty["stddev"] is None
+
+def test_accumulator_streaming_matches_full_list(sample_students):
+    
+    """Тест, что потоковое добавление дает тот же результат, что и весь список"""
+    
+    acc = StatisticsAccumulator()
+    for student in iter(sample_students):
+        acc.add(student)
+    assert acc.result() == processing.get_full_statistics(sample_students)
+
+def test_best_and_worst_keep_first_on_ties():
+    
+    """Тест, что при равных средних выбирается первый студент, как у max/min"""
+    
+    students = [
+        Student(id=1, name="А", grades=[50]),
+        Student(id=2, name="Б", grades=[50]),
+    ]
+    stats = processing.get_full_statistics(students)
+    assert stats["best_student"].student_id == 1
+    assert stats["worst_student"].student_id == 1
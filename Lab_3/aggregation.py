@@ -0,0 +1,254 @@
+import numpy as np
+import pandas as pd
+
+#поддерживаемые агрегаты: все разложимы, поэтому грубые группировки собираются из более подробных
+AGGREGATES = ("mean", "sum", "count", "min", "max", "std")
+
+#наибольшее число ячеек полной сетки групп (произведение числа уровней ключей);
+#для ключей с большим числом уровней сетка почти пуста, и такие группировки считаются через groupby
+MAX_GRID_SIZE = 1 << 20
+
+
+#приведение описания (keys, columns, aggs) к кортежам с запоминанием, были ли columns и aggs одиночными
+def _normalize(spec):
+    keys, columns, aggs = spec
+    keys = (keys,) if isinstance(keys, str) else tuple(keys)
+    single_column = isinstance(columns, str)
+    columns = (columns,) if single_column else tuple(columns)
+    single_agg = isinstance(aggs, str)
+    aggs = (aggs,) if single_agg else tuple(aggs)
+    for agg in aggs:
+        if agg not in AGGREGATES:
+            raise ValueError(f"неизвестный агрегат {agg}, доступны: {', '.join(AGGREGATES)}")
+    return keys, columns, aggs, single_column, single_agg
+
+
+#коды групп одного ключевого столбца и значения уровней индекса
+#для category коды уже есть, остальные столбцы факторизуются с сортировкой, как в groupby
+def _key_codes(series):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        levels = pd.Categorical.from_codes(np.arange(len(series.cat.categories)), dtype=series.dtype)
+        return codes, levels
+    codes, uniques = pd.factorize(series, sort=True)
+    return codes, uniques
+
+
+#частичные агрегаты по полной сетке групп базовой группировки:
+#количество строк и для каждого столбца сумма, сумма квадратов отклонений от среднего группы (m2),
+#минимум и максимум (только нужные); m2 считается вторым проходом по значениям,
+#а не через сумму квадратов, чтобы не терять точность на вычитании близких чисел
+def _partials(df, base_keys, needed, key_codes):
+    codes = [key_codes[key][0] for key in base_keys]
+    shape = tuple(len(key_codes[key][1]) for key in base_keys)
+
+    #строки с пропуском в ключе в группы не попадают, как при groupby(dropna=True)
+    valid = np.logical_and.reduce([code >= 0 for code in codes])
+    if valid.all():
+        valid = slice(None)
+    group_ids = np.ravel_multi_index([code[valid] for code in codes], shape)
+    size = int(np.prod(shape))
+
+    rows = np.bincount(group_ids, minlength=size).reshape(shape)
+    partials = {("", "count"): rows}
+    for column, parts in needed.items():
+        values = df[column].to_numpy()[valid]
+
+        #пропуски в значениях не учитываются, как в groupby: отдельное количество по столбцу,
+        #в суммах пропуски заменяются нулями, fmin/fmax пропуски пропускают сами
+        partials[(column, "count")] = rows
+        summed = values
+        if values.dtype.kind == "f":
+            present = ~np.isnan(values)
+            if not present.all():
+                partials[(column, "count")] = np.bincount(group_ids, weights=present, minlength=size).reshape(shape)
+                summed = np.where(present, values, 0.0) if parts & {"sum", "m2"} else values
+
+        if "sum" in parts:
+            partials[(column, "sum")] = np.bincount(group_ids, weights=summed, minlength=size).reshape(shape)
+        if "m2" in parts:
+            #значения сдвигаются на общее среднее столбца: средние групп и отклонения от них
+            #считаются по малым числам, и точность не теряется при больших значениях
+            masked = partials[(column, "count")] is not rows
+            count = partials[(column, "count")].ravel()
+            present_values = values[present] if masked else values
+            shifted = summed - (present_values.mean() if len(present_values) else 0.0)
+            if masked:
+                shifted = np.where(present, shifted, 0.0)
+            shifted_sum = np.bincount(group_ids, weights=shifted, minlength=size)
+            deviations = shifted - (shifted_sum / np.where(count > 0, count, 1))[group_ids]
+            if masked:
+                deviations = np.where(present, deviations, 0.0)
+            partials[(column, "shifted_sum")] = shifted_sum.reshape(shape)
+            partials[(column, "m2")] = np.bincount(
+                group_ids, weights=deviations * deviations, minlength=size
+            ).reshape(shape)
+        if "min" in parts:
+            result = np.full(size, np.inf)
+            np.fmin.at(result, group_ids, values)
+            partials[(column, "min")] = result.reshape(shape)
+        if "max" in parts:
+            result = np.full(size, -np.inf)
+            np.fmax.at(result, group_ids, values)
+            partials[(column, "max")] = result.reshape(shape)
+    return partials
+
+
+#m2 ячеек базовой сетки, пересчитанные к средним групп после свертки до ключей keys:
+#m2 объединения = сумма m2 частей + сумма count * (среднее части - среднее объединения)^2,
+#средние берутся по сдвинутым значениям (см. _partials)
+def _m2_for_roll_up(base_partials, column, base_keys, keys):
+    m2 = base_partials[(column, "m2")]
+    axes = tuple(i for i, key in enumerate(base_keys) if key not in keys)
+    if not axes:
+        return m2
+    count = base_partials[(column, "count")]
+    total = base_partials[(column, "shifted_sum")]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        means = np.where(count > 0, total / count, 0.0)
+        rolled = total.sum(axis=axes, keepdims=True) / count.sum(axis=axes, keepdims=True)
+        deviations = np.where(count > 0, means - rolled, 0.0)
+    return m2 + count * deviations * deviations
+
+
+#свертка частичных агрегатов базовой группировки до ключей keys (в их порядке)
+def _roll_up(array, base_keys, keys, part):
+    axes = tuple(i for i, key in enumerate(base_keys) if key not in keys)
+    if part == "min":
+        array = array.min(axis=axes) if axes else array
+    elif part == "max":
+        array = array.max(axis=axes) if axes else array
+    else:
+        array = array.sum(axis=axes) if axes else array
+    remaining = [key for key in base_keys if key in keys]
+    return np.transpose(array, [remaining.index(key) for key in keys])
+
+
+#индекс результата по наблюдаемым группам (ячейки сетки с ненулевым количеством строк)
+def _result_index(keys, key_codes, observed):
+    positions = np.nonzero(observed)
+    levels = [key_codes[key][1][position] for key, position in zip(keys, positions)]
+    if len(keys) == 1:
+        return pd.Index(levels[0], name=keys[0])
+    return pd.MultiIndex.from_arrays(levels, names=list(keys))
+
+
+#значения одного агрегата в наблюдаемых группах с типами как у groupby
+def _agg_values(df, column, agg, rolled, observed):
+    count = rolled[(column, "count")][observed]
+    if agg == "count":
+        return count.astype(np.int64)
+    if agg == "mean":
+        return rolled[(column, "sum")][observed] / np.where(count > 0, count, np.nan)
+    if agg == "std":
+        #выборочное отклонение (ddof=1) по m2, NaN для групп из одного значения
+        m2 = rolled[(column, "m2")][observed]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(count > 1, np.sqrt(m2 / (count - 1)), np.nan)
+    values = rolled[(column, agg)][observed]
+    if agg != "sum" and not count.all():
+        values = np.where(count > 0, values, np.nan)
+    dtype = df[column].dtype
+    if pd.api.types.is_integer_dtype(dtype):
+        values = values.astype(np.int64)
+        #groupby возвращает сумму в типе столбца, если она в него помещается, иначе int64
+        info = np.iinfo(dtype)
+        if agg != "sum" or len(values) == 0 or (info.min <= values.min() and values.max() <= info.max):
+            values = values.astype(dtype)
+    return values
+
+
+#группировка через pandas для ключей со слишком большой сеткой групп (см. MAX_GRID_SIZE)
+def _groupby(df, keys, columns, aggs, single_column, single_agg):
+    result = df.groupby(list(keys), observed=True)[list(columns)].agg(list(aggs))
+    if single_agg:
+        result = result.xs(aggs[0], axis=1, level=1)
+    if single_column:
+        result = result[columns[0]]
+    return result
+
+
+#вычисление набора группировок за минимальное число проходов по таблице
+#specs: {имя: (keys, columns, aggs)}, например {"rate": (["installment_rate", "class"], "credit_amount", "mean")}
+#коды ключевых столбцов вычисляются один раз на все описания, строки таблицы просматриваются
+#только для базовых наборов ключей (не входящих в другой набор) - по разу на столбец,
+#остальные группировки сворачиваются из их частичных агрегатов без обращения к строкам
+#результат для каждого имени совпадает с df.groupby(keys)[columns].agg(aggs)
+def aggregate(df, specs):
+    specs = {name: _normalize(spec) for name, spec in specs.items()}
+
+    key_codes = {}
+    for keys, _, _, _, _ in specs.values():
+        for key in keys:
+            if key not in key_codes:
+                key_codes[key] = _key_codes(df[key])
+
+    #набор ключей сворачивается из более широкого базового, если в лишних ключах нет пропусков
+    #(иначе строки с пропуском выпали бы из базовой группировки), большие наборы выбираются первыми;
+    #наборы со слишком большой сеткой групп базовыми не становятся и считаются через groupby
+    complete = {key: bool((codes >= 0).all()) for key, (codes, _) in key_codes.items()}
+    bases = []
+    base_of = {}
+    fallback = set()
+    for keys in sorted({frozenset(spec[0]) for spec in specs.values()}, key=len, reverse=True):
+        if np.prod([len(key_codes[key][1]) for key in keys], dtype=np.float64) > MAX_GRID_SIZE:
+            fallback.add(keys)
+            continue
+        base = next(
+            (base for base in bases if keys <= base and all(complete[key] for key in base - keys)),
+            None
+        )
+        if base is None:
+            bases.append(keys)
+            base = keys
+        base_of[keys] = base
+
+    #какие частичные агрегаты нужны каждому базовому набору ключей
+    needed = {base: {} for base in bases}
+    for keys, columns, aggs, _, _ in specs.values():
+        if frozenset(keys) in fallback:
+            continue
+        parts = needed[base_of[frozenset(keys)]]
+        for column in columns:
+            for agg in aggs:
+                if agg in ("mean", "sum"):
+                    parts.setdefault(column, set()).add("sum")
+                elif agg == "std":
+                    parts.setdefault(column, set()).update(("sum", "m2"))
+                elif agg in ("min", "max"):
+                    parts.setdefault(column, set()).add(agg)
+                else:
+                    parts.setdefault(column, set())
+
+    partials = {}
+    for base in bases:
+        base_keys = tuple(sorted(base))
+        partials[base] = (base_keys, _partials(df, base_keys, needed[base], key_codes))
+
+    results = {}
+    for name, (keys, columns, aggs, single_column, single_agg) in specs.items():
+        if frozenset(keys) in fallback:
+            results[name] = _groupby(df, keys, columns, aggs, single_column, single_agg)
+            continue
+        base_keys, base_partials = partials[base_of[frozenset(keys)]]
+        rolled = {}
+        for part, array in base_partials.items():
+            if part[0] in columns or part[0] == "":
+                if part[1] == "m2":
+                    array = _m2_for_roll_up(base_partials, part[0], base_keys, keys)
+                rolled[part] = _roll_up(array, base_keys, keys, part[1])
+        observed = rolled[("", "count")] > 0
+        index = _result_index(keys, key_codes, observed)
+
+        data = {
+            (column, agg): _agg_values(df, column, agg, rolled, observed)
+            for column in columns
+            for agg in aggs
+        }
+        if single_agg:
+            data = {column: data[(column, aggs[0])] for column in columns}
+        result = pd.DataFrame(data, index=index)
+        if single_column:
+            result = result[columns[0]]
+        results[name] = result
+    return results
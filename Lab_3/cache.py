@@ -0,0 +1,73 @@
+import hashlib
+import json
+import os
+
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+CACHE_DIR = "./.cache"
+
+#версия формата кэша: меняется вместе с типами столбцов в loader.py, чтобы не читать старые копии
+CACHE_VERSION = 1
+
+
+#хеш содержимого файла, читается блоками, чтобы не держать большой файл в памяти
+def file_hash(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+#имя исходного файла в кэше: имя файла и хеш полного пути, чтобы одноименные файлы
+#из разных каталогов не перезаписывали метаданные и копии друг друга
+def source_key(path):
+    full_path = os.path.realpath(path)
+    return os.path.basename(full_path) + "." + hashlib.sha256(full_path.encode("utf-8")).hexdigest()[:12]
+
+
+#хеш исходного файла с учетом mtime: пока размер и mtime не изменились, файл заново не хешируется
+def source_hash(path, cache_dir=CACHE_DIR):
+    stat = os.stat(path)
+    meta_path = os.path.join(cache_dir, source_key(path) + ".meta.json")
+    try:
+        with open(meta_path, "r", encoding="utf-8") as file:
+            meta = json.load(file)
+        if meta["mtime_ns"] == stat.st_mtime_ns and meta["size"] == stat.st_size:
+            return meta["sha256"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    digest = file_hash(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(meta_path, "w", encoding="utf-8") as file:
+        json.dump({"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest}, file)
+    return digest
+
+
+#загрузка через колоночную копию в формате Feather (Arrow IPC):
+#первый запуск разбирает текстовый файл функцией load и сохраняет копию, следующие запуски
+#отображают копию в память; копия привязана к хешу исходного файла и пересоздается при его изменении
+def load_cached(path, load, cache_dir=CACHE_DIR):
+    if feather is None:
+        #без pyarrow кэш недоступен, файл разбирается каждый раз
+        return load(path)
+
+    prefix = f"{source_key(path)}.{load.__name__}.v{CACHE_VERSION}."
+    cache_path = os.path.join(cache_dir, prefix + source_hash(path, cache_dir)[:16] + ".feather")
+    if os.path.exists(cache_path):
+        return feather.read_table(cache_path, memory_map=True).to_pandas()
+
+    df = load(path)
+
+    #устаревшие копии того же файла удаляются, новая записывается атомарно через временный файл
+    for name in os.listdir(cache_dir):
+        if name.startswith(prefix) and name.endswith(".feather"):
+            os.remove(os.path.join(cache_dir, name))
+    tmp_path = cache_path + ".tmp"
+    feather.write_feather(df, tmp_path, compression="uncompressed")
+    os.replace(tmp_path, cache_path)
+    return df
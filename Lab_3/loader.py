@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+
+DATA_PATH = "./statlog+german+credit+data/german.data"
+NUMERIC_DATA_PATH = "./statlog+german+credit+data/german.data-numeric"
+
+#коды категориальных признаков согласно german.doc
+#коды перечислены в лексикографическом порядке, как их сортирует groupby и LabelEncoder по строкам,
+#поэтому порядок групп в таблицах и коды после кодирования совпадают с прежней загрузкой строками
+CATEGORIES = {
+    "checking_status": ["A11", "A12", "A13", "A14"],
+    "credit_history": ["A30", "A31", "A32", "A33", "A34"],
+    "purpose": ["A40", "A41", "A410", "A42", "A43", "A44", "A45", "A46", "A47", "A48", "A49"],
+    "savings": ["A61", "A62", "A63", "A64", "A65"],
+    "employment": ["A71", "A72", "A73", "A74", "A75"],
+    "personal_status": ["A91", "A92", "A93", "A94", "A95"],
+    "other": ["A101", "A102", "A103"],
+    "property": ["A121", "A122", "A123", "A124"],
+    "other_installments_plans": ["A141", "A142", "A143"],
+    "housing": ["A151", "A152", "A153"],
+    "job": ["A171", "A172", "A173", "A174"],
+    "telephone": ["A191", "A192"],
+    "foreing_worker": ["A201", "A202"],
+}
+
+#числовые признаки: минимальные целые типы с запасом для синтетических расширений набора
+NUMERIC_DTYPES = {
+    "duration": np.int16,
+    "credit_amount": np.int32,
+    "installment_rate": np.int8,
+    "residence_since": np.int8,
+    "age": np.int16,
+    "existing_credits": np.int8,
+    "number_of_liable": np.int8,
+    "class": np.int8,
+}
+
+#назначение именованных столбцов согласно предоставленной спецификации
+COLUMNS = [
+    "checking_status",
+    "duration",
+    "credit_history",
+    "purpose",
+    "credit_amount",
+    "savings",
+    "employment",
+    "installment_rate",
+    "personal_status",
+    "other",
+    "residence_since",
+    "property",
+    "age",
+    "other_installments_plans",
+    "housing",
+    "existing_credits",
+    "job",
+    "number_of_liable",
+    "telephone",
+    "foreing_worker",
+    "class"
+]
+
+#при чтении категории выводятся из данных, набор кодов из спецификации задается после проверки
+DTYPES = {
+    column: "category" if column in CATEGORIES else NUMERIC_DTYPES[column]
+    for column in COLUMNS
+}
+
+#german.data-numeric: 24 числовых признака (часть - индикаторы категорий) и класс, без названий в спецификации
+NUMERIC_COLUMNS = [f"attribute_{i}" for i in range(1, 25)] + ["class"]
+NUMERIC_FILE_DTYPES = {column: np.int16 for column in NUMERIC_COLUMNS}
+NUMERIC_FILE_DTYPES["class"] = np.int8
+
+
+#загрузка набора данных "German Credit Data" с явными типами столбцов:
+#category для кодов A11, A124, ... и малые целые для числовых признаков
+def load_german_data(path=DATA_PATH):
+    df = pd.read_csv(path, sep=" ", names=COLUMNS, dtype=DTYPES)
+
+    #код, которого нет в спецификации, превратился бы в пропуск - сообщаем о нем явно
+    for column, categories in CATEGORIES.items():
+        if not set(df[column].cat.categories) <= set(categories) or df[column].isna().any():
+            raise ValueError(f"в столбце {column} есть код, которого нет в спецификации")
+        df[column] = df[column].cat.set_categories(categories)
+    return df
+
+
+#загрузка предварительно закодированного german.data-numeric (значения разделены несколькими пробелами)
+def load_german_numeric(path=NUMERIC_DATA_PATH):
+    return pd.read_csv(path, sep=r"\s+", names=NUMERIC_COLUMNS, dtype=NUMERIC_FILE_DTYPES)
+
+
+#кодирование категориальных признаков в числовой формат, как LabelEncoder по строкам:
+#номера присваиваются встреченным кодам в лексикографическом порядке, без обхода строк
+def label_encode(df):
+    df_encoded = df.copy()
+    for column in df_encoded.columns:
+        if isinstance(df_encoded[column].dtype, pd.CategoricalDtype):
+            df_encoded[column] = df_encoded[column].cat.remove_unused_categories().cat.codes.astype(np.int64)
+    return df_encoded
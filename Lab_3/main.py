@@ -1,116 +1,161 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import argparse
 import sqlite3
-from sklearn.preprocessing import LabelEncoder
+from loader import DATA_PATH, load_german_data, label_encode
+from cache import load_cached
+from aggregation import aggregate
+from pipeline import Pipeline
 
-def main():
-    print("Лабораторная работа 3. Обработка данных на языке Python")
-    print('Анализ набора данных "German Credit Data"\n\n\n')
-    
-    print("______1)Загрузка и подготовка данных______")
-    
-    #Назначение именованных столбцов согласно предоставленной спецификации.
-    columns = [
-        "checking_status",
-        "duration",
-        "credit_history",
-        "purpose",
-        "credit_amount",
-        "savings",
-        "employment",
-        "installment_rate",
-        "personal_status",
-        "other",
-        "residence_since",
-        "property",
-        "age",
-        "other_installments_plans",
-        "housing",
-        "existing_credits",
-        "job",
-        "number_of_liable",
-        "telephone",
-        "foreing_worker",
-        "class"
-    ]
-    
-    #загрузка набора данных "German Credit Data"
-    df = pd.read_csv("./statlog+german+credit+data/german.data", sep=" ", names=columns)
+#таблицы группировок: (ключи, столбцы, агрегаты); порядки категорий на графиках
+#сворачиваются из группировок по (признак, class) без повторного прохода по строкам
+GROUPINGS = {
+    "purpose": (["purpose", "class"], ["credit_amount", "duration"], "mean"),
+    "class": ("class", ["credit_amount", "age", "duration"], "mean"),
+    "history": (["credit_history", "class"], "existing_credits", "mean"),
+    "rate": (["installment_rate", "class"], "credit_amount", "mean"),
+    "job": (["job", "class"], "credit_amount", "mean"),
+    "property": (["property", "class"], "credit_amount", "mean"),
+    "property_duration": (["property", "class"], "duration", "mean"),
+    "job_duration": (["job", "class"], "duration", "mean"),
+    "order_purpose": ("purpose", "credit_amount", "mean"),
+    "order_property": ("property", "credit_amount", "mean"),
+    "order_property_duration": ("property", "duration", "mean"),
+    "order_job_duration": ("job", "duration", "mean"),
+    "plot_purpose_amount": (["purpose", "class"], "credit_amount", ["mean", "std", "count"]),
+    "plot_rate_amount": (["installment_rate", "class"], "credit_amount", ["mean", "std", "count"]),
+}
+
+#заголовки разделов отчета (печатаются перед первым этапом раздела)
+SECTION_LOAD = "______1)Загрузка и подготовка данных______"
+SECTION_ANALYSIS = "\n\n\n______2)Анализ данных______"
+SECTION_RELATIONS = "\n\n\n______3)Обработка и исследование взаимосвязей______"
+SECTION_PLOTS = "\n\n\n______4)Визуализация данных______"
+SECTION_DATABASE = "\n\n\n______5)Работа с базой данных______"
+
+pipeline = Pipeline(inputs=["options"])
+
+
+@pipeline.stage("load", section=SECTION_LOAD)
+def load():
+    #загрузка набора данных "German Credit Data" с явными типами столбцов (см. loader.py)
+    #через колоночную копию в ./.cache, которая пересоздается при изменении исходного файла
+    return load_cached(DATA_PATH, load_german_data)
+
+
+@pipeline.report("load")
+def show_load(df):
     print("часть данных:")
     print(df.head())
     
     #обработка возможных пропущенных значений
     missing_values = df.isnull().sum().sum()
     print("кол-во пропущенных значений: " + str(missing_values))
-    
-    print("\n\n\n______2)Анализ данных______")
-    
+
+
+@pipeline.stage("describe", requires=["load"], section=SECTION_ANALYSIS)
+def describe(df):
     #описание числовых признаков
     print("описание числовых признаков:")
     print(df.describe())
     
     #описание числовых признаков
     print("анализ категориальных признаков:")
-    print(df.describe(include=["object"]))
-    
+    print(df.describe(include=["category"]))
+
+
+@pipeline.stage("encode", requires=["load"], section=SECTION_ANALYSIS)
+def encode(df):
     #кодирование категориальных признаков в числовой формат для дальнейшего анализа.
-    df_encoded = df.copy()
-    le = LabelEncoder()
-    for column in df_encoded.columns:
-        if df_encoded[column].dtype == "object":
-            df_encoded[column] = le.fit_transform(df_encoded[column])
-    
+    return label_encode(df)
+
+
+@pipeline.report("encode")
+def show_encode(df_encoded):
     print("анализ закодированных категориальных признаков:")
     print(df_encoded.describe())
-    
-    print("\n\n\n______3)Обработка и исследование взаимосвязей______")
+
+
+#этапы с графиками в неинтерактивном режиме (--output-dir) не рисуют сами, а возвращают
+#описания графиков с готовыми агрегатами, которые затем рисуются параллельно (см. render.py)
+@pipeline.stage("heatmap", requires=["encode", "options"], section=SECTION_RELATIONS)
+def heatmap(df_encoded, options):
+    title = " корреляционная матрица числовых признаков"
+    if options.output_dir:
+        import render
+        return [render.heatmap_job(df_encoded, title)]
+
+    #matplotlib и seaborn импортируются только при построении графиков,
+    #чтобы этапы без графиков не тратили время на их загрузку
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     #обработка и исследование взаимосвязей
     #построение корреляционной матрицы числовых признаков.
     plt.figure(figsize=(14, 12))
     sns.heatmap(df_encoded.corr(), annot=True, fmt=".2f", cmap="coolwarm")
-    plt.title(" корреляционная матрица числовых признаков")
+    plt.title(title)
     plt.show()
-    
-    #группировки и агрегация
+    return []
+
+
+@pipeline.stage("groupby", requires=["load"], section=SECTION_RELATIONS)
+def groupby(df):
+    #группировки и агрегация: все таблицы считаются одним вызовом (см. aggregation.py)
+    return aggregate(df, GROUPINGS)
+
+
+@pipeline.report("groupby")
+def show_groupby(groups):
     print("\nгруппировка по целям: средняя сумма и срок кредита")
-    group_purpose = df.groupby(["purpose", "class"])[["credit_amount", "duration"]].mean().round(1)
+    group_purpose = groups["purpose"].round(1)
     print(group_purpose.sort_values(by="credit_amount", ascending=False))
     
     print("\nгруппировка по классу риска (1=Good, 2=Bad):")
-    group_class = df.groupby("class")[["credit_amount", "age", "duration"]].mean().round(1)
+    group_class = groups["class"].round(1)
     print(group_class)
     
     print("\nгруппировка по кредитной истории (среднее число нынешних кредитов):")
-    history_group = df.groupby(["credit_history", "class"])["existing_credits"].mean()
+    history_group = groups["history"]
     print(history_group.sort_values(ascending=False))
     
     print("\nгруппировка по проценту рассрочки (средняя сумма кредита):")
-    rate_group = df.groupby(["installment_rate", "class"])["credit_amount"].mean()
+    rate_group = groups["rate"]
     print(rate_group)
     
     print("\nгруппировка по работе (средняя сумма кредита):")
-    job_group = df.groupby(["job", "class"])["credit_amount"].mean().sort_values(ascending=False)
+    job_group = groups["job"].sort_values(ascending=False)
     print(job_group)
     
     print("\nгруппировка по типу имущества (средняя сумма кредита):")
-    prop_group = df.groupby(["property", "class"])["credit_amount"].mean().sort_values(ascending=False)
+    prop_group = groups["property"].sort_values(ascending=False)
     print(prop_group)
     
     print("\nгруппировка по типу имущества (средний срок кредита):")
-    prop_dur_group = df.groupby(["property", "class"])["duration"].mean().sort_values(ascending=False)
+    prop_dur_group = groups["property_duration"].sort_values(ascending=False)
     print(prop_dur_group)
     
     print("\nгруппировка средней длительность кредита в зависимости от Работы и Класса:")
-    job_dur_group = df.groupby(['job', 'class'])['duration'].mean().round(1).unstack()
+    job_dur_group = groups["job_duration"].round(1).unstack()
     print(job_dur_group)
-    
-    print("\n\n\n______4)Визуализация данных______")
+
+
+@pipeline.stage("plots", requires=["load", "groupby", "options"], section=SECTION_PLOTS)
+def plots(df, groups, options):
+    order_purpose = groups["order_purpose"].sort_values(ascending=False).index
+    order_prop = groups["order_property"].sort_values(ascending=False).index
+    order_prop_dur = groups["order_property_duration"].sort_values(ascending=False).index
+    order_job_dur = groups["order_job_duration"].sort_values(ascending=False).index
+    if options.output_dir:
+        return plot_jobs(df, groups, order_purpose, order_prop, order_prop_dur, order_job_dur)
+
+    #matplotlib и seaborn импортируются только при построении графиков,
+    #чтобы этапы без графиков не тратили время на их загрузку
+    import matplotlib.pyplot as plt
+    import seaborn as sns
 
     #barplot
     plt.figure(figsize=(10, 6))
-    order_purpose = df.groupby("purpose")["credit_amount"].mean().sort_values(ascending=False).index
     sns.barplot(x="credit_amount", y="purpose", data=df, order=order_purpose, hue="class", palette="deep")
     plt.title("средняя сумма кредита по целям кредита")
     plt.xlabel("mean credit_amount")
@@ -136,27 +181,63 @@ def main():
 
     #boxplot
     plt.figure(figsize=(10, 6))
-    order_prop = df.groupby("property")["credit_amount"].mean().sort_values(ascending=False).index
     sns.boxplot(data=df, x="property", y="credit_amount", order=order_prop, hue="class", palette="deep")
     plt.title("связь типа имущества и суммы кредита")
     plt.show()
     
     #boxplot 
     plt.figure(figsize=(10, 6))
-    order_prop_dur = df.groupby("property")["duration"].mean().sort_values(ascending=False).index
     sns.boxplot(data=df, x="property", y="duration", order=order_prop_dur, hue="class", palette="deep")
     plt.title("связь типа имущества и длительности кредита")
     plt.show()
 
     #boxplot
     plt.figure(figsize=(10, 6))
-    order_job_dur = df.groupby("job")["duration"].mean().sort_values(ascending=False).index
     sns.boxplot(data=df, x="job", y="duration", order=order_job_dur, hue="class", palette="deep")
     plt.title("связь работы и длительности кредита")
     plt.show()
-    
-    print("\n\n\n______5)Работа с базой данных______")
-    
+    return []
+
+
+#описания графиков этапа plots для неинтерактивного режима: средние и интервалы берутся
+#из таблиц группировок, статистики диаграмм размаха считаются здесь, а не в seaborn
+def plot_jobs(df, groups, order_purpose, order_prop, order_prop_dur, order_job_dur):
+    import render
+
+    classes = list(groups["class"].index)
+    rates = list(groups["plot_rate_amount"].index.get_level_values("installment_rate").unique())
+    return [
+        render.means_job(
+            "purpose_credit_amount", "barplot", (10, 6), groups["plot_purpose_amount"], order_purpose, classes,
+            title="средняя сумма кредита по целям кредита",
+            xlabel="mean credit_amount", ylabel="purpose", hue="class"
+        ),
+        render.boxplot_job(
+            "class_credit_amount", (8, 6), df, "class", "credit_amount", "class",
+            title="распределение сумм кредита для хороших (1) и плохих (2) типов заемщиков"
+        ),
+        render.means_job(
+            "installment_rate_credit_amount", "pointplot", (10, 6), groups["plot_rate_amount"], rates, classes,
+            title="зависимость суммы кредита от процента рассрочки",
+            xlabel="installment_rate", ylabel="credit_amount", hue="class"
+        ),
+        render.boxplot_job(
+            "property_credit_amount", (10, 6), df, "property", "credit_amount", "class", order_prop,
+            title="связь типа имущества и суммы кредита"
+        ),
+        render.boxplot_job(
+            "property_duration", (10, 6), df, "property", "duration", "class", order_prop_dur,
+            title="связь типа имущества и длительности кредита"
+        ),
+        render.boxplot_job(
+            "job_duration", (10, 6), df, "job", "duration", "class", order_job_dur,
+            title="связь работы и длительности кредита"
+        ),
+    ]
+
+
+@pipeline.stage("sql", requires=["load"], section=SECTION_DATABASE)
+def sql(df):
     #подключение к базе данных и загрузка данных
     conn = sqlite3.connect("german_data.db")
     cursor = conn.cursor()
@@ -197,9 +278,58 @@ def main():
     #отсоединение базы данных
     conn.close()
     print("база данных отключена")
+
+
+#выбор этапов в командной строке: python main.py --stages groupby,sql
+#выполняются только выбранные этапы и их зависимости, по умолчанию - все
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Анализ набора данных "German Credit Data"')
+    parser.add_argument(
+        "--stages",
+        help=f"этапы через запятую (доступны: {', '.join(pipeline.stages)}), по умолчанию - все"
+    )
+    parser.add_argument(
+        "--output-dir",
+        help="неинтерактивный режим: сохранять графики в этот каталог вместо показа в окнах"
+    )
+    parser.add_argument("--formats", default="png", help="форматы файлов графиков через запятую (png, svg)")
+    parser.add_argument("--workers", type=int, help="число процессов для рисования (по умолчанию - по числу ядер)")
+    args = parser.parse_args(argv)
+    args.formats = [fmt.strip().lower() for fmt in args.formats.split(",") if fmt.strip()]
+    if args.output_dir:
+        #форматы проверяются до запуска этапов, а не в процессе-рисовальщике
+        import render
+        unknown = [fmt for fmt in args.formats if fmt not in render.FORMATS]
+        if unknown or not args.formats:
+            parser.error(f"--formats: неизвестные форматы {', '.join(unknown) or '(пусто)'}; доступны: {', '.join(render.FORMATS)}")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers должно быть положительным числом")
+    if args.stages is not None:
+        args.stages = [name.strip() for name in args.stages.split(",") if name.strip()]
+        try:
+            pipeline.resolve(args.stages)
+        except ValueError as e:
+            parser.error(str(e))
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("Лабораторная работа 3. Обработка данных на языке Python")
+    print('Анализ набора данных "German Credit Data"\n\n\n')
+    
+    results = pipeline.run(args.stages, options=args)
+
+    #в неинтерактивном режиме все графики рисуются одним пулом процессов
+    jobs = results.get("heatmap", []) + results.get("plots", [])
+    if args.output_dir and jobs:
+        import render
+        paths = render.render_figures(jobs, args.output_dir, args.formats, args.workers)
+        print("графики сохранены: " + ", ".join(paths))
     
     print("====конец выполнения лабораторной работы====")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,73 @@
+#реестр этапов анализа с зависимостями
+#этап - функция, которая получает результаты этапов-зависимостей (в порядке requires) и возвращает свой результат,
+#вывод результата в отчет регистрируется отдельно (report) и выполняется только для выбранных этапов
+#зависимости должны быть зарегистрированы раньше этапа, поэтому порядок регистрации - допустимый порядок выполнения
+#inputs - имена внешних значений (например, настроек запуска), которые передаются в run и доступны как зависимости
+class Pipeline:
+
+    def __init__(self, inputs=()):
+        self.stages = {}
+        self.reports = {}
+        self.inputs = tuple(inputs)
+
+    #регистрация этапа декоратором: @pipeline.stage("encode", requires=["load"], section="...")
+    #section - заголовок раздела отчета, печатается перед первым выполненным этапом раздела
+    def stage(self, name, requires=(), section=None):
+        for dependency in requires:
+            if dependency not in self.stages and dependency not in self.inputs:
+                raise ValueError(f"этап {name}: зависимость {dependency} не зарегистрирована раньше него")
+
+        def register(func):
+            self.stages[name] = (func, tuple(requires), section)
+            return func
+
+        return register
+
+    #регистрация вывода результата этапа декоратором: @pipeline.report("groupby")
+    #функция получает результат этапа и печатает его, только если этап выбран, а не нужен как зависимость
+    def report(self, name):
+        if name not in self.stages:
+            raise ValueError(f"вывод для незарегистрированного этапа {name}")
+
+        def register(func):
+            self.reports[name] = func
+            return func
+
+        return register
+
+    #выбранные этапы вместе со всеми зависимостями в порядке регистрации
+    def resolve(self, names):
+        unknown = [name for name in names if name not in self.stages]
+        if unknown:
+            raise ValueError(f"неизвестные этапы: {', '.join(unknown)}; доступны: {', '.join(self.stages)}")
+
+        needed = set()
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if name not in needed:
+                needed.add(name)
+                pending.extend(dependency for dependency in self.stages[name][1] if dependency in self.stages)
+        return [name for name in self.stages if name in needed]
+
+    #выполнение выбранных этапов (по умолчанию - всех), каждый этап вычисляется один раз,
+    #и его результат переиспользуется всеми зависящими от него этапами;
+    #заголовки разделов и вывод результатов печатаются только для выбранных этапов
+    def run(self, names=None, **inputs):
+        missing = [name for name in self.inputs if name not in inputs]
+        if missing:
+            raise ValueError(f"не переданы входные значения: {', '.join(missing)}")
+        selected = list(self.stages) if names is None else names
+        order = self.resolve(selected)
+        results = dict(inputs)
+        printed_sections = set()
+        for name in order:
+            func, requires, section = self.stages[name]
+            report = name in selected
+            if report and section is not None and section not in printed_sections:
+                printed_sections.add(section)
+                print(section)
+            results[name] = func(*(results[dependency] for dependency in requires))
+            if report and name in self.reports:
+                self.reports[name](results[name])
+        return results
@@ -0,0 +1,180 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+
+#неинтерактивный режим: рисование в файлы без окон, plt.show() не блокирует пакетный запуск
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import seaborn as sns
+from matplotlib import cbook
+
+#множитель для 95% доверительного интервала среднего по нормальному приближению
+#(seaborn строит его бутстрепом по исходным строкам, здесь он считается по агрегатам)
+CI_FACTOR = 1.96
+
+PALETTE = "deep"
+
+#форматы файлов графиков
+FORMATS = ("png", "svg")
+
+
+#описание одного графика для процесса-рисовальщика: имя файла, вид графика и готовые агрегаты
+def figure_job(name, kind, figsize, **data):
+    return {"name": name, "kind": kind, "figsize": figsize, "data": data}
+
+
+#среднее и полуширина доверительного интервала по таблице агрегатов (mean, std, count)
+def _mean_ci(stats, key):
+    if key not in stats.index:
+        return np.nan, np.nan
+    row = stats.loc[key]
+    return row["mean"], CI_FACTOR * row["std"] / np.sqrt(row["count"])
+
+
+#подготовка данных для тепловой карты: корреляционная матрица закодированных признаков
+def heatmap_job(df_encoded, title):
+    return figure_job("heatmap", "heatmap", (14, 12), matrix=df_encoded.corr(), title=title)
+
+
+#подготовка данных для столбчатой диаграммы или графика средних (barplot/pointplot):
+#stats - таблица агрегатов mean, std, count с индексом (категория, hue)
+def means_job(name, kind, figsize, stats, order, hue_order, **labels):
+    means = {}
+    for category in order:
+        for level in hue_order:
+            means[(category, level)] = _mean_ci(stats, (category, level))
+    return figure_job(
+        name, kind, figsize, means=means, order=list(order), hue_order=list(hue_order), **labels
+    )
+
+
+#подготовка данных для диаграмм размаха: квартили, усы (1.5 IQR, как в seaborn) и выбросы
+#по каждой паре (категория, hue), значения группируются один раз
+def boxplot_job(name, figsize, df, x, y, hue, order=None, **labels):
+    order = list(order) if order is not None else sorted(df[x].unique())
+    hue_order = sorted(df[hue].unique())
+    stats = {}
+    for (category, level), values in df.groupby([x, hue], observed=True)[y]:
+        stats[(category, level)] = cbook.boxplot_stats(values.to_numpy(), whis=1.5)[0]
+    return figure_job(
+        name, "boxplot", figsize,
+        stats=stats, order=order, hue_order=hue_order, dodge=(x != hue), x=x, y=y, hue=hue, **labels
+    )
+
+
+def _draw_heatmap(ax, matrix, title):
+    sns.heatmap(matrix, annot=True, fmt=".2f", cmap="coolwarm", ax=ax)
+    ax.set_title(title)
+
+
+def _dodge_offsets(count, width=0.8):
+    step = width / count
+    return step, [(i - (count - 1) / 2) * step for i in range(count)]
+
+
+#горизонтальная столбчатая диаграмма средних с доверительными интервалами
+def _draw_barplot(ax, means, order, hue_order, title, xlabel, ylabel, hue):
+    colors = sns.color_palette(PALETTE, len(hue_order))
+    positions = np.arange(len(order))
+    height, offsets = _dodge_offsets(len(hue_order))
+    for level, color, offset in zip(hue_order, colors, offsets):
+        values = [means[(category, level)] for category in order]
+        ax.barh(
+            positions + offset, [v[0] for v in values], height=height, color=color, label=str(level),
+            xerr=[v[1] for v in values], error_kw={"ecolor": ".26", "elinewidth": 1.5}
+        )
+    ax.set_yticks(positions, [str(category) for category in order])
+    ax.set_ylim(len(order) - 0.5, -0.5)
+    ax.legend(title=hue)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+
+
+#график средних по категориям с доверительными интервалами и засечками ширины capsize
+def _draw_pointplot(ax, means, order, hue_order, title, xlabel, ylabel, hue, capsize=0.2):
+    colors = sns.color_palette(PALETTE, len(hue_order))
+    positions = np.arange(len(order))
+    for level, color in zip(hue_order, colors):
+        values = np.array([means[(category, level)] for category in order])
+        ax.plot(positions, values[:, 0], marker="o", color=color, label=str(level))
+        low, high = values[:, 0] - values[:, 1], values[:, 0] + values[:, 1]
+        ax.vlines(positions, low, high, color=color)
+        for bound in (low, high):
+            ax.hlines(bound, positions - capsize / 2, positions + capsize / 2, color=color)
+    ax.set_xticks(positions, [str(category) for category in order])
+    ax.legend(title=hue)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.grid(True)
+
+
+#диаграмма размаха по готовым статистикам (при hue, отличном от x, ящики раздвигаются)
+def _draw_boxplot(ax, stats, order, hue_order, dodge, x, y, hue, title, xlabel=None, ylabel=None):
+    colors = sns.color_palette(PALETTE, len(hue_order))
+    if dodge:
+        width, offsets = _dodge_offsets(len(hue_order))
+    else:
+        width, offsets = 0.8, [0.0] * len(hue_order)
+    for level, color, offset in zip(hue_order, colors, offsets):
+        boxes = [(i, stats[(category, level)]) for i, category in enumerate(order) if (category, level) in stats]
+        if not boxes:
+            continue
+        ax.bxp(
+            [box for _, box in boxes], positions=[i + offset for i, _ in boxes], widths=width * 0.98,
+            patch_artist=True, boxprops={"facecolor": color, "edgecolor": ".26"},
+            medianprops={"color": ".26"}, whiskerprops={"color": ".26"}, capprops={"color": ".26"},
+            flierprops={"marker": "d", "markerfacecolor": ".26", "markeredgecolor": ".26", "markersize": 4},
+            manage_ticks=False
+        )
+        if dodge:
+            ax.bar(0, 0, color=color, label=str(level))
+    ax.set_xticks(range(len(order)), [str(category) for category in order])
+    ax.set_xlim(-0.5, len(order) - 0.5)
+    if dodge:
+        ax.legend(title=hue)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel or x)
+    ax.set_ylabel(ylabel or y)
+
+
+RENDERERS = {
+    "heatmap": _draw_heatmap,
+    "barplot": _draw_barplot,
+    "pointplot": _draw_pointplot,
+    "boxplot": _draw_boxplot,
+}
+
+
+#рисование одного графика в файлы (выполняется в отдельном процессе)
+def render_figure(job, output_dir, formats):
+    fig, ax = plt.subplots(figsize=job["figsize"])
+    try:
+        RENDERERS[job["kind"]](ax, **job["data"])
+        paths = []
+        for fmt in formats:
+            path = os.path.join(output_dir, f"{job['name']}.{fmt}")
+            fig.savefig(path, format=fmt, bbox_inches="tight")
+            paths.append(path)
+        return paths
+    finally:
+        plt.close(fig)
+
+
+#параллельное рисование графиков пулом процессов, по одному графику на задачу
+#workers=None - по числу ядер; при одном процессе графики рисуются в текущем
+def render_figures(jobs, output_dir, formats=("png",), workers=None):
+    unknown = [fmt for fmt in formats if fmt not in FORMATS]
+    if unknown:
+        raise ValueError(f"неизвестные форматы графиков: {', '.join(unknown)}; доступны: {', '.join(FORMATS)}")
+    os.makedirs(output_dir, exist_ok=True)
+    workers = min(workers or os.cpu_count() or 1, len(jobs)) if jobs else 1
+    if workers <= 1:
+        return [path for job in jobs for path in render_figure(job, output_dir, formats)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(render_figure, job, output_dir, formats) for job in jobs]
+        return [path for future in futures for path in future.result()]
@@ -0,0 +1,110 @@
+import os
+from fractions import Fraction
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import aggregation
+from aggregation import aggregate
+from loader import DATA_PATH, load_german_data
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "..", DATA_PATH)
+
+
+#ожидаемый результат: тот же запрос через groupby
+def expected(df, spec):
+    keys, columns, aggs = spec
+    keys = [keys] if isinstance(keys, str) else list(keys)
+    return df.groupby(keys, observed=True)[columns].agg(aggs)
+
+
+def assert_same(result, expected_result):
+    if isinstance(expected_result, pd.Series):
+        pd.testing.assert_series_equal(result, expected_result, check_exact=False, rtol=1e-9)
+    else:
+        pd.testing.assert_frame_equal(result, expected_result, check_exact=False, rtol=1e-9)
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    size = 500
+    city = pd.Categorical(
+        rng.choice(["a", "b", "c"], size), categories=["a", "b", "c", "unused"]
+    )
+    grade = pd.Series(rng.choice(["x", "y", None], size, p=[0.45, 0.45, 0.1]), dtype="str")
+    amount = rng.normal(100, 30, size)
+    amount[rng.random(size) < 0.1] = np.nan
+    return pd.DataFrame({
+        "city": city,
+        "grade": grade,
+        "flag": rng.integers(1, 3, size).astype(np.int8),
+        "small": rng.integers(0, 100, size).astype(np.int8),
+        "wide": rng.integers(-1000, 1000, size),
+        "amount": amount,
+    })
+
+
+SPECS = {
+    "by_all": (["city", "grade", "flag"], ["small", "wide", "amount"], ["mean", "sum", "count", "min", "max", "std"]),
+    "by_city_flag": (["city", "flag"], ["small", "amount"], ["mean", "std", "count"]),
+    "by_city": ("city", ["wide", "amount"], "mean"),
+    "by_flag": ("flag", "amount", ["min", "max", "std"]),
+    "by_grade": ("grade", "small", "sum"),
+    "by_flag_grade": (["flag", "grade"], "wide", "max"),
+}
+
+
+def test_aggregate_matches_groupby(frame):
+    results = aggregate(frame, SPECS)
+    for name, spec in SPECS.items():
+        assert_same(results[name], expected(frame, spec))
+
+
+def test_aggregate_keeps_integer_dtypes(frame):
+    results = aggregate(frame, {"sums": ("city", ["small", "wide"], ["sum", "min", "max", "count"])})
+    want = expected(frame, ("city", ["small", "wide"], ["sum", "min", "max", "count"]))
+    assert list(results["sums"].dtypes) == list(want.dtypes)
+
+    #сумма int8 не помещается в int8 и становится int64, как в groupby
+    full = pd.DataFrame({"key": np.zeros(10, dtype=np.int64), "value": np.full(10, 100, dtype=np.int8)})
+    assert aggregate(full, {"sum": ("key", "value", "sum")})["sum"].dtype == full.groupby("key")["value"].sum().dtype
+
+
+#точное выборочное отклонение через рациональные числа
+def exact_std(values):
+    values = [Fraction(value) for value in values]
+    mean = sum(values) / len(values)
+    return float(sum((value - mean) ** 2 for value in values) / (len(values) - 1)) ** 0.5
+
+
+def test_aggregate_std_is_stable_for_large_values():
+    #разброс 1e-3 вокруг 1e9: сумма квадратов теряет все значащие цифры на вычитании,
+    #у groupby здесь относительная ошибка около 4e-5
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({
+        "key": rng.integers(0, 3, 1000),
+        "sub": rng.integers(0, 4, 1000),
+        "value": 1e9 + rng.normal(0, 1e-3, 1000),
+    })
+    specs = {"fine": (["key", "sub"], "value", "std"), "rolled": ("key", "value", "std")}
+    results = aggregate(df, specs)
+    for name, (keys, _, _) in specs.items():
+        for group, values in df.groupby(keys)["value"]:
+            assert results[name].loc[group] == pytest.approx(exact_std(values), rel=1e-5)
+
+
+def test_aggregate_falls_back_to_groupby_for_large_grids(frame, monkeypatch):
+    monkeypatch.setattr(aggregation, "MAX_GRID_SIZE", 8)
+    results = aggregate(frame, SPECS)
+    for name, spec in SPECS.items():
+        assert_same(results[name], expected(frame, spec))
+
+
+def test_aggregate_german_groupings():
+    main = pytest.importorskip("main")
+    df = load_german_data(DATA_FILE)
+    results = aggregate(df, main.GROUPINGS)
+    for name, spec in main.GROUPINGS.items():
+        assert_same(results[name], expected(df, spec))
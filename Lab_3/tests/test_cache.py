@@ -0,0 +1,40 @@
+import os
+
+import pandas as pd
+import pytest
+
+from cache import load_cached
+
+pytest.importorskip("pyarrow")
+
+
+def load_numbers(path):
+    return pd.read_csv(path)
+
+
+def test_same_file_names_in_different_directories(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    first = tmp_path / "one" / "data.csv"
+    second = tmp_path / "two" / "data.csv"
+    for path, value in ((first, 1), (second, 2)):
+        path.parent.mkdir()
+        path.write_text(f"value\n{value}\n", encoding="utf-8")
+
+    assert load_cached(str(first), load_numbers, cache_dir)["value"].tolist() == [1]
+    assert load_cached(str(second), load_numbers, cache_dir)["value"].tolist() == [2]
+    assert len([name for name in os.listdir(cache_dir) if name.endswith(".feather")]) == 2
+
+    #повторные загрузки читают свои копии
+    assert load_cached(str(first), load_numbers, cache_dir)["value"].tolist() == [1]
+    assert load_cached(str(second), load_numbers, cache_dir)["value"].tolist() == [2]
+
+
+def test_changed_source_replaces_its_copy(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    path = tmp_path / "data.csv"
+    path.write_text("value\n1\n", encoding="utf-8")
+    load_cached(str(path), load_numbers, cache_dir)
+
+    path.write_text("value\n30\n", encoding="utf-8")
+    assert load_cached(str(path), load_numbers, cache_dir)["value"].tolist() == [30]
+    assert len([name for name in os.listdir(cache_dir) if name.endswith(".feather")]) == 1
@@ -0,0 +1,91 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from loader import (
+    CATEGORIES,
+    COLUMNS,
+    DATA_PATH,
+    NUMERIC_COLUMNS,
+    NUMERIC_DATA_PATH,
+    NUMERIC_DTYPES,
+    label_encode,
+    load_german_data,
+    load_german_numeric,
+)
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..")
+DATA_FILE = os.path.join(DATA_DIR, DATA_PATH)
+NUMERIC_DATA_FILE = os.path.join(DATA_DIR, NUMERIC_DATA_PATH)
+
+
+#прежняя загрузка из main.py: строки без явных типов
+def load_baseline():
+    return pd.read_csv(DATA_FILE, sep=" ", names=COLUMNS)
+
+
+def test_columns_and_dtypes():
+    df = load_german_data(DATA_FILE)
+
+    assert list(df.columns) == COLUMNS
+    assert len(df) == 1000
+    for column, categories in CATEGORIES.items():
+        assert isinstance(df[column].dtype, pd.CategoricalDtype)
+        assert list(df[column].cat.categories) == categories
+    for column, dtype in NUMERIC_DTYPES.items():
+        assert df[column].dtype == dtype
+
+
+def test_values_match_baseline_loading():
+    df = load_german_data(DATA_FILE)
+    baseline = load_baseline()
+
+    for column in COLUMNS:
+        if column in CATEGORIES:
+            assert df[column].astype(str).tolist() == baseline[column].astype(str).tolist()
+        else:
+            assert df[column].astype(np.int64).tolist() == baseline[column].tolist()
+
+
+def test_label_encode_matches_label_encoder():
+    preprocessing = pytest.importorskip("sklearn.preprocessing")
+    #часть строк, чтобы в выборке встречались не все коды
+    df = load_german_data(DATA_FILE).head(50)
+    baseline = load_baseline().head(50)
+
+    encoded = label_encode(df)
+    for column in COLUMNS:
+        if column in CATEGORIES:
+            expected = preprocessing.LabelEncoder().fit_transform(baseline[column].astype(str))
+            assert encoded[column].dtype == np.int64
+            assert encoded[column].tolist() == expected.tolist()
+            assert encoded[column].min() == 0
+            assert encoded[column].max() == baseline[column].nunique() - 1
+        else:
+            assert encoded[column].equals(df[column])
+    #исходная таблица не меняется
+    assert isinstance(df["purpose"].dtype, pd.CategoricalDtype)
+
+
+def test_unknown_code_raises(tmp_path):
+    with open(DATA_FILE, encoding="utf-8") as file:
+        row = file.readline()
+    path = tmp_path / "german.data"
+    path.write_text(row.replace("A11", "A19", 1), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="checking_status"):
+        load_german_data(str(path))
+
+
+def test_numeric_file_matches_baseline_parsing():
+    df = load_german_numeric(NUMERIC_DATA_FILE)
+    baseline = pd.read_csv(NUMERIC_DATA_FILE, sep=r"\s+", header=None)
+
+    assert list(df.columns) == NUMERIC_COLUMNS
+    assert df.shape == (1000, 25)
+    assert (df.dtypes[:-1] == np.int16).all()
+    assert df["class"].dtype == np.int8
+    assert set(df["class"]) == {1, 2}
+    assert (df.to_numpy(dtype=np.int64) == baseline.to_numpy()).all()
@@ -0,0 +1,48 @@
+import pytest
+
+from pipeline import Pipeline
+
+
+@pytest.fixture
+def pipeline():
+    pipeline = Pipeline(inputs=["base"])
+
+    @pipeline.stage("numbers", requires=["base"], section="== числа ==")
+    def numbers(base):
+        return [base, base + 1]
+
+    @pipeline.report("numbers")
+    def show_numbers(values):
+        print("числа:", values)
+
+    @pipeline.stage("total", requires=["numbers"], section="== сумма ==")
+    def total(values):
+        return sum(values)
+
+    @pipeline.report("total")
+    def show_total(value):
+        print("сумма:", value)
+
+    return pipeline
+
+
+def test_dependencies_run_without_output(pipeline, capsys):
+    results = pipeline.run(["total"], base=1)
+    assert results["numbers"] == [1, 2] and results["total"] == 3
+    assert capsys.readouterr().out == "== сумма ==\nсумма: 3\n"
+
+
+def test_all_stages_print_in_order(pipeline, capsys):
+    pipeline.run(base=1)
+    assert capsys.readouterr().out == "== числа ==\nчисла: [1, 2]\n== сумма ==\nсумма: 3\n"
+
+
+def test_registration_errors(pipeline):
+    with pytest.raises(ValueError):
+        pipeline.stage("broken", requires=["missing"])
+    with pytest.raises(ValueError):
+        pipeline.report("missing")
+    with pytest.raises(ValueError):
+        pipeline.resolve(["missing"])
+    with pytest.raises(ValueError):
+        pipeline.run(["total"])
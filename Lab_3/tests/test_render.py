@@ -0,0 +1,50 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("seaborn")
+
+import render
+from aggregation import aggregate
+
+
+@pytest.fixture
+def jobs():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "kind": pd.Categorical(rng.choice(["a", "b", "c"], 300)),
+        "class": rng.integers(1, 3, 300),
+        "amount": rng.normal(1000, 200, 300),
+    })
+    stats = aggregate(df, {"stats": (["kind", "class"], "amount", ["mean", "std", "count"])})["stats"]
+    return [
+        render.heatmap_job(df[["class", "amount"]], "корреляция"),
+        render.means_job(
+            "means_bar", "barplot", (6, 4), stats, ["a", "b", "c"], [1, 2],
+            title="средние", xlabel="amount", ylabel="kind", hue="class"
+        ),
+        render.means_job(
+            "means_point", "pointplot", (6, 4), stats, ["a", "b", "c"], [1, 2],
+            title="средние", xlabel="kind", ylabel="amount", hue="class"
+        ),
+        render.boxplot_job("box", (6, 4), df, "kind", "amount", "class", title="размах"),
+    ]
+
+
+def read_files(paths):
+    return {os.path.basename(path): open(path, "rb").read() for path in paths}
+
+
+def test_parallel_rendering_matches_serial(jobs, tmp_path):
+    serial = render.render_figures(jobs, str(tmp_path / "serial"), ["png"], workers=1)
+    parallel = render.render_figures(jobs, str(tmp_path / "parallel"), ["png"], workers=2)
+    assert sorted(map(os.path.basename, serial)) == ["box.png", "heatmap.png", "means_bar.png", "means_point.png"]
+    assert read_files(serial) == read_files(parallel)
+
+
+def test_unknown_format_is_rejected_before_rendering(jobs, tmp_path):
+    with pytest.raises(ValueError, match="jpgg"):
+        render.render_figures(jobs, str(tmp_path / "out"), ["png", "jpgg"], workers=2)
+    assert not os.path.exists(tmp_path / "out")